@@ -0,0 +1,45 @@
+import argparse
+import itertools
+import sys
+from algorithms.batch import ALGORITHMS, algorithm_name, load_instances, run_batch, write_records
+
+
+def main(argv=None):
+    """
+    Point d'entrée de `python -m algorithms` : résout des instances JSON / NPZ sans interface
+    graphique et écrit un résultat JSON par ligne. Code de retour 1 si une instance a échoué.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m algorithms",
+        description="Exécute les algorithmes sans interface graphique (sortie JSON-lines).",
+    )
+    parser.add_argument("inputs", nargs="*", default=["-"],
+                        help="fichiers .json, .jsonl ou .npz (- pour l'entrée standard, par défaut)")
+    parser.add_argument("-a", "--algorithm", help="algorithme des instances qui n'en indiquent pas")
+    parser.add_argument("-o", "--output", help="fichier de sortie (sortie standard par défaut)")
+    parser.add_argument("-j", "--workers", type=int, default=1, help="nombre de processus de calcul")
+    parser.add_argument("--instrument", action="store_true",
+                        help="ajoute les durées des phases et les compteurs d'opérations de chaque instance")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="ajoute le pic mémoire de chaque instance (exécution supplémentaire sous tracemalloc)")
+    parser.add_argument("--list", action="store_true", help="affiche les algorithmes disponibles")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(ALGORITHMS))
+        return 0
+    algorithm = algorithm_name(args.algorithm) if args.algorithm else None
+
+    instances = itertools.chain.from_iterable(load_instances(path) for path in args.inputs)
+    records = run_batch(instances, algorithm=algorithm, max_workers=max(1, args.workers), instrument=args.instrument,
+                        trace_memory=args.trace_memory)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            errors = write_records(records, stream)
+    else:
+        errors = write_records(records, sys.stdout)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,427 @@
+import collections
+import contextlib
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from algorithms.bellman_ford_engine import NegativeCycleError, negative_cycle_error, bellman_ford_arrays
+from algorithms.cpm_engine import critical_path_arrays, edges_to_arrays
+from algorithms.csr import edges_to_csr
+from algorithms.dijkstra_engine import dijkstra_csr
+from algorithms.instrumentation import instrumented_run
+from algorithms.kruskal_engine import kruskal_arrays
+from algorithms.maxflow_engine import max_flow_arrays
+from algorithms.transport_engine import (
+    least_cost_method, nord_ouest_batch, sparse_transport, transport_simplex, vogel_method,
+)
+from algorithms.welsh_powell_engine import welsh_powell_bitset
+
+# Exécution sans interface : seuls les moteurs sur tableaux sont importés (ni tkinter, ni matplotlib)
+
+
+def _edge_nodes(instance):
+    """
+    Sommets d'une instance donnée par "edges" : ceux de "nodes" puis les extrémités
+    d'arcs absentes, dans l'ordre d'apparition.
+    """
+    nodes = list(instance.get("nodes", []))
+    known = set(nodes)
+    for edge in instance["edges"]:
+        for node in edge[:2]:
+            if node not in known:
+                known.add(node)
+                nodes.append(node)
+    return nodes
+
+
+def _graph_arrays(instance, directed, weighted=True):
+    """
+    Sommets et tableaux d'arcs d'une instance : soit "edges" ([u, v] ou [u, v, poids]) avec
+    "nodes" facultatif, soit "sources" / "targets" / "weights" (indices) avec "num_nodes".
+    Un graphe non orienté est doublé dans les deux sens quand `directed` vaut "mirror".
+    """
+    if "edges" in instance:
+        edges = [tuple(edge) for edge in instance["edges"]]
+        nodes = _edge_nodes(instance)
+        index = {node: i for i, node in enumerate(nodes)}
+        sources = np.array([index[edge[0]] for edge in edges], dtype=np.int64)
+        targets = np.array([index[edge[1]] for edge in edges], dtype=np.int64)
+        weights = np.array([edge[2] if len(edge) > 2 else 1 for edge in edges]) if edges else np.zeros(0, np.int64)
+    else:
+        sources = np.asarray(instance["sources"], dtype=np.int64)
+        targets = np.asarray(instance["targets"], dtype=np.int64)
+        weights = np.asarray(instance.get("weights", np.ones(len(sources), dtype=np.int64)))
+        num_nodes = int(instance.get("num_nodes", max(sources.max(initial=-1), targets.max(initial=-1)) + 1))
+        nodes = list(instance.get("nodes", range(num_nodes)))
+
+    if not weighted:
+        weights = np.ones(len(sources), dtype=np.int64)
+    if directed == "mirror" and not instance.get("directed", False):
+        sources, targets = np.concatenate([sources, targets]), np.concatenate([targets, sources])
+        weights = np.concatenate([weights, weights])
+    return nodes, sources, targets, weights
+
+
+def _node_index(nodes, node):
+    """
+    Indice d'un sommet donné par son étiquette.
+    """
+    try:
+        return nodes.index(node)
+    except ValueError:
+        raise ValueError(f"Le sommet {node} n'est pas dans le graphe.") from None
+
+
+def _labels(nodes, indices):
+    """
+    Étiquettes des sommets d'indices donnés (None pour -1).
+    """
+    return [nodes[i] if i >= 0 else None for i in np.asarray(indices).tolist()]
+
+
+def _distances(values):
+    """
+    Distances sérialisables : inf devient None.
+    """
+    values = np.asarray(values)
+    return [v if np.isfinite(v) else None for v in values.tolist()] if values.dtype.kind == "f" else values.tolist()
+
+
+def _solve_dijkstra(instance):
+    nodes, sources, targets, weights = _graph_arrays(instance, directed="mirror")
+    csr = edges_to_csr(len(nodes), sources, targets, weights, nodes=nodes)
+    dist, pred = dijkstra_csr(csr, _node_index(nodes, instance["source"]))
+    return {"nodes": nodes, "distances": _distances(dist), "predecessors": _labels(nodes, pred)}
+
+
+def _solve_bellman_ford(instance):
+    nodes, sources, targets, weights = _graph_arrays(instance, directed=True)
+    try:
+        dist, pred = bellman_ford_arrays(len(nodes), sources, targets, weights, _node_index(nodes, instance["source"]))
+    except NegativeCycleError as e:
+        raise negative_cycle_error(_labels(nodes, e.cycle)) from None
+    return {"nodes": nodes, "distances": _distances(dist), "predecessors": _labels(nodes, pred)}
+
+
+def _solve_kruskal(instance):
+    nodes, sources, targets, weights = _graph_arrays(instance, directed=False)
+    accepted, total_weight = kruskal_arrays(len(nodes), sources, targets, weights)
+    return {
+        "edges": [
+            [nodes[u], nodes[v], w]
+            for u, v, w in zip(sources[accepted].tolist(), targets[accepted].tolist(), weights[accepted].tolist())
+        ],
+        "total_weight": total_weight,
+    }
+
+
+def _solve_ford_fulkerson(instance):
+    nodes, sources, targets, capacities = _graph_arrays(instance, directed=True)
+    value, flows, _ = max_flow_arrays(
+        len(nodes), sources, targets, capacities,
+        _node_index(nodes, instance["source"]), _node_index(nodes, instance["sink"]),
+        method=instance.get("method", "dinic"),
+    )
+    used = np.flatnonzero(flows)
+    return {
+        "max_flow": value,
+        "flows": [
+            [nodes[u], nodes[v], f] for u, v, f in zip(sources[used].tolist(), targets[used].tolist(), flows[used].tolist())
+        ],
+    }
+
+
+def _solve_welsh_powell(instance):
+    nodes, sources, targets, _ = _graph_arrays(instance, directed=False, weighted=False)
+    colors, order, num_colors = welsh_powell_bitset(len(nodes), sources, targets)
+    return {"nodes": nodes, "colors": colors.tolist(), "coloring_order": _labels(nodes, order), "num_colors": num_colors}
+
+
+def _solve_potentiel_metra(instance):
+    if "edges" in instance:
+        # Arcs en double : le dernier poids l'emporte, comme dans potentiel_metra
+        nodes = _edge_nodes(instance)
+        sources, targets, weights = edges_to_arrays(nodes, [tuple(edge) for edge in instance["edges"]])
+    else:
+        nodes, sources, targets, weights = _graph_arrays(instance, directed=True)
+    arrays = critical_path_arrays(len(nodes), sources, targets, weights)
+    result = {"nodes": nodes}
+    for key in ("start_times", "finish_times", "late_start", "late_finish", "free_margin", "total_margin", "levels"):
+        result[key] = arrays[key].tolist()
+    result["critical_path"] = _labels(nodes, np.flatnonzero(arrays["total_margin"] == 0))
+    result["total_duration"] = arrays["total_duration"].item()
+    return result
+
+
+def _transport_data(instance):
+    """
+    Offres, demandes et matrice des coûts d'une instance de transport (clé "costs").
+    """
+    return np.asarray(instance["supply"]), np.asarray(instance["demand"]), np.asarray(instance["costs"])
+
+
+def _solve_nord_ouest(instance):
+    supply, demand, costs = _transport_data(instance)
+    allocation, total_cost = nord_ouest_batch(supply[None], demand[None], costs)
+    return {"allocation": allocation[0].tolist(), "total_cost": total_cost[0].item()}
+
+
+def _solve_moindre_cout(instance):
+    supply, demand, costs = _transport_data(instance)
+    method = instance.get("method", "argsort")
+    if method == "argsort":
+        allocation, total_cost = least_cost_method(supply, demand, costs)
+    elif method == "vogel":
+        allocation, total_cost = vogel_method(supply, demand, costs)
+    else:
+        raise ValueError(f"Méthode inconnue : {method}")
+    return {"allocation": allocation.tolist(), "total_cost": np.asarray(total_cost).item()}
+
+
+def _solve_stepping_stone(instance):
+    if "routes" in instance:
+        # Problème creux : routes autorisées [ligne, colonne, coût]
+        routes = np.asarray(instance["routes"])
+        rows, cols = routes[:, 0].astype(np.int64), routes[:, 1].astype(np.int64)
+        flows, total_cost = sparse_transport(
+            instance["supply"], instance["demand"], rows, cols, routes[:, 2], method=instance.get("method", "simplex")
+        )
+        used = np.flatnonzero(flows)
+        return {
+            "routes": [[i, j, q] for i, j, q in zip(rows[used].tolist(), cols[used].tolist(), flows[used].tolist())],
+            "total_cost": np.asarray(total_cost).item(),
+        }
+    supply, demand, costs = _transport_data(instance)
+    allocation, total_cost = transport_simplex(supply, demand, costs)
+    return {"allocation": allocation.tolist(), "total_cost": np.asarray(total_cost).item()}
+
+
+ALGORITHMS = {
+    "welsh_powell": _solve_welsh_powell,
+    "dijkstra": _solve_dijkstra,
+    "kruskal": _solve_kruskal,
+    "bellman_ford": _solve_bellman_ford,
+    "potentiel_metra": _solve_potentiel_metra,
+    "moindre_cout": _solve_moindre_cout,
+    "nord_ouest": _solve_nord_ouest,
+    "stepping_stone": _solve_stepping_stone,
+    "ford_fulkerson": _solve_ford_fulkerson,
+}
+
+
+# Clés obligatoires de chaque algorithme : pour chaque exigence, les jeux de clés qui la satisfont
+_GRAPH_KEYS = (("edges",), ("sources", "targets"))
+_TRANSPORT_KEYS = (("supply",),), (("demand",),)
+REQUIRED_KEYS = {
+    "welsh_powell": (_GRAPH_KEYS,),
+    "dijkstra": (_GRAPH_KEYS, (("source",),)),
+    "kruskal": (_GRAPH_KEYS,),
+    "bellman_ford": (_GRAPH_KEYS, (("source",),)),
+    "potentiel_metra": (_GRAPH_KEYS,),
+    "moindre_cout": (*_TRANSPORT_KEYS, (("costs",),)),
+    "nord_ouest": (*_TRANSPORT_KEYS, (("costs",),)),
+    "stepping_stone": (*_TRANSPORT_KEYS, (("costs",), ("routes",))),
+    "ford_fulkerson": (_GRAPH_KEYS, (("source",),), (("sink",),)),
+}
+
+
+def _check_keys(instance, name):
+    """
+    Lève ValueError en nommant la clé obligatoire absente de l'instance.
+    """
+    for alternatives in REQUIRED_KEYS[name]:
+        if not any(all(key in instance for key in keys) for keys in alternatives):
+            expected = " ou ".join(" / ".join(f'"{key}"' for key in keys) for keys in alternatives)
+            raise ValueError(f"Instance {name} incomplète : clé {expected} manquante.")
+
+
+def algorithm_name(name):
+    """
+    Nom canonique d'un algorithme ("Bellman-Ford", "bellman ford" -> "bellman_ford").
+    """
+    key = str(name).strip().lower().replace("-", "_").replace(" ", "_").replace("é", "e")
+    if key not in ALGORITHMS:
+        raise ValueError(f"Algorithme inconnu : {name} (disponibles : {', '.join(ALGORITHMS)})")
+    return key
+
+
+def solve(instance, algorithm=None):
+    """
+    Résout une instance (dictionnaire) et retourne un résultat sérialisable en JSON.
+    L'algorithme est pris dans instance["algorithm"], à défaut dans `algorithm`.
+    """
+    name = instance.get("algorithm", algorithm)
+    if name is None:
+        raise ValueError("Aucun algorithme indiqué pour l'instance.")
+    name = algorithm_name(name)
+    _check_keys(instance, name)
+    return ALGORITHMS[name](instance)
+
+
+class InvalidInstance:
+    """
+    Instance illisible (ligne JSON invalide...) : elle produit un enregistrement d'erreur au lieu
+    d'interrompre tout le lot.
+    """
+
+    def __init__(self, message):
+        self.message = message
+
+
+def _run_one(item):
+    """
+    Résout une instance numérotée et retourne l'enregistrement JSON correspondant
+    (résultat et durée, ou message d'erreur ; compteurs si `instrument`, pic mémoire si `trace_memory`,
+    mesuré sur une exécution supplémentaire pour ne pas fausser la durée).
+    """
+    position, instance, algorithm, instrument, trace_memory = item
+    if isinstance(instance, InvalidInstance):
+        return {"id": position, "error": instance.message}
+    record = {"id": instance.get("id", position), "algorithm": instance.get("algorithm", algorithm)}
+    started = time.perf_counter()
+    with instrumented_run(record["algorithm"]) if instrument else contextlib.nullcontext() as run:
+        try:
+            record["result"] = solve(instance, algorithm)
+        except Exception as e:
+            record["error"] = str(e)
+            if isinstance(e, NegativeCycleError):
+                record["cycle"] = e.cycle
+    record["elapsed"] = time.perf_counter() - started
+    if run is not None:
+        record["instrumentation"] = run.as_dict()
+    if trace_memory and "error" not in record:
+        with instrumented_run(record["algorithm"], trace_memory=True) as traced:
+            solve(instance, algorithm)
+        if traced is not None:
+            record["peak_memory"] = traced.peak_memory
+    return record
+
+
+def _run_chunk(items):
+    """
+    Résout un lot d'instances dans un processus de calcul.
+    """
+    return [_run_one(item) for item in items]
+
+
+def run_batch(instances, algorithm=None, max_workers=1, chunk_size=16, instrument=False, trace_memory=False):
+    """
+    Résout une suite d'instances et génère un enregistrement par instance, dans l'ordre d'entrée.
+    Avec max_workers > 1, les instances sont réparties par lots de `chunk_size` sur un ProcessPoolExecutor ;
+    au plus 2 lots par processus sont en cours à la fois, pour que la lecture de l'entrée suive les résultats
+    et que la mémoire ne croisse pas avec la taille de l'entrée.
+    instrument=True ajoute à chaque enregistrement les durées des phases et les compteurs d'opérations,
+    trace_memory=True le pic mémoire (exécution supplémentaire sous tracemalloc).
+    """
+    items = ((position, instance, algorithm, instrument, trace_memory) for position, instance in enumerate(instances))
+    if max_workers == 1:
+        yield from map(_run_one, items)
+        return
+
+    chunks = iter(lambda: list(itertools.islice(items, chunk_size)), [])
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        pending = collections.deque(
+            executor.submit(_run_chunk, chunk) for chunk in itertools.islice(chunks, 2 * max_workers)
+        )
+        while pending:
+            records = pending.popleft().result()
+            for chunk in itertools.islice(chunks, 1):
+                pending.append(executor.submit(_run_chunk, chunk))
+            yield from records
+
+
+def _npz_instance(path):
+    """
+    Instance stockée dans un fichier .npz : tableaux d'arcs ou de transport ; les valeurs
+    scalaires (num_nodes, source, algorithm...) sont des tableaux de dimension 0.
+    """
+    with np.load(path, allow_pickle=False) as data:
+        return {key: data[key].item() if data[key].ndim == 0 else data[key] for key in data.files}
+
+
+def _parse_lines(lines, first):
+    """
+    Instances d'un flux JSON-lines, ligne par ligne ; une ligne invalide donne une InvalidInstance.
+    """
+    for number, line in enumerate(lines, start=first):
+        if not line.strip():
+            continue
+        try:
+            instance = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield InvalidInstance(f"Ligne {number} : JSON invalide ({e.msg}).")
+            continue
+        if isinstance(instance, dict):
+            yield instance
+        else:
+            yield InvalidInstance(f"Ligne {number} : une instance doit être un objet JSON.")
+
+
+def load_instances(path):
+    """
+    Lit des instances depuis un fichier (ou l'entrée standard pour "-") : fichier .npz (une instance),
+    objet JSON (une instance), liste JSON, ou JSON-lines (une instance par ligne).
+    Le JSON-lines est lu ligne par ligne, au rythme de la résolution ; un document JSON sur plusieurs
+    lignes est lu en entier. Une entrée illisible donne une InvalidInstance, sans interrompre la lecture.
+    """
+    if str(path).endswith(".npz"):
+        instance = _npz_instance(path)
+        instance.setdefault("id", os.path.basename(str(path)))
+        yield instance
+        return
+
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        # Première ligne non vide : un document JSON complet (objet ou liste) ou le début d'un document
+        first = 1
+        line = stream.readline()
+        while line and not line.strip():
+            line, first = stream.readline(), first + 1
+        try:
+            content = json.loads(line) if line else None
+        except json.JSONDecodeError:
+            # Document JSON sur plusieurs lignes
+            text = line + stream.read()
+            try:
+                content = json.loads(text)
+            except json.JSONDecodeError:
+                # Première ligne de JSON-lines invalide : les suivantes sont lues quand même
+                yield from _parse_lines(text.splitlines(), first)
+                return
+            yield from content if isinstance(content, list) else [content]
+            return
+        if isinstance(content, list):
+            yield from content
+        elif content is not None:
+            yield content
+        yield from _parse_lines(stream, first + 1)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def write_records(records, stream):
+    """
+    Écrit les enregistrements au format JSON-lines, ligne par ligne (flux vidé à chaque résultat).
+    Retourne le nombre d'enregistrements en erreur.
+    """
+    errors = 0
+    for record in records:
+        errors += "error" in record
+        stream.write(json.dumps(record, ensure_ascii=False, default=_json_default) + "\n")
+        stream.flush()
+    return errors
+
+
+def _json_default(value):
+    """
+    Conversion JSON des scalaires et tableaux NumPy restants.
+    """
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Valeur non sérialisable : {value!r}")
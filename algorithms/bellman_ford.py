@@ -2,19 +2,64 @@ import networkx as nx
 import random
 from tkinter import simpledialog, messagebox
 import matplotlib.pyplot as plt
-import pandas as pd
+import numpy as np
+from algorithms.bellman_ford_engine import NegativeCycleError, negative_cycle_error, bellman_ford_arrays
+from algorithms.csr import graph_to_csr
+from algorithms.dijkstra_engine import predecessors_to_paths
+from algorithms.generators import random_graph
+from algorithms.instrumentation import annotate_figure, finish_run, instrumented_run, paused, phase
+from algorithms.johnson import johnson_arrays
 
 
-def bellman_ford_algorithm(graph, source):
+def bellman_ford_algorithm(graph, source, method="arrays", cache=None, fingerprint=None):
     """
     Implémente l'algorithme de Bellman-Ford pour trouver les plus courts chemins dans un graphe.
     Gère les poids négatifs et détecte les cycles.
+    method="arrays" utilise le moteur NumPy vectorisé, method="networkx" la version de référence.
+    En cas de cycle négatif, lève NegativeCycleError (un ValueError) dont l'attribut `cycle`
+    contient les sommets du cycle (moteur NumPy uniquement).
+    Si un ShortestPathCache est fourni, les arbres déjà calculés sont réutilisés ; passer `fingerprint`
+    (graph_fingerprint(graph), à recalculer si le graphe change) évite de rehacher le graphe à chaque requête.
     """
+    if cache is not None:
+        return cache.lookup("bellman_ford", graph, source, lambda: bellman_ford_algorithm(graph, source, method),
+                            fingerprint=fingerprint)
+
+    if method == "networkx":
+        try:
+            distances, paths = nx.single_source_bellman_ford(graph, source=source)
+            return distances, paths
+        except nx.NetworkXUnbounded:
+            raise ValueError("Le graphe contient un cycle de poids négatif accessible depuis la source.")
+    if method != "arrays":
+        raise ValueError(f"Méthode inconnue : {method}")
+    if source not in graph:
+        raise nx.NodeNotFound(f"Le sommet source {source} n'est pas dans le graphe.")
+
+    csr = graph_to_csr(graph)
+    sources = np.repeat(np.arange(len(csr.nodes)), np.diff(csr.offsets))
     try:
-        distances, paths = nx.single_source_bellman_ford(graph, source=source)
-        return distances, paths
-    except nx.NetworkXUnbounded:
-        raise ValueError("Le graphe contient un cycle de poids négatif accessible depuis la source.")
+        dist, pred = bellman_ford_arrays(len(csr.nodes), sources, csr.targets, csr.weights, csr.index[source])
+    except NegativeCycleError as e:
+        raise negative_cycle_error([csr.nodes[i] for i in e.cycle]) from None
+    distances, paths = predecessors_to_paths(csr, dist, pred)
+    return distances, paths
+
+
+def johnson_all_pairs(graph, path=None, max_workers=None):
+    """
+    Distances entre tous les couples de sommets (Johnson : Bellman-Ford puis Dijkstra en parallèle).
+    Retourne (liste des sommets, matrice des distances projetée en mémoire dans le fichier `path`).
+    Sans `path`, la matrice est écrite dans un fichier temporaire (matrix.filename, n² × 8 octets)
+    que l'appelant doit supprimer une fois la matrice libérée.
+    """
+    csr = graph_to_csr(graph)
+    sources = np.repeat(np.arange(len(csr.nodes)), np.diff(csr.offsets))
+    try:
+        matrix = johnson_arrays(len(csr.nodes), sources, csr.targets, csr.weights, path=path, max_workers=max_workers)
+    except NegativeCycleError as e:
+        raise negative_cycle_error([csr.nodes[i] for i in e.cycle]) from None
+    return csr.nodes, matrix
 
 
 def execute_bellman_ford():
@@ -30,28 +75,39 @@ def execute_bellman_ford():
         messagebox.showerror("Erreur", "Entrées invalides. Veuillez entrer des entiers valides.")
         return
 
-    # Génération aléatoire d'un graphe orienté avec des poids
-    graph = nx.DiGraph()
-    graph.add_nodes_from(range(num_nodes))
-    edges = set()
-    while len(edges) < num_edges:
-        u, v = random.sample(range(num_nodes), 2)
-        weight = random.randint(-10, 20)  # Poids des arêtes pouvant être négatifs
-        if u != v and (u, v) not in edges:
-            edges.add((u, v))
-            graph.add_edge(u, v, weight=weight)
+    with instrumented_run("Bellman-Ford"):
+        # Génération aléatoire d'un graphe orienté avec des poids pouvant être négatifs
+        try:
+            with phase("build"):
+                graph = random_graph(num_nodes, num_edges, directed=True, weight_range=(-10, 20))
+        except ValueError as e:
+            messagebox.showerror("Erreur", str(e))
+            return
 
-    # Choisir un sommet source aléatoire
-    source = random.choice(list(graph.nodes))
+        # Choisir un sommet source aléatoire
+        source = random.choice(list(graph.nodes))
+
+        try:
+            # Exécution de l'algorithme de Bellman-Ford
+            with phase("solve"):
+                distances, paths = bellman_ford_algorithm(graph, source)
+
+            # Affichage des résultats
+            afficher_resultats(graph, distances, paths, source)
+        except ValueError as e:
+            finish_run()
+            messagebox.showerror("Erreur", str(e))
 
-    try:
-        # Exécution de l'algorithme de Bellman-Ford
-        distances, paths = bellman_ford_algorithm(graph, source)
 
-        # Affichage des résultats
-        afficher_resultats(graph, distances, paths, source)
-    except ValueError as e:
-        messagebox.showerror("Erreur", str(e))
+def format_table(rows, columns):
+    """
+    Met en forme une liste de dictionnaires en tableau texte aligné (une ligne par dictionnaire).
+    """
+    cells = [[str(row[column]) for column in columns] for row in rows]
+    widths = [max([len(column)] + [len(line[i]) for line in cells]) for i, column in enumerate(columns)]
+    lines = ["  ".join(column.rjust(width) for column, width in zip(columns, widths))]
+    lines += ["  ".join(cell.rjust(width) for cell, width in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
 
 
 def afficher_resultats(graph, distances, paths, source):
@@ -68,50 +124,53 @@ def afficher_resultats(graph, distances, paths, source):
     result_str = f"Distances minimales depuis le sommet source {source} :\n\n"
     result_str += "\n".join([f"Vers {row['Destination']} : Distance = {row['Distance']}, Chemin = {row['Chemin']}" 
                              for row in result_table])
-    messagebox.showinfo("Résultats Bellman-Ford", result_str)
+    with paused():
+        messagebox.showinfo("Résultats Bellman-Ford", result_str)
 
     # Présentation sous forme de tableau dans la console
-    df = pd.DataFrame(result_table)
     print("\n### Résultats Bellman-Ford ###")
-    print(df)
+    print(format_table(result_table, ["Destination", "Distance", "Chemin"]))
 
     # Visualisation du graphe
-    pos = nx.spring_layout(graph, seed=42)  # Layout stable
+    with phase("layout"):
+        pos = nx.spring_layout(graph, seed=42)  # Layout stable
     edge_labels = nx.get_edge_attributes(graph, 'weight')
     node_colors = ["red" if node == source else "blue" for node in graph.nodes]
     shortest_path_edges = [(paths[target][i], paths[target][i + 1])
                            for target in paths for i in range(len(paths[target]) - 1)]
 
-    plt.figure(figsize=(12, 8))
-
-    # Dessiner le graphe complet
-    nx.draw(
-        graph,
-        pos,
-        with_labels=True,
-        node_color=node_colors,
-        node_size=700,
-        font_weight="bold",
-        font_color="white",
-        edge_color="black",
-        alpha=0.5
-    )
-
-    # Mettre en évidence les chemins optimaux
-    nx.draw_networkx_edges(
-        graph,
-        pos,
-        edgelist=shortest_path_edges,
-        edge_color="red",
-        width=2
-    )
-
-    # Ajouter les poids des arêtes
-    nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=8)
-
-    # Ajouter le titre et afficher
-    plt.title(f"Graphe avec Bellman-Ford (Source : {source})")
-    plt.tight_layout()
+    with phase("render"):
+        plt.figure(figsize=(12, 8))
+
+        # Dessiner le graphe complet
+        nx.draw(
+            graph,
+            pos,
+            with_labels=True,
+            node_color=node_colors,
+            node_size=700,
+            font_weight="bold",
+            font_color="white",
+            edge_color="black",
+            alpha=0.5
+        )
+
+        # Mettre en évidence les chemins optimaux
+        nx.draw_networkx_edges(
+            graph,
+            pos,
+            edgelist=shortest_path_edges,
+            edge_color="red",
+            width=2
+        )
+
+        # Ajouter les poids des arêtes
+        nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=8)
+
+        # Ajouter le titre et afficher
+        plt.title(f"Graphe avec Bellman-Ford (Source : {source})")
+        plt.tight_layout()
+    annotate_figure(plt.gcf())
     plt.show()
 
 
@@ -0,0 +1,101 @@
+import numpy as np
+from algorithms.instrumentation import increment
+
+
+class NegativeCycleError(ValueError):
+    """
+    Cycle de poids négatif accessible depuis la source ; `cycle` contient ses sommets dans l'ordre des arcs.
+    """
+
+    def __init__(self, message, cycle):
+        super().__init__(message)
+        self.cycle = cycle
+
+
+def _relax_round(dist, pred, sources, targets, weights, changed):
+    """
+    Relâche en une passe vectorisée tous les arcs issus des sommets modifiés au tour précédent.
+    Retourne le masque des sommets dont la distance a diminué.
+    """
+    active = np.flatnonzero(changed[sources])
+    increment("edge_relaxations", len(active))
+    tails, heads = sources[active], targets[active]
+    candidates = dist[tails] + weights[active]
+    improving = candidates < dist[heads]
+    if not improving.any():
+        return np.zeros_like(changed)
+
+    tails, heads, candidates = tails[improving], heads[improving], candidates[improving]
+    previous = dist.copy()
+    np.minimum.at(dist, heads, candidates)
+
+    # Prédécesseur : un arc qui réalise la nouvelle distance
+    winners = candidates == dist[heads]
+    pred[heads[winners]] = tails[winners]
+    return dist < previous
+
+
+def _find_predecessor_cycle(pred):
+    """
+    Cherche un cycle dans le graphe des prédécesseurs (un seul prédécesseur par sommet),
+    par doublement de pointeurs vectorisé : après au moins n sauts, un sommet qui n'a pas atteint
+    la racine est sur un cycle. Tout cycle de ce graphe est de poids négatif.
+    """
+    jump = pred.copy()
+    steps = 1
+    while steps < len(pred):
+        jump = np.where(jump >= 0, jump[jump], -1)
+        steps *= 2
+
+    looping = np.flatnonzero(jump >= 0)
+    if not len(looping):
+        return None
+
+    start = int(jump[looping[0]])
+    cycle = [start]
+    node = int(pred[start])
+    while node != start:
+        cycle.append(node)
+        node = int(pred[node])
+    return cycle[::-1]  # Les prédécesseurs sont parcourus à rebours
+
+
+def negative_cycle_error(cycle):
+    """
+    Exception décrivant le cycle négatif trouvé.
+    """
+    return NegativeCycleError(
+        "Le graphe contient un cycle de poids négatif accessible depuis la source : "
+        + " -> ".join(map(str, cycle + cycle[:1])),
+        cycle,
+    )
+
+
+def bellman_ford_arrays(num_nodes, sources, targets, weights, source):
+    """
+    Bellman-Ford vectorisé sur tableaux d'arcs : chaque tour relâche d'un coup les arcs des sommets
+    modifiés au tour précédent, et le calcul s'arrête dès qu'un tour ne change rien.
+    Retourne (distances, prédécesseurs). Lève NegativeCycleError avec le cycle trouvé sinon.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+
+    dist = np.full(num_nodes, np.inf)
+    pred = np.full(num_nodes, -1, dtype=np.int64)
+    dist[source] = 0
+    changed = np.zeros(num_nodes, dtype=bool)
+    changed[source] = True
+
+    # Le graphe des prédécesseurs est examiné aux tours 1, 2, 4, 8... pour signaler
+    # un cycle négatif sans attendre les n - 1 tours, puis à chaque tour au-delà
+    for round_number in range(1, 2 * num_nodes + 1):
+        changed = _relax_round(dist, pred, sources, targets, weights, changed)
+        increment("relaxation_rounds")
+        if not changed.any():
+            return dist, pred
+        if round_number >= num_nodes or round_number & (round_number - 1) == 0:
+            cycle = _find_predecessor_cycle(pred)
+            if cycle is not None:
+                raise negative_cycle_error(cycle)
+    raise NegativeCycleError("Le graphe contient un cycle de poids négatif accessible depuis la source.", [])
@@ -0,0 +1,469 @@
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+import networkx as nx
+import numpy as np
+from algorithms.bellman_ford import bellman_ford_algorithm
+from algorithms.dijkstra import dijkstra_algorithm
+from algorithms.ford_fulkerson import ford_fulkerson_algorithm
+from algorithms.generators import (
+    dense_graph_instance, flow_network_instance, gnp_graph_instance, negative_graph_instance, project_instance,
+    sparse_graph_instance, transport_instance,
+)
+from algorithms.instrumentation import instrumented_run
+from algorithms.kruskal import kruskal_algorithm
+from algorithms.moindre_cout import moindre_cout_method
+from algorithms.nord_ouest import nord_ouest_method
+from algorithms.potentiel_metra import potentiel_metra_algorithm_with_details
+from algorithms.stepping_stone import stepping_stone_method
+from algorithms.transport_engine import least_cost_method
+from algorithms.welsh_powell import welsh_powell_coloring
+
+# Niveaux de taille : un cas est exécuté si son niveau est <= au niveau demandé
+SCALES = {"small": 0, "medium": 1, "large": 2}
+
+
+# --- Noyaux mesurés, compteurs d'opérations et références networkx ---
+
+def _graph_counts(instance):
+    graph = instance["graph"]
+    return {"nodes": graph.number_of_nodes(), "edges": graph.number_of_edges()}
+
+
+def _run_dijkstra(instance):
+    distances, _ = dijkstra_algorithm(instance["graph"], instance["source"])
+    return distances
+
+
+def _run_bellman_ford(instance):
+    distances, _ = bellman_ford_algorithm(instance["graph"], instance["source"])
+    return distances
+
+
+def _shortest_path_summary(instance, distances):
+    return {**_graph_counts(instance), "reached": len(distances)}, sum(distances.values())
+
+
+def _run_kruskal(instance):
+    return kruskal_algorithm(instance["graph"])
+
+
+def _kruskal_summary(instance, result):
+    _, mst_edges, total_weight, _ = result
+    return {**_graph_counts(instance), "mst_edges": len(mst_edges)}, total_weight
+
+
+def _run_ford_fulkerson(instance):
+    return ford_fulkerson_algorithm(instance["graph"], instance["source"], instance["sink"])
+
+
+def _ford_fulkerson_summary(instance, result):
+    max_flow, _, paths_taken = result
+    return {**_graph_counts(instance), "augmenting_paths": len(paths_taken)}, max_flow
+
+
+def _run_welsh_powell(instance):
+    return welsh_powell_coloring(instance["graph"])
+
+
+def _welsh_powell_summary(instance, result):
+    colors, chromatic_number = result
+    graph = instance["graph"]
+    if any(colors[u] == colors[v] for u, v in graph.edges):
+        raise ValueError("Coloriage invalide : deux sommets adjacents ont la même couleur.")
+    return {**_graph_counts(instance), "colors": chromatic_number}, chromatic_number
+
+
+def _reference_welsh_powell(instance):
+    # Glouton par degré décroissant : même coloriage que Welsh-Powell classe par classe
+    colors = nx.greedy_color(instance["graph"], strategy="largest_first")
+    return max(colors.values()) + 1 if colors else 0
+
+
+def _run_potentiel_metra(instance):
+    return potentiel_metra_algorithm_with_details(instance["nodes"], instance["edges"], with_graph=False)
+
+
+def _potentiel_metra_summary(instance, result):
+    counts = {"tasks": len(instance["nodes"]), "dependencies": len(instance["edges"]),
+              "levels": max(result["levels"].values()) + 1}
+    return counts, result["total_duration"]
+
+
+def _reference_potentiel_metra(instance):
+    # Durée d'une tâche = poids maximal de ses arcs entrants : plus long chemin où l'arc (u, v) vaut la durée de v
+    duration = {}
+    for u, v, w in instance["edges"]:
+        duration[v] = max(duration.get(v, 0), w)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(instance["nodes"])
+    graph.add_weighted_edges_from((u, v, duration[v]) for u, v, _ in instance["edges"])
+    return nx.dag_longest_path_length(graph)
+
+
+def _transport_counts(instance, allocation):
+    rows, cols = instance["costs"].shape
+    return {"rows": rows, "cols": cols, "basic_cells": int(np.count_nonzero(allocation))}
+
+
+def _run_nord_ouest(instance):
+    return nord_ouest_method(instance["supply"].copy(), instance["demand"].copy(), instance["costs"])
+
+
+def _run_moindre_cout(instance):
+    return moindre_cout_method(instance["supply"], instance["demand"], instance["costs"])
+
+
+def _prepare_stepping_stone(instance):
+    # Solution initiale hors mesure, comme dans l'interface (Moindre Coût)
+    instance["initial_allocation"], _ = least_cost_method(instance["supply"], instance["demand"], instance["costs"])
+    return instance
+
+
+def _run_stepping_stone(instance):
+    return stepping_stone_method(
+        instance["supply"], instance["demand"], instance["costs"], instance["initial_allocation"]
+    )
+
+
+def _transport_summary(instance, result):
+    allocation, total_cost = result
+    return _transport_counts(instance, allocation), np.asarray(total_cost).item()
+
+
+def _reference_transport(instance):
+    # Coût optimal par flot de coût minimal (simplexe réseau de networkx)
+    graph = nx.DiGraph()
+    for i, quantity in enumerate(instance["supply"].tolist()):
+        graph.add_node(("offre", i), demand=-quantity)
+    for j, quantity in enumerate(instance["demand"].tolist()):
+        graph.add_node(("demande", j), demand=quantity)
+    rows, cols = instance["costs"].shape
+    costs = instance["costs"].tolist()
+    graph.add_edges_from(
+        (("offre", i), ("demande", j), {"weight": costs[i][j]}) for i in range(rows) for j in range(cols)
+    )
+    return nx.min_cost_flow_cost(graph)
+
+
+def _distance_total(function):
+    return lambda instance: sum(function(instance).values())
+
+
+# Chaque suite : fabrique d'instance, noyau mesuré, résumé (compteurs, objectif), référence networkx
+# éventuelle (même objectif) et cas (paramètres, niveau de taille).
+SUITES = {
+    "dijkstra": {
+        "make": lambda p, seed: sparse_graph_instance(p["n"], p["m"], seed),
+        "run": _run_dijkstra,
+        "summary": _shortest_path_summary,
+        # Même sortie que le noyau (distances et chemins) : c'est la version networkx qu'il remplace
+        "reference": _distance_total(lambda i: nx.single_source_dijkstra(i["graph"], i["source"])[0]),
+        "cases": [({"n": 1000, "m": 4000}, 0), ({"n": 10000, "m": 40000}, 0),
+                  ({"n": 100000, "m": 400000}, 1), ({"n": 1000000, "m": 4000000}, 2)],
+    },
+    "bellman_ford": {
+        "make": lambda p, seed: negative_graph_instance(p["n"], p["m"], seed),
+        "run": _run_bellman_ford,
+        "summary": _shortest_path_summary,
+        "reference": _distance_total(lambda i: nx.single_source_bellman_ford_path_length(i["graph"], i["source"])),
+        "cases": [({"n": 1000, "m": 4000}, 0), ({"n": 10000, "m": 40000}, 0),
+                  ({"n": 100000, "m": 400000}, 1), ({"n": 300000, "m": 1200000}, 2)],
+    },
+    "kruskal": {
+        "make": lambda p, seed: sparse_graph_instance(p["n"], p["m"], seed),
+        "run": _run_kruskal,
+        "summary": _kruskal_summary,
+        "reference": lambda i: nx.minimum_spanning_tree(i["graph"]).size(weight="weight"),
+        "cases": [({"n": 1000, "m": 4000}, 0), ({"n": 10000, "m": 40000}, 0),
+                  ({"n": 100000, "m": 400000}, 1), ({"n": 1000000, "m": 4000000}, 2)],
+    },
+    "ford_fulkerson": {
+        "make": lambda p, seed: flow_network_instance(p["n"], p["m"], seed),
+        "run": _run_ford_fulkerson,
+        "summary": _ford_fulkerson_summary,
+        "reference": lambda i: nx.maximum_flow_value(i["graph"], i["source"], i["sink"]),
+        "cases": [({"n": 1000, "m": 8000}, 0), ({"n": 10000, "m": 80000}, 0),
+                  ({"n": 100000, "m": 800000}, 1), ({"n": 300000, "m": 2400000}, 2)],
+    },
+    "welsh_powell": {
+        "make": lambda p, seed: dense_graph_instance(p["n"], p["density"], seed),
+        "run": _run_welsh_powell,
+        "summary": _welsh_powell_summary,
+        "reference": _reference_welsh_powell,
+        "cases": [({"n": 200, "density": 0.1}, 0), ({"n": 200, "density": 0.5}, 0),
+                  ({"n": 1000, "density": 0.1}, 0), ({"n": 1000, "density": 0.5}, 1),
+                  ({"n": 3000, "density": 0.5}, 1), ({"n": 10000, "density": 0.1}, 2)],
+    },
+    "welsh_powell_gnp": {
+        "make": lambda p, seed: gnp_graph_instance(p["n"], p["p"], seed),
+        "run": _run_welsh_powell,
+        "summary": _welsh_powell_summary,
+        "reference": _reference_welsh_powell,
+        "cases": [({"n": 1000, "p": 0.01}, 0), ({"n": 1000, "p": 0.1}, 0),
+                  ({"n": 10000, "p": 0.001}, 1), ({"n": 10000, "p": 0.01}, 2)],
+    },
+    "potentiel_metra": {
+        "make": lambda p, seed: project_instance(p["n"], seed),
+        "run": _run_potentiel_metra,
+        "summary": _potentiel_metra_summary,
+        "reference": _reference_potentiel_metra,
+        "cases": [({"n": 1000}, 0), ({"n": 10000}, 0), ({"n": 100000}, 1), ({"n": 1000000}, 2)],
+    },
+    "nord_ouest": {
+        "make": lambda p, seed: transport_instance(p["rows"], p["cols"], seed),
+        "run": _run_nord_ouest,
+        "summary": _transport_summary,
+        "reference": None,
+        "cases": [({"rows": 20, "cols": 20}, 0), ({"rows": 100, "cols": 100}, 0),
+                  ({"rows": 300, "cols": 300}, 1), ({"rows": 1000, "cols": 1000}, 2)],
+    },
+    "moindre_cout": {
+        "make": lambda p, seed: transport_instance(p["rows"], p["cols"], seed),
+        "run": _run_moindre_cout,
+        "summary": _transport_summary,
+        "reference": None,
+        "cases": [({"rows": 20, "cols": 20}, 0), ({"rows": 100, "cols": 100}, 0),
+                  ({"rows": 300, "cols": 300}, 1), ({"rows": 1000, "cols": 1000}, 2)],
+    },
+    "stepping_stone": {
+        "make": lambda p, seed: _prepare_stepping_stone(transport_instance(p["rows"], p["cols"], seed)),
+        "run": _run_stepping_stone,
+        "summary": _transport_summary,
+        "reference": _reference_transport,
+        "cases": [({"rows": 20, "cols": 20}, 0), ({"rows": 50, "cols": 50}, 0),
+                  ({"rows": 100, "cols": 100}, 1), ({"rows": 300, "cols": 300}, 2)],
+    },
+}
+
+
+# --- Mesures ---
+
+def _case_name(suite, params):
+    return f"{suite} " + " ".join(f"{key}={value}" for key, value in params.items())
+
+
+def measure(function, instance, repeat=3):
+    """
+    Mesure un appel : durées de `repeat` exécutions (sans tracemalloc, qui ralentit le code Python),
+    puis pic mémoire alloué (Python et NumPy) et compteurs d'opérations des moteurs sur une
+    exécution supplémentaire sous tracemalloc.
+    Retourne (résultat, durées en secondes, pic mémoire en octets, compteurs).
+    """
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function(instance)
+        times.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    try:
+        with instrumented_run("benchmark", trace_memory=False) as run:
+            function(instance)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, times, peak, run.counters if run is not None else {}
+
+
+def _same_objective(value, reference):
+    return bool(np.isclose(value, reference, rtol=1e-9, atol=1e-9))
+
+
+def run_case(suite, params, seed=0, repeat=3, with_reference=True):
+    """
+    Exécute un cas : génère l'instance (hors mesure), mesure le noyau puis, s'il en existe une,
+    la référence networkx (une seule exécution) et vérifie que les objectifs coïncident.
+    Retourne un enregistrement sérialisable en JSON.
+    """
+    spec = SUITES[suite]
+    instance = spec["make"](params, seed)
+    result, times, peak, counters = measure(spec["run"], instance, repeat)
+    counts, objective = spec["summary"](instance, result)
+    counts.update(counters)
+    record = {
+        "case": _case_name(suite, params),
+        "suite": suite,
+        "params": params,
+        "seed": seed,
+        "wall_time": min(times),
+        "wall_time_median": statistics.median(times),
+        "peak_memory": peak,
+        "counts": counts,
+        "objective": objective,
+    }
+    if with_reference and spec["reference"] is not None:
+        started = time.perf_counter()
+        reference = spec["reference"](instance)
+        record["reference_time"] = time.perf_counter() - started
+        record["reference_objective"] = reference
+        record["speedup"] = record["reference_time"] / max(record["wall_time"], 1e-12)
+        record["matches_reference"] = _same_objective(objective, reference)
+    return record
+
+
+def _metadata(scale, seed, repeat):
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "networkx": nx.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "scale": scale,
+        "seed": seed,
+        "repeat": repeat,
+    }
+
+
+def run_benchmarks(suites=None, scale="small", seed=0, repeat=3, with_reference=True, progress=None):
+    """
+    Exécute les cas des suites demandées (toutes par défaut) jusqu'au niveau de taille `scale`.
+    `progress(record)` est appelé après chaque cas. Retourne {"metadata": ..., "results": [...]}.
+    """
+    level = SCALES[scale]
+    results = []
+    for suite in suites or SUITES:
+        if suite not in SUITES:
+            raise ValueError(f"Suite inconnue : {suite} (disponibles : {', '.join(SUITES)})")
+        for params, case_level in SUITES[suite]["cases"]:
+            if case_level <= level:
+                record = run_case(suite, params, seed, repeat, with_reference)
+                results.append(record)
+                if progress is not None:
+                    progress(record)
+    return {"metadata": _metadata(scale, seed, repeat), "results": results}
+
+
+# --- Comparaison de deux exécutions ---
+
+def compare_runs(baseline, current, threshold=0.10, min_delta=1e-3):
+    """
+    Compare deux exécutions cas par cas (rapport nouveau / ancien du temps et du pic mémoire).
+    Un cas régresse si son temps (ou sa mémoire) augmente de plus de `threshold` en valeur relative
+    et de plus de `min_delta` secondes (resp. 64 Kio), ou s'il ne correspond plus à la référence.
+    Retourne une liste de lignes de comparaison.
+    """
+    before = {record["case"]: record for record in baseline["results"]}
+    rows = []
+    for record in current["results"]:
+        old = before.pop(record["case"], None)
+        if old is None:
+            rows.append({"case": record["case"], "status": "nouveau"})
+            continue
+        time_ratio = record["wall_time"] / max(old["wall_time"], 1e-12)
+        memory_ratio = record["peak_memory"] / max(old["peak_memory"], 1)
+        slower = time_ratio > 1 + threshold and record["wall_time"] - old["wall_time"] > min_delta
+        bigger = memory_ratio > 1 + threshold and record["peak_memory"] - old["peak_memory"] > 64 * 1024
+        if record.get("matches_reference") is False:
+            status = "ERREUR"
+        elif slower or bigger:
+            status = "RÉGRESSION"
+        elif time_ratio < 1 - threshold and old["wall_time"] - record["wall_time"] > min_delta:
+            status = "amélioration"
+        else:
+            status = "stable"
+        rows.append({
+            "case": record["case"],
+            "status": status,
+            "old_time": old["wall_time"],
+            "new_time": record["wall_time"],
+            "time_ratio": time_ratio,
+            "old_memory": old["peak_memory"],
+            "new_memory": record["peak_memory"],
+            "memory_ratio": memory_ratio,
+            "counts_changed": old["counts"] != record["counts"],
+        })
+    rows.extend({"case": case, "status": "absent"} for case in before)
+    return rows
+
+
+def format_comparison(rows):
+    """
+    Met en forme les lignes de comparaison en tableau texte.
+    """
+    lines = [f"{'Cas':<42}{'Avant (ms)':>12}{'Après (ms)':>12}{'Temps':>8}{'Mémoire':>9}  Statut"]
+    for row in rows:
+        if "time_ratio" not in row:
+            lines.append(f"{row['case']:<42}{'':>41}  {row['status']}")
+            continue
+        status = row["status"] + (" (compteurs modifiés)" if row["counts_changed"] else "")
+        lines.append(
+            f"{row['case']:<42}{row['old_time'] * 1000:>12.2f}{row['new_time'] * 1000:>12.2f}"
+            f"{row['time_ratio']:>7.2f}x{row['memory_ratio']:>8.2f}x  {status}"
+        )
+    return "\n".join(lines)
+
+
+def _print_record(record):
+    reference = ""
+    if "reference_time" in record:
+        check = "ok" if record["matches_reference"] else "DIFFÉRENT"
+        reference = f"  networkx {record['reference_time'] * 1000:.1f} ms (x{record['speedup']:.1f}, {check})"
+    print(
+        f"{record['case']:<42}{record['wall_time'] * 1000:>10.2f} ms{record['peak_memory'] / 2**20:>9.1f} Mio"
+        f"{reference}",
+        file=sys.stderr, flush=True,
+    )
+
+
+def main(argv=None):
+    """
+    Point d'entrée de `python -m algorithms.benchmark` :
+    `run` exécute les suites et écrit les résultats JSON, `compare` compare deux fichiers de résultats
+    (code de retour 1 en cas de régression).
+    """
+    parser = argparse.ArgumentParser(prog="python -m algorithms.benchmark", description="Banc d'essai des algorithmes.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="exécute les suites de mesures")
+    run.add_argument("suites", nargs="*", help=f"suites à exécuter (par défaut toutes : {', '.join(SUITES)})")
+    run.add_argument("--scale", choices=SCALES, default="small", help="niveau de taille des instances")
+    run.add_argument("--seed", type=int, default=0, help="graine des instances")
+    run.add_argument("--repeat", type=int, default=3, help="nombre d'exécutions mesurées par cas")
+    run.add_argument("--no-reference", action="store_true", help="ne pas exécuter les références networkx")
+    run.add_argument("-o", "--output", help="fichier JSON des résultats (sortie standard par défaut)")
+
+    compare = commands.add_parser("compare", help="compare deux fichiers de résultats")
+    compare.add_argument("baseline", help="résultats de référence (avant)")
+    compare.add_argument("current", help="résultats à comparer (après)")
+    compare.add_argument("--threshold", type=float, default=0.10, help="variation relative tolérée (0.10 = 10 %%)")
+    compare.add_argument("--json", action="store_true", help="écrit la comparaison au format JSON")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        report = run_benchmarks(
+            args.suites, args.scale, args.seed, max(1, args.repeat), not args.no_reference, progress=_print_record
+        )
+        text = json.dumps(report, indent=2, ensure_ascii=False)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as stream:
+                stream.write(text + "\n")
+        else:
+            print(text)
+        return 1 if any(record.get("matches_reference") is False for record in report["results"]) else 0
+
+    with open(args.baseline, encoding="utf-8") as stream:
+        baseline = json.load(stream)
+    with open(args.current, encoding="utf-8") as stream:
+        current = json.load(stream)
+    rows = compare_runs(baseline, current, args.threshold)
+    print(json.dumps(rows, indent=2, ensure_ascii=False) if args.json else format_comparison(rows))
+    return 1 if any(row["status"] in ("RÉGRESSION", "ERREUR") for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
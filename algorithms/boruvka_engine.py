@@ -0,0 +1,153 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+
+# Rang « infini » : composante sans arête sortante
+_NO_EDGE = np.iinfo(np.int64).max
+
+# Tableaux partagés attachés par chaque processus de calcul
+_worker_arrays = None
+
+
+def _component_minima(sources, targets, ranks, components, num_components):
+    """
+    Pour chaque composante, rang de l'arête sortante minimale parmi les arêtes données.
+    """
+    comp_u = components[sources]
+    comp_v = components[targets]
+    outgoing = comp_u != comp_v
+    best = np.full(num_components, _NO_EDGE, dtype=np.int64)
+    np.minimum.at(best, comp_u[outgoing], ranks[outgoing])
+    np.minimum.at(best, comp_v[outgoing], ranks[outgoing])
+    return best
+
+
+def _init_worker(descriptors):
+    """
+    Attache les blocs de mémoire partagée (arêtes, rangs, composantes) au processus de calcul.
+    """
+    global _worker_arrays
+    _worker_arrays = {}
+    for name, (block_name, size, dtype) in descriptors.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        _worker_arrays[name] = (block, np.ndarray(size, dtype=dtype, buffer=block.buf))
+
+
+def _chunk_minima(start, end, num_components):
+    """
+    Minima par composante sur la tranche [start, end) des arêtes encore actives.
+    """
+    arrays = {name: array for name, (_, array) in _worker_arrays.items()}
+    return _component_minima(
+        arrays["sources"][start:end],
+        arrays["targets"][start:end],
+        arrays["ranks"][start:end],
+        arrays["components"],
+        num_components,
+    )
+
+
+def _contract(components, best_edges, sources, targets):
+    """
+    Fusionne chaque composante avec celle située au bout de son arête minimale,
+    puis renumérote les composantes de 0 à C-1.
+    """
+    num_components = len(best_edges)
+    has_edge = best_edges >= 0
+    pointer = np.arange(num_components)
+    own = np.arange(num_components)[has_edge]
+    ends_u = components[sources[best_edges[has_edge]]]
+    ends_v = components[targets[best_edges[has_edge]]]
+    pointer[own] = np.where(ends_u == own, ends_v, ends_u)
+
+    # Les paires qui se désignent mutuellement forment un 2-cycle : le plus petit devient racine
+    mutual = (pointer[pointer] == np.arange(num_components)) & (pointer < np.arange(num_components))
+    pointer[pointer[mutual]] = pointer[mutual]
+
+    while True:
+        jumped = pointer[pointer]
+        if np.array_equal(jumped, pointer):
+            break
+        pointer = jumped
+
+    _, relabeled = np.unique(pointer, return_inverse=True)
+    return relabeled[components], relabeled.max() + 1 if len(relabeled) else 0
+
+
+def boruvka_arrays(num_nodes, sources, targets, weights, max_workers=None, chunk_size=1 << 20):
+    """
+    Arbre (ou forêt) couvrant minimal par Borůvka.
+    À chaque tour, l'arête sortante minimale de chaque composante est cherchée en parallèle
+    sur des tranches du tableau d'arêtes (mémoire partagée), puis les composantes sont contractées.
+    Les égalités de poids sont départagées par l'ordre d'entrée, comme le tri stable de Kruskal :
+    le résultat est identique à kruskal_arrays. Retourne (indices des arêtes retenues, poids total).
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights)
+
+    # Ordre total strict (poids, position) : le MST est unique et égal à celui de Kruskal
+    order = np.argsort(weights, kind="stable")
+    ranks = np.empty(len(order), dtype=np.int64)
+    ranks[order] = np.arange(len(order))
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    parallel = max_workers > 1 and len(sources) > chunk_size
+
+    components = np.arange(num_nodes, dtype=np.int64)
+    num_components = num_nodes
+    accepted_ranks = []
+
+    alive_sources, alive_targets, alive_ranks = sources, targets, ranks
+    blocks, executor = {}, None
+    try:
+        if parallel:
+            shared = {}
+            for name, array in (("sources", sources), ("targets", targets), ("ranks", ranks), ("components", components)):
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                shared[name] = np.ndarray(len(array), dtype=array.dtype, buffer=block.buf)
+                shared[name][:] = array
+                blocks[name] = block
+            descriptors = {name: (blocks[name].name, len(shared[name]), shared[name].dtype) for name in shared}
+            executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(descriptors,))
+
+        while num_components > 1 and len(alive_ranks):
+            if parallel:
+                count = len(alive_ranks)
+                shared["components"][:] = components
+                futures = [
+                    executor.submit(_chunk_minima, start, min(start + chunk_size, count), num_components)
+                    for start in range(0, count, chunk_size)
+                ]
+                best = np.minimum.reduce([future.result() for future in futures])
+            else:
+                best = _component_minima(alive_sources, alive_targets, alive_ranks, components, num_components)
+
+            found = best != _NO_EDGE
+            if not found.any():
+                break  # Plus aucune arête entre composantes : forêt couvrante
+
+            # Une même arête peut être minimale pour ses deux extrémités
+            accepted_ranks.append(np.unique(best[found]))
+            best_edges = np.where(found, order[np.minimum(best, len(order) - 1)], -1)
+            components, num_components = _contract(components, best_edges, sources, targets)
+
+            # Ne garder que les arêtes entre composantes distinctes pour le tour suivant
+            keep = components[alive_sources] != components[alive_targets]
+            alive_sources, alive_targets, alive_ranks = alive_sources[keep], alive_targets[keep], alive_ranks[keep]
+            if parallel:
+                count = len(alive_ranks)
+                shared["sources"][:count] = alive_sources
+                shared["targets"][:count] = alive_targets
+                shared["ranks"][:count] = alive_ranks
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        for block in blocks.values():
+            block.close()
+            block.unlink()
+
+    accepted = order[np.sort(np.concatenate(accepted_ranks))] if accepted_ranks else np.zeros(0, dtype=np.int64)
+    return accepted, weights[accepted].sum().item()
@@ -0,0 +1,361 @@
+import heapq
+import numpy as np
+from algorithms.instrumentation import increment
+
+
+def _gather_ranges(starts, ends):
+    """
+    Concatène les intervalles [starts[k], ends[k]) en un seul tableau d'indices, sans boucle Python.
+    """
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if not total:
+        return np.zeros(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(total)
+
+
+def _segments(keys):
+    """
+    Débuts des groupes de clés égales consécutives dans un tableau trié.
+    """
+    if not len(keys):
+        return np.zeros(0, dtype=np.int64)
+    return np.flatnonzero(np.concatenate([[True], keys[1:] != keys[:-1]]))
+
+
+def topological_levels(num_nodes, sources, targets):
+    """
+    Niveaux topologiques par l'algorithme de Kahn traité front par front : le niveau d'un sommet est
+    la longueur (en arcs) du plus long chemin qui y mène. Lève ValueError si le graphe a un cycle.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    out_order = np.argsort(sources, kind="stable")
+    out_targets = targets[out_order]
+    out_start = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=out_start[1:])
+
+    in_degree = np.bincount(targets, minlength=num_nodes)
+    levels = np.full(num_nodes, -1, dtype=np.int64)
+    frontier = np.flatnonzero(in_degree == 0)
+    level = 0
+    while len(frontier):
+        levels[frontier] = level
+        reached = out_targets[_gather_ranges(out_start[frontier], out_start[frontier + 1])]
+        np.subtract.at(in_degree, reached, 1)
+        frontier = np.unique(reached[in_degree[reached] == 0])
+        level += 1
+
+    if (levels < 0).any():
+        raise ValueError("Le graphe contient un cycle. Assurez-vous que les dépendances sont valides.")
+    return levels
+
+
+def latest_dates(num_nodes, sources, targets, levels, arc_lengths, horizon):
+    """
+    Passe arrière : late[u] = min(horizon, min sur les arcs (u, v) de late[v] - arc_lengths[arc]),
+    niveau par niveau, les arcs étant groupés par (niveau de l'origine, origine).
+    arc_lengths et horizon peuvent porter un lot de scénarios (premiers axes).
+    """
+    arc_lengths = np.asarray(arc_lengths)
+    horizon = np.asarray(horizon)
+    num_levels = int(levels.max(initial=-1)) + 1
+    order = np.lexsort((sources, levels[sources]))
+    out_sources, out_targets, out_lengths = sources[order], targets[order], arc_lengths[..., order]
+    out_segments = _segments(out_sources)
+    segment_sources = out_sources[out_segments]
+    level_edges = np.searchsorted(levels[out_sources], np.arange(num_levels + 1))
+    level_segments = np.searchsorted(out_segments, level_edges)
+
+    late = np.empty(horizon.shape + (num_nodes,), dtype=np.result_type(arc_lengths, horizon))
+    late[...] = np.expand_dims(horizon, -1)
+    for level in range(num_levels - 1, -1, -1):
+        first, last = level_edges[level], level_edges[level + 1]
+        seg_first, seg_last = level_segments[level], level_segments[level + 1]
+        if first == last:
+            continue
+        nodes = segment_sources[seg_first:seg_last]
+        candidates = late[..., out_targets[first:last]] - out_lengths[..., first:last]
+        late[..., nodes] = np.minimum(
+            late[..., nodes], np.minimum.reduceat(candidates, out_segments[seg_first:seg_last] - first, axis=-1)
+        )
+    return late
+
+
+def critical_path_arrays(num_nodes, sources, targets, weights):
+    """
+    Potentiel Métra vectorisé, mêmes règles que potentiel_metra_algorithm_with_details :
+    la durée d'une tâche est le plus grand poids de ses arcs entrants, son début au plus tôt la
+    plus grande fin de ses prédécesseurs. Les arcs sont triés une seule fois par niveau de leur
+    destination (passe avant) et de leur origine (passe arrière, latest_dates) ; chaque niveau est un bloc
+    contigu réduit par np.maximum.reduceat / np.minimum.reduceat.
+    weights peut être un lot de scénarios (scénarios × arcs) : tous sont traités en même temps.
+    Retourne un dictionnaire de tableaux indexés par sommet (dernier axe) et la durée totale.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights)
+    levels = topological_levels(num_nodes, sources, targets)
+    num_levels = int(levels.max(initial=-1)) + 1
+    increment("levels", num_levels)
+    dtype = weights.dtype if weights.size else np.int64
+    shape = weights.shape[:-1] + (num_nodes,)
+
+    # Passe avant : arcs groupés par (niveau de la destination, destination)
+    order = np.lexsort((targets, levels[targets]))
+    in_sources, in_targets, in_weights = sources[order], targets[order], weights[..., order]
+    in_segments = _segments(in_targets)
+    segment_targets = in_targets[in_segments]
+    duration = np.zeros(shape, dtype=dtype)
+    if len(in_segments):
+        duration[..., segment_targets] = np.maximum.reduceat(in_weights, in_segments, axis=-1)
+    level_edges = np.searchsorted(levels[in_targets], np.arange(num_levels + 1))
+    level_segments = np.searchsorted(in_segments, level_edges)
+
+    start = np.zeros(shape, dtype=dtype)
+    finish = np.zeros(shape, dtype=dtype)
+    for level in range(1, num_levels):
+        first, last = level_edges[level], level_edges[level + 1]
+        seg_first, seg_last = level_segments[level], level_segments[level + 1]
+        nodes = segment_targets[seg_first:seg_last]
+        start[..., nodes] = np.maximum.reduceat(
+            finish[..., in_sources[first:last]], in_segments[seg_first:seg_last] - first, axis=-1
+        )
+        finish[..., nodes] = start[..., nodes] + duration[..., nodes]
+    total_duration = finish.max(axis=-1, initial=0)
+
+    late_start = latest_dates(num_nodes, sources, targets, levels, weights, total_duration)
+    out_order = np.argsort(sources, kind="stable")
+    out_targets = targets[out_order]
+    out_segments = _segments(sources[out_order])
+    segment_sources = sources[out_order][out_segments]
+
+    # Marge libre : plus petit début au plus tard des successeurs moins la fin au plus tôt (0 sans successeur)
+    free_margin = np.zeros(shape, dtype=dtype)
+    if len(out_segments):
+        free_margin[..., segment_sources] = (
+            np.minimum.reduceat(late_start[..., out_targets], out_segments, axis=-1) - finish[..., segment_sources]
+        )
+
+    return {
+        "start_times": start,
+        "finish_times": finish,
+        "late_start": late_start,
+        "late_finish": late_start.copy(),
+        "free_margin": free_margin,
+        "total_margin": late_start - start,
+        "total_duration": total_duration,
+        "levels": levels,
+    }
+
+
+def edges_to_arrays(nodes, edges):
+    """
+    Convertit une liste de tâches et d'arcs (u, v, poids) en tableaux d'indices. Comme pour un
+    nx.DiGraph, un arc répété garde le dernier poids.
+    """
+    index = {node: i for i, node in enumerate(nodes)}
+    sources = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+    targets = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+    weights = np.array([w for _, _, w in edges]) if len(edges) else np.zeros(0, dtype=np.int64)
+
+    keys = sources * len(nodes) + targets
+    _, last = np.unique(keys[::-1], return_index=True)
+    if len(last) < len(keys):
+        kept = np.sort(len(keys) - 1 - last)
+        sources, targets, weights = sources[kept], targets[kept], weights[kept]
+    return sources, targets, weights
+
+
+class IncrementalSchedule:
+    """
+    Ordonnancement Potentiel Métra avec état : dates au plus tôt et « queue » de chaque tâche
+    (durée restante jusqu'à la fin du projet, d'où late_start = durée totale - queue) sont conservées.
+    Un changement de poids sur (u, v) ne repropage que le cône aval de v (passe avant) et le cône
+    amont de u (passe arrière), dans l'ordre des niveaux, via des files de sommets à recalculer.
+    Stocker la queue plutôt que late_start évite de tout repropager quand la durée totale change.
+    """
+
+    def __init__(self, num_nodes, sources, targets, weights, nodes=None):
+        self.nodes = list(range(num_nodes)) if nodes is None else list(nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        weights = np.asarray(weights)
+        self.edge_source = sources.tolist()
+        self.edge_target = targets.tolist()
+        self.weights = weights.tolist()
+
+        result = critical_path_arrays(num_nodes, sources, targets, weights)
+        self.levels = result["levels"].tolist()
+        self.start = result["start_times"]
+        self.finish = result["finish_times"]
+        self.total_duration = result["total_duration"]
+        self.tail = self.total_duration - result["late_start"]
+        self.duration = self.finish - self.start
+        self.critical = result["total_margin"] == 0
+
+        # Arcs sortants de u : out_edges[out_start[u]:out_start[u + 1]] (de même pour les arcs entrants)
+        out_order = np.argsort(sources, kind="stable")
+        in_order = np.argsort(targets, kind="stable")
+        self.out_edges = out_order.tolist()
+        self.in_edges = in_order.tolist()
+        self.out_start = np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=num_nodes))]).tolist()
+        self.in_start = np.concatenate([[0], np.cumsum(np.bincount(targets, minlength=num_nodes))]).tolist()
+
+        # Arcs groupés par origine, pour les marges libres
+        self._out_targets = targets[out_order]
+        self._out_segments = _segments(sources[out_order])
+        self._segment_sources = sources[out_order][self._out_segments]
+
+    def _outgoing(self, x):
+        """
+        Indices des arcs sortants de x.
+        """
+        return self.out_edges[self.out_start[x]:self.out_start[x + 1]]
+
+    def _incoming(self, x):
+        """
+        Indices des arcs entrants de x.
+        """
+        return self.in_edges[self.in_start[x]:self.in_start[x + 1]]
+
+    def _edge(self, u, v):
+        """
+        Indice de l'arc (u, v), cherché parmi les arcs sortants de u.
+        """
+        target = self.index[v]
+        for e in self._outgoing(self.index[u]):
+            if self.edge_target[e] == target:
+                return e
+        raise KeyError((u, v))
+
+    @classmethod
+    def from_edges(cls, nodes, edges):
+        """
+        Construit l'objet à partir d'une liste de tâches et d'arcs (u, v, poids).
+        """
+        nodes = list(nodes)
+        sources, targets, weights = edges_to_arrays(nodes, edges)
+        return cls(len(nodes), sources, targets, weights, nodes=nodes)
+
+    def _forward(self, seeds):
+        """
+        Passe avant limitée au cône aval des sommets `seeds`. Retourne les sommets modifiés.
+        """
+        start, finish, duration, weights = self.start, self.finish, self.duration, self.weights
+        edge_source, edge_target, levels = self.edge_source, self.edge_target, self.levels
+        heap = [(levels[x], x) for x in seeds]
+        heapq.heapify(heap)
+        queued = set(seeds)
+        changed = []
+        while heap:
+            _, x = heapq.heappop(heap)
+            incoming = self._incoming(x)
+            new_start = max((finish[edge_source[e]] for e in incoming), default=0)
+            new_finish = new_start + duration[x]
+            if new_start == start[x] and new_finish == finish[x]:
+                continue
+            changed.append(x)
+            start[x] = new_start
+            if new_finish != finish[x]:
+                finish[x] = new_finish
+                for e in self._outgoing(x):
+                    y = edge_target[e]
+                    if y not in queued:
+                        queued.add(y)
+                        heapq.heappush(heap, (levels[y], y))
+        return changed
+
+    def _backward(self, seeds):
+        """
+        Passe arrière limitée au cône amont des sommets `seeds`. Retourne les sommets modifiés.
+        """
+        tail, weights = self.tail, self.weights
+        edge_source, edge_target, levels = self.edge_source, self.edge_target, self.levels
+        heap = [(-levels[x], x) for x in seeds]
+        heapq.heapify(heap)
+        queued = set(seeds)
+        changed = []
+        while heap:
+            _, x = heapq.heappop(heap)
+            new_tail = max(0, max((tail[edge_target[e]] + weights[e] for e in self._outgoing(x)), default=0))
+            if new_tail == tail[x]:
+                continue
+            changed.append(x)
+            tail[x] = new_tail
+            for e in self._incoming(x):
+                y = edge_source[e]
+                if y not in queued:
+                    queued.add(y)
+                    heapq.heappush(heap, (-levels[y], y))
+        return changed
+
+    def update_weights(self, changes):
+        """
+        Applique plusieurs changements {(u, v): poids} puis repropage une seule fois.
+        Retourne (tâches devenues critiques, tâches qui ne le sont plus).
+        """
+        forward_seeds, backward_seeds = set(), set()
+        for (u, v), weight in changes.items():
+            k = self._edge(u, v)
+            if np.asarray(weight).dtype.kind == "f" and self.start.dtype.kind != "f":
+                # Poids réel sur un ordonnancement entier : passer les dates en réels plutôt que tronquer
+                self.start, self.finish, self.tail, self.duration = (
+                    a.astype(np.float64) for a in (self.start, self.finish, self.tail, self.duration)
+                )
+            self.weights[k] = weight
+            target = self.edge_target[k]
+            duration = max(self.weights[e] for e in self._incoming(target))
+            if duration != self.duration[target]:
+                self.duration[target] = duration
+                forward_seeds.add(target)
+            backward_seeds.add(self.edge_source[k])
+
+        touched = self._forward(forward_seeds) + self._backward(backward_seeds)
+        old_total = self.total_duration
+        if forward_seeds:
+            self.total_duration = self.finish.max(initial=0)
+
+        # Statut critique : marge totale (durée totale - queue) - début nulle. Si la durée totale
+        # n'a pas changé, seuls les sommets des cônes repropagés peuvent changer de statut.
+        if self.total_duration != old_total:
+            candidates = np.arange(len(self.nodes))
+        else:
+            candidates = np.unique(np.array(touched, dtype=np.int64))
+        critical = (self.total_duration - self.tail[candidates]) - self.start[candidates] == 0
+        flipped = candidates[critical != self.critical[candidates]]
+        self.critical[flipped] = ~self.critical[flipped]
+
+        became = [self.nodes[i] for i in flipped[self.critical[flipped]].tolist()]
+        left = [self.nodes[i] for i in flipped[~self.critical[flipped]].tolist()]
+        return became, left
+
+    def set_weight(self, u, v, weight):
+        """
+        Modifie le poids d'un arc ; retourne (tâches devenues critiques, tâches qui ne le sont plus).
+        """
+        return self.update_weights({(u, v): weight})
+
+    def arrays(self):
+        """
+        Dates et marges courantes, mêmes clés que critical_path_arrays.
+        """
+        late_start = self.total_duration - self.tail
+        free_margin = np.zeros_like(self.start)
+        if len(self._out_segments):
+            free_margin[self._segment_sources] = (
+                np.minimum.reduceat(late_start[self._out_targets], self._out_segments)
+                - self.finish[self._segment_sources]
+            )
+        return {
+            "start_times": self.start.copy(),
+            "finish_times": self.finish.copy(),
+            "late_start": late_start,
+            "late_finish": late_start.copy(),
+            "free_margin": free_margin,
+            "total_margin": late_start - self.start,
+            "total_duration": self.total_duration,
+            "levels": np.array(self.levels),
+        }
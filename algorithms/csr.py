@@ -0,0 +1,71 @@
+import itertools
+import numpy as np
+from collections import namedtuple
+
+
+# Représentation compacte d'un graphe pondéré (Compressed Sparse Row) :
+# les voisins du sommet i sont targets[offsets[i]:offsets[i + 1]],
+# avec les poids correspondants dans weights.
+CSRGraph = namedtuple("CSRGraph", ["nodes", "index", "offsets", "targets", "weights"])
+
+
+def edges_to_csr(num_nodes, sources, targets, weights, nodes=None):
+    """
+    Construit un CSRGraph à partir de tableaux d'arêtes orientées (indices 0..n-1).
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    weights = np.asarray(weights)
+    if weights.dtype.kind not in "iuf":
+        weights = weights.astype(np.float64)
+
+    # Tri stable par sommet d'origine pour conserver l'ordre d'insertion des voisins
+    order = np.argsort(sources, kind="stable")
+    counts = np.bincount(sources, minlength=num_nodes)
+
+    offset_dtype = np.int32 if len(sources) < 2**31 else np.int64
+    offsets = np.zeros(num_nodes + 1, dtype=offset_dtype)
+    np.cumsum(counts, out=offsets[1:])
+
+    if nodes is None:
+        nodes = list(range(num_nodes))
+    index = {node: i for i, node in enumerate(nodes)}
+    return CSRGraph(nodes, index, offsets, targets[order].astype(np.int32), weights[order])
+
+
+def graph_to_csr(graph, weight="weight"):
+    """
+    Convertit un graphe networkx en CSRGraph (une seule fois par graphe).
+    La liste d'adjacence est parcourue directement : les arêtes d'un graphe
+    non orienté apparaissent donc dans les deux sens.
+    """
+    nodes = list(graph.nodes)
+    adjacency = [neighbors for _, neighbors in graph.adjacency()]
+    counts = np.fromiter(map(len, adjacency), dtype=np.int64, count=len(nodes))
+    num_edges = int(counts.sum())
+
+    offset_dtype = np.int32 if num_edges < 2**31 else np.int64
+    offsets = np.zeros(len(nodes) + 1, dtype=offset_dtype)
+    np.cumsum(counts, out=offsets[1:])
+
+    # Sommets déjà numérotés 0..n-1 dans l'ordre : pas de traduction des voisins
+    index = {node: i for i, node in enumerate(nodes)}
+    neighbors = itertools.chain.from_iterable(adjacency)
+    if any(node != i for node, i in index.items()):
+        neighbors = map(index.__getitem__, neighbors)
+    targets = np.fromiter(neighbors, dtype=np.int32, count=num_edges)
+
+    weights = [data.get(weight, 1) for data in itertools.chain.from_iterable(n.values() for n in adjacency)]
+    weights = np.array(weights) if weights else np.zeros(0, dtype=np.int64)
+    if weights.dtype.kind not in "iuf":
+        weights = weights.astype(np.float64)
+    return CSRGraph(nodes, index, offsets, targets, weights)
+
+
+def reverse_csr(csr):
+    """
+    Graphe transposé (arcs inversés), utile pour les recherches vers un sommet cible.
+    """
+    num_nodes = len(csr.nodes)
+    sources = np.repeat(np.arange(num_nodes), np.diff(csr.offsets))
+    return edges_to_csr(num_nodes, csr.targets, sources, csr.weights, nodes=csr.nodes)
@@ -2,25 +2,102 @@ import networkx as nx
 import random
 from tkinter import simpledialog, messagebox, Toplevel, Text, Scrollbar, END, VERTICAL
 import matplotlib.pyplot as plt
+import numpy as np
+from algorithms.csr import graph_to_csr
+from algorithms.generators import random_graph
+from algorithms.instrumentation import annotate_figure, finish_run, instrumented_run, phase
+from algorithms.dijkstra_engine import dijkstra_batch_csr, dijkstra_paths_csr
+from algorithms.landmarks import build_landmark_index
 
+# Au-delà de ce nombre de sommets, le graphe n'est plus dessiné (seul le tableau est affiché)
+MAX_DRAWN_NODES = 500
 
-def dijkstra_algorithm(graph, source):
+
+def dijkstra_algorithm(graph, source, method="csr", cache=None, csr=None, fingerprint=None):
     """
     Implémente l'algorithme de Dijkstra pour trouver les plus courts chemins à partir d'un sommet source.
+    method="csr" utilise le moteur sur tableaux NumPy, method="networkx" la version de référence.
+    Pour plusieurs requêtes sur un même graphe, passer `csr` (construit une fois par graph_to_csr(graph)).
+    Si un ShortestPathCache est fourni, les arbres déjà calculés sont réutilisés ; passer `fingerprint`
+    (graph_fingerprint(graph), à recalculer si le graphe change) évite de rehacher le graphe à chaque requête.
     """
-    distances, paths = nx.single_source_dijkstra(graph, source=source)
+    if cache is not None:
+        return cache.lookup("dijkstra", graph, source, lambda: dijkstra_algorithm(graph, source, method, csr=csr),
+                            fingerprint=fingerprint)
+
+    if method == "networkx":
+        distances, paths = nx.single_source_dijkstra(graph, source=source)
+        return distances, paths
+    if method != "csr":
+        raise ValueError(f"Méthode inconnue : {method}")
+    if source not in graph:
+        raise nx.NodeNotFound(f"Le sommet source {source} n'est pas dans le graphe.")
+
+    if csr is None:
+        csr = graph_to_csr(graph)
+    distances, paths = dijkstra_paths_csr(csr, csr.index[source])
     return distances, paths
 
 
+def dijkstra_point_to_point(graph, source, target, index=None, method="alt"):
+    """
+    Plus court chemin entre deux sommets, sans calculer l'arbre complet.
+    `index` (voir build_landmark_index) peut être construit une fois et réutilisé pour de nombreuses requêtes.
+    Retourne (distance, chemin, nombre de sommets fixés) ; distance vaut inf si la cible est inaccessible.
+    """
+    if index is None:
+        index = build_landmark_index(graph)
+    csr = index.csr
+    for node in (source, target):
+        if node not in csr.index:
+            raise nx.NodeNotFound(f"Le sommet {node} n'est pas dans le graphe.")
+
+    distance, path, settled = index.query(csr.index[source], csr.index[target], method=method)
+    if csr.weights.dtype.kind in "iu" and distance != float("inf"):
+        distance = int(distance)
+    return distance, [csr.nodes[i] for i in path], settled
+
+
+def dijkstra_batch(graph, sources, max_workers=None):
+    """
+    Calcule les plus courts chemins depuis plusieurs sources en parallèle.
+    Génère des couples (source, distances) dès qu'ils sont prêts ; distances est un tableau
+    NumPy aligné sur list(graph.nodes), avec inf pour les sommets inaccessibles.
+    """
+    csr = graph_to_csr(graph)
+    missing = [source for source in sources if source not in csr.index]
+    if missing:
+        raise nx.NodeNotFound(f"Sommets sources absents du graphe : {missing}")
+
+    indices = [csr.index[source] for source in sources]
+    for source_index, row in dijkstra_batch_csr(csr, indices, max_workers=max_workers):
+        yield csr.nodes[source_index], row
+
+
+def dijkstra_distance_matrix(graph, sources, max_workers=None):
+    """
+    Matrice des distances (une ligne par source, dans l'ordre de `sources`).
+    """
+    sources = list(sources)
+    row_of = {}
+    for position, source in enumerate(sources):
+        row_of.setdefault(source, []).append(position)
+
+    matrix = np.empty((len(sources), graph.number_of_nodes()), dtype=np.float64)
+    for source, row in dijkstra_batch(graph, list(row_of), max_workers=max_workers):
+        matrix[row_of[source]] = row
+    return matrix
+
+
 def execute_dijkstra():
     """
     Interface utilisateur pour exécuter l'algorithme de Dijkstra.
     """
     try:
         # Demande le nombre de sommets et d'arêtes
-        num_nodes = int(simpledialog.askstring("Entrée", "Entrez le nombre de sommets du graphe (max 500) :"))
-        if num_nodes < 1 or num_nodes > 500:
-            raise ValueError("Le nombre de sommets doit être compris entre 1 et 500.")
+        num_nodes = int(simpledialog.askstring("Entrée", "Entrez le nombre de sommets du graphe :"))
+        if num_nodes < 1:
+            raise ValueError("Le nombre de sommets doit être au moins 1.")
 
         num_edges = int(simpledialog.askstring("Entrée", f"Entrez le nombre d'arêtes du graphe (max {num_nodes * (num_nodes - 1) // 2}) :"))
         if num_edges < 1 or num_edges > num_nodes * (num_nodes - 1) // 2:
@@ -29,25 +106,20 @@ def execute_dijkstra():
         messagebox.showerror("Erreur", "Entrées invalides. Veuillez entrer des valeurs correctes.")
         return
 
-    # Génération aléatoire du graphe
-    graph = nx.Graph()
-    graph.add_nodes_from(range(num_nodes))
-    edges = set()
-    while len(edges) < num_edges:
-        u, v = random.sample(range(num_nodes), 2)
-        weight = random.randint(1, 100)
-        if u != v and (u, v) not in edges and (v, u) not in edges:
-            edges.add((u, v))
-            graph.add_edge(u, v, weight=weight)
+    with instrumented_run("Dijkstra"):
+        # Génération aléatoire du graphe
+        with phase("build"):
+            graph = random_graph(num_nodes, num_edges, weight_range=(1, 100))
 
-    # Choisir un sommet source aléatoire
-    source = random.choice(list(graph.nodes))
+        # Choisir un sommet source aléatoire
+        source = random.choice(list(graph.nodes))
 
-    # Exécution de l'algorithme de Dijkstra
-    distances, paths = dijkstra_algorithm(graph, source)
+        # Exécution de l'algorithme de Dijkstra
+        with phase("solve"):
+            distances, paths = dijkstra_algorithm(graph, source)
 
-    # Affichage des résultats
-    afficher_resultats(graph, distances, paths, source)
+        # Affichage des résultats
+        afficher_resultats(graph, distances, paths, source)
 
 
 def afficher_resultats(graph, distances, paths, source):
@@ -75,22 +147,29 @@ def afficher_resultats(graph, distances, paths, source):
         row = f"{target:<15}{distance:<15}{path:<50}\n"
         text_widget.insert(END, row)
 
-    # Visualisation du graphe
-    pos = nx.spring_layout(graph)
+    # Visualisation du graphe (uniquement pour les graphes de taille raisonnable)
+    if graph.number_of_nodes() > MAX_DRAWN_NODES:
+        text_widget.insert(END, "\n" + finish_run())
+        return
+
+    with phase("layout"):
+        pos = nx.spring_layout(graph)
     edge_labels = nx.get_edge_attributes(graph, 'weight')
     node_colors = ["green" if node == source else "blue" for node in graph.nodes]
 
-    plt.figure(figsize=(12, 10))
-    nx.draw(
-        graph,
-        pos,
-        with_labels=True,
-        node_color=node_colors,
-        node_size=700,
-        font_weight="bold",
-        font_color="white",
-    )
-    nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=8)
-    plt.title(f"Graphe avec Dijkstra (Source : {source})")
+    with phase("render"):
+        plt.figure(figsize=(12, 10))
+        nx.draw(
+            graph,
+            pos,
+            with_labels=True,
+            node_color=node_colors,
+            node_size=700,
+            font_weight="bold",
+            font_color="white",
+        )
+        nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_size=8)
+        plt.title(f"Graphe avec Dijkstra (Source : {source})")
+    text_widget.insert(END, "\n" + annotate_figure(plt.gcf()))
     plt.show()
 
@@ -0,0 +1,175 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from algorithms.instrumentation import enabled, increment
+
+# Graphe CSR propre à chaque processus de calcul (transmis une seule fois par l'initialiseur)
+_worker_graph = None
+
+
+def _dijkstra_arrays(offsets, targets, weights, source):
+    """
+    Dijkstra avec tas binaire sur les tableaux d'un CSRGraph : seuls les voisins des sommets fixés
+    sont convertis en listes Python, au moment où ils sont relâchés.
+    Retourne les listes des distances, des prédécesseurs et des sommets dans l'ordre où ils sont fixés.
+    """
+    num_nodes = len(offsets) - 1
+    offsets = offsets.tolist()
+    inf = float("inf")
+    dist = [inf] * num_nodes
+    pred = [-1] * num_nodes
+    settled = [False] * num_nodes
+    order = []
+    dist[source] = 0
+    heap = [(0, source)]
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    while heap:
+        d, u = heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = True
+        order.append(u)
+        start, end = offsets[u], offsets[u + 1]
+        for v, w in zip(targets[start:end].tolist(), weights[start:end].tolist()):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heappush(heap, (nd, v))
+
+    return dist, pred, order
+
+
+def _check_weights(csr):
+    if len(csr.weights) and csr.weights.min() < 0:
+        raise ValueError("Dijkstra n'accepte pas les poids négatifs.")
+
+
+def _count_settled(csr, order):
+    # Chaque sommet fixé relâche tous ses arcs sortants
+    if enabled():
+        increment("settled_nodes", len(order))
+        increment("edge_relaxations", np.diff(csr.offsets)[order].sum())
+
+
+def dijkstra_csr(csr, source):
+    """
+    Plus courts chemins depuis l'indice `source` d'un CSRGraph.
+    Retourne le tableau des distances (inf si inaccessible) et celui des prédécesseurs (-1 sinon).
+    """
+    _check_weights(csr)
+    dist, pred, order = _dijkstra_arrays(csr.offsets, csr.targets, csr.weights, source)
+    _count_settled(csr, order)
+    return np.array(dist, dtype=np.float64), np.array(pred, dtype=np.int32)
+
+
+def dijkstra_paths_csr(csr, source):
+    """
+    Plus courts chemins depuis l'indice `source` d'un CSRGraph, au format networkx :
+    dictionnaires {sommet: distance} et {sommet: chemin}, triés par distance croissante.
+    Les chemins sont construits dans l'ordre où les sommets sont fixés (le prédécesseur d'abord).
+    """
+    _check_weights(csr)
+    dist, pred, order = _dijkstra_arrays(csr.offsets, csr.targets, csr.weights, source)
+    _count_settled(csr, order)
+
+    nodes = csr.nodes
+    convert = int if csr.weights.dtype.kind in "iu" else float
+    index_paths = [None] * len(nodes)
+    distances, paths = {}, {}
+    for i in order:
+        j = pred[i]
+        index_paths[i] = path = [nodes[i]] if j == -1 else index_paths[j] + [nodes[i]]
+        node = nodes[i]
+        distances[node] = convert(dist[i])
+        paths[node] = path
+    return distances, paths
+
+
+def predecessors_to_paths(csr, dist, pred):
+    """
+    Reconstruit les dictionnaires {sommet: distance} et {sommet: chemin} au format networkx,
+    triés par distance croissante.
+    """
+    reachable = np.flatnonzero(np.isfinite(dist))
+    reachable = reachable[np.argsort(dist[reachable], kind="stable")]
+    as_int = csr.weights.dtype.kind in "iu"
+
+    nodes = csr.nodes
+    pred_list = pred.tolist()
+    index_paths = {}
+    distances, paths = {}, {}
+
+    for i in reachable.tolist():
+        # Remonter jusqu'à un sommet dont le chemin est déjà connu
+        chain = []
+        j = i
+        while j != -1 and j not in index_paths:
+            chain.append(j)
+            j = pred_list[j]
+        prefix = index_paths[j] if j != -1 else []
+        for k in reversed(chain):
+            prefix = prefix + [nodes[k]]
+            index_paths[k] = prefix
+
+        distances[nodes[i]] = int(dist[i]) if as_int else float(dist[i])
+        paths[nodes[i]] = index_paths[i]
+
+    return distances, paths
+
+
+def _init_worker(offsets, targets, weights):
+    """
+    Initialise un processus de calcul : le graphe est reçu une seule fois puis réutilisé par toutes ses tâches.
+    """
+    global _worker_graph
+    _worker_graph = (offsets, targets, weights)
+
+
+def _solve_sources(sources, graph=None):
+    """
+    Résout un lot de sources sur `graph` (offsets, targets, weights), par défaut sur le graphe
+    reçu par le processus de calcul.
+    """
+    offsets, targets, weights = _worker_graph if graph is None else graph
+    rows = []
+    for source in sources:
+        dist, _, _ = _dijkstra_arrays(offsets, targets, weights, source)
+        rows.append((source, np.array(dist, dtype=np.float64)))
+    return rows
+
+
+def dijkstra_batch_csr(csr, sources, max_workers=None, chunk_size=None):
+    """
+    Génère les lignes (source, distances) pour plusieurs indices sources, au fur et à mesure
+    qu'elles sont calculées par un ProcessPoolExecutor. L'ordre des lignes n'est pas garanti.
+    """
+    _check_weights(csr)
+
+    sources = list(sources)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(sources)))
+
+    # Exécution séquentielle : inutile de démarrer des processus (ni de garder le graphe dans _worker_graph)
+    if max_workers == 1:
+        graph = (csr.offsets, csr.targets, csr.weights)
+        for source in sources:
+            yield from _solve_sources([source], graph)
+        return
+
+    # Quelques lots par processus pour équilibrer la charge sans multiplier les échanges
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(sources) // (max_workers * 4)))
+    chunks = [sources[i:i + chunk_size] for i in range(0, len(sources), chunk_size)]
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(csr.offsets, csr.targets, csr.weights),
+    ) as executor:
+        futures = [executor.submit(_solve_sources, chunk) for chunk in chunks]
+        for future in as_completed(futures):
+            yield from future.result()
@@ -1,12 +1,55 @@
 import networkx as nx
-import random
 from tkinter import simpledialog, messagebox
 import matplotlib.pyplot as plt
+import numpy as np
+from algorithms.generators import random_graph
+from algorithms.instrumentation import annotate_figure, instrumented_run, paused, phase
+from algorithms.maxflow_engine import max_flow_arrays
 
 
-def ford_fulkerson_algorithm(graph, source, sink):
+# Au-delà de ce nombre d'arcs, les chemins augmentants ne sont plus enregistrés pour l'affichage
+MAX_LOGGED_EDGES = 2000
+
+
+def ford_fulkerson_algorithm(graph, source, sink, method="dinic", record_paths=True):
     """
     Implémente l'algorithme de Ford-Fulkerson pour trouver le flux maximal dans un graphe.
+    method="dinic" (graphes de niveaux et flots bloquants) ou "push_relabel" utilisent le moteur
+    sur tableaux ; method="bfs" conserve la version d'origine. Avec le moteur, le graphe retourné
+    porte le flux de chaque arc ; les chemins augmentants ne sont enregistrés que si record_paths
+    est vrai (et jamais avec push_relabel, qui n'en utilise pas).
+    """
+    if method == "bfs":
+        return _ford_fulkerson_bfs(graph, source, sink)
+    if method not in ("dinic", "push_relabel"):
+        raise ValueError(f"Méthode inconnue : {method}")
+
+    nodes = list(graph.nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = list(graph.edges(data="capacity"))
+    sources = np.fromiter((index[u] for u, _, _ in edges), dtype=np.int64, count=len(edges))
+    targets = np.fromiter((index[v] for _, v, _ in edges), dtype=np.int64, count=len(edges))
+    capacities = np.array([capacity for _, _, capacity in edges])
+
+    max_flow, flows, index_paths = max_flow_arrays(
+        len(nodes), sources, targets, capacities, index[source], index[sink],
+        method=method, record_paths=record_paths,
+    )
+
+    flow_graph = nx.DiGraph()
+    flow_graph.add_nodes_from(nodes)
+    flow_graph.add_edges_from(
+        (u, v, {"capacity": capacity, "flow": flow}) for (u, v, capacity), flow in zip(edges, flows.tolist())
+    )
+    paths_taken = [
+        ([(nodes[u], nodes[v]) for u, v in path], path_flow) for path, path_flow in (index_paths or [])
+    ]
+    return max_flow, flow_graph, paths_taken
+
+
+def _ford_fulkerson_bfs(graph, source, sink):
+    """
+    Version d'origine : chemins augmentants par BFS sur une copie du graphe, conservée pour comparaison.
     """
     residual_graph = graph.copy()
     for u, v, data in residual_graph.edges(data=True):
@@ -76,25 +119,26 @@ def execute_ford_fulkerson():
         messagebox.showerror("Erreur", "Entrées invalides. Veuillez entrer des entiers valides.")
         return
 
-    # Générer un graphe orienté aléatoire
-    graph = nx.DiGraph()
-    graph.add_nodes_from(range(num_nodes))
-    edges = set()
-    while len(edges) < num_edges:
-        u, v = random.sample(range(num_nodes), 2)
-        if u != v:
-            capacity = random.randint(5, 20)
-            edges.add((u, v))
-            graph.add_edge(u, v, capacity=capacity)
+    with instrumented_run("Ford-Fulkerson"):
+        # Générer un graphe orienté aléatoire
+        try:
+            with phase("build"):
+                graph = random_graph(num_nodes, num_edges, directed=True, weight_range=(5, 20), weight="capacity")
+        except ValueError as e:
+            messagebox.showerror("Erreur", str(e))
+            return
 
-    source = 0
-    sink = num_nodes - 1
+        source = 0
+        sink = num_nodes - 1
 
-    # Exécution de l'algorithme de Ford-Fulkerson
-    max_flow, residual_graph, paths_taken = ford_fulkerson_algorithm(graph, source, sink)
+        # Exécution de l'algorithme de Ford-Fulkerson
+        with phase("solve"):
+            max_flow, residual_graph, paths_taken = ford_fulkerson_algorithm(
+                graph, source, sink, record_paths=num_edges <= MAX_LOGGED_EDGES
+            )
 
-    # Affichage des résultats
-    afficher_resultats(graph, residual_graph, max_flow, source, sink, paths_taken)
+        # Affichage des résultats
+        afficher_resultats(graph, residual_graph, max_flow, source, sink, paths_taken)
 
 
 def afficher_resultats(graph, residual_graph, max_flow, source, sink, paths_taken):
@@ -111,43 +155,47 @@ def afficher_resultats(graph, residual_graph, max_flow, source, sink, paths_take
         path_str = " -> ".join(f"{u}->{v}" for u, v in path)
         result += f"Chemin {i} : {path_str} avec flux = {path_flow}\n"
 
-    messagebox.showinfo("Résultats Ford-Fulkerson", result)
+    with paused():
+        messagebox.showinfo("Résultats Ford-Fulkerson", result)
 
     # Visualisation des graphes
-    pos = nx.spring_layout(graph)
+    with phase("layout"):
+        pos = nx.spring_layout(graph)
     edge_labels = {
         (u, v): f"{data.get('flow', 0)}/{data['capacity']}" for u, v, data in residual_graph.edges(data=True)
     }
 
-    # Premier graphe : Graphe principal avec flux
-    plt.figure(figsize=(14, 10))
-    plt.subplot(2, 1, 1)
-    nx.draw(
-        graph,
-        pos,
-        with_labels=True,
-        node_color="lightblue",
-        node_size=700,
-        font_weight="bold",
-    )
-    nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_color="red")
-    plt.title(f"Graphe Résiduel - Flux Maximal: {max_flow}")
-
-    # Deuxième graphe : Graphe avec chemin optimal
-    plt.subplot(2, 1, 2)
-    path_edges = [edge for path, _ in paths_taken for edge in path]
-    edge_colors = ["red" if edge in path_edges else "black" for edge in residual_graph.edges]
-    nx.draw(
-        residual_graph,
-        pos,
-        with_labels=True,
-        node_color="lightgreen",
-        node_size=700,
-        edge_color=edge_colors,
-        edge_cmap=plt.cm.Reds,
-        font_weight="bold",
-    )
-    nx.draw_networkx_edge_labels(residual_graph, pos, edge_labels=edge_labels, font_color="red")
-    plt.title("Chemins augmentants (en rouge)")
-    plt.tight_layout()
+    with phase("render"):
+        # Premier graphe : Graphe principal avec flux
+        plt.figure(figsize=(14, 10))
+        plt.subplot(2, 1, 1)
+        nx.draw(
+            graph,
+            pos,
+            with_labels=True,
+            node_color="lightblue",
+            node_size=700,
+            font_weight="bold",
+        )
+        nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels, font_color="red")
+        plt.title(f"Graphe Résiduel - Flux Maximal: {max_flow}")
+
+        # Deuxième graphe : Graphe avec chemin optimal
+        plt.subplot(2, 1, 2)
+        path_edges = [edge for path, _ in paths_taken for edge in path]
+        edge_colors = ["red" if edge in path_edges else "black" for edge in residual_graph.edges]
+        nx.draw(
+            residual_graph,
+            pos,
+            with_labels=True,
+            node_color="lightgreen",
+            node_size=700,
+            edge_color=edge_colors,
+            edge_cmap=plt.cm.Reds,
+            font_weight="bold",
+        )
+        nx.draw_networkx_edge_labels(residual_graph, pos, edge_labels=edge_labels, font_color="red")
+        plt.title("Chemins augmentants (en rouge)")
+        plt.tight_layout()
+    annotate_figure(plt.gcf())
     plt.show()
@@ -0,0 +1,272 @@
+import networkx as nx
+import numpy as np
+from algorithms.welsh_powell_engine import set_adjacency_bits
+
+
+def max_edges(num_nodes, directed=False):
+    """
+    Nombre maximal d'arêtes d'un graphe simple (sans boucle ni arête multiple).
+    """
+    return num_nodes * (num_nodes - 1) // (1 if directed else 2)
+
+
+def _decode_undirected(indices, num_nodes):
+    """
+    Convertit des indices de paires {i < j} (ordre ligne par ligne du triangle supérieur) en couples (i, j).
+    """
+    n = num_nodes
+    # Ligne i : premier indice i * (2n - i - 1) / 2, obtenu en inversant la formule triangulaire
+    rows = np.floor(((2 * n - 1) - np.sqrt((2 * n - 1) ** 2 - 8 * indices.astype(np.float64))) / 2).astype(np.int64)
+    rows = np.clip(rows, 0, max(n - 2, 0))
+
+    # Corriger les erreurs d'arrondi de la racine carrée
+    start = rows * (2 * n - rows - 1) // 2
+    too_far = start > indices
+    rows[too_far] -= 1
+    start = rows * (2 * n - rows - 1) // 2
+    next_start = (rows + 1) * (2 * n - rows - 2) // 2
+    too_short = indices >= next_start
+    rows[too_short] += 1
+    start = rows * (2 * n - rows - 1) // 2
+
+    cols = indices - start + rows + 1
+    return rows, cols
+
+
+def _decode_directed(indices, num_nodes):
+    """
+    Convertit des indices d'arcs (i, j), i != j, en couples : n - 1 cibles possibles par origine.
+    """
+    rows = indices // (num_nodes - 1)
+    cols = indices % (num_nodes - 1)
+    cols += cols >= rows  # Sauter la boucle (i, i)
+    return rows, cols
+
+
+def _skip_sample(limit, probability, rng, batch_size=1 << 20):
+    """
+    Échantillonnage G(n, p) par sauts géométriques : chaque indice de [0, limit) est retenu avec
+    probabilité `probability`, sans parcourir les indices écartés. Mémoire proportionnelle aux indices retenus.
+    """
+    chunks = []
+    position = -1
+    while True:
+        gaps = rng.geometric(probability, size=batch_size)
+        indices = position + np.cumsum(gaps)
+        kept = indices[indices < limit]
+        chunks.append(kept)
+        if len(kept) < batch_size:
+            break
+        position = kept[-1]
+    return np.concatenate(chunks)
+
+
+def _sample_pair_indices(limit, count, rng):
+    """
+    Tire `count` indices distincts et uniformes dans [0, limit).
+    Peu d'indices : algorithme de Floyd (rng.choice). Beaucoup d'indices : sauts géométriques avec une
+    probabilité légèrement supérieure, puis sous-échantillonnage uniforme au nombre exact, pour ne jamais
+    allouer un tableau de taille limit.
+    """
+    if count == 0:
+        return np.zeros(0, dtype=np.int64)
+    if count * 50 < limit:
+        return rng.choice(limit, size=count, replace=False).astype(np.int64)
+
+    probability = min(1.0, (count + 4 * np.sqrt(count) + 10) / limit)
+    while True:
+        indices = _skip_sample(limit, probability, rng, batch_size=min(1 << 20, count + 1))
+        if len(indices) >= count:
+            break
+    if len(indices) > count:
+        # Le surplus est faible (quelques écarts-types) : on retire des positions tirées uniformément
+        indices = np.delete(indices, rng.choice(len(indices), size=len(indices) - count, replace=False))
+    return indices
+
+
+def _decode_pairs(indices, num_nodes, directed, chunk_size=1 << 20):
+    """
+    Décode des indices de paires par blocs dans des tableaux int32 (int64 au-delà de 2**31 sommets),
+    pour que les tableaux intermédiaires restent de la taille d'un bloc.
+    """
+    dtype = np.int32 if num_nodes < 2**31 else np.int64
+    sources = np.empty(len(indices), dtype=dtype)
+    targets = np.empty(len(indices), dtype=dtype)
+    decode = _decode_directed if directed else _decode_undirected
+    for start in range(0, len(indices), chunk_size):
+        block = slice(start, start + chunk_size)
+        sources[block], targets[block] = decode(indices[block], num_nodes)
+    return sources, targets
+
+
+def random_edge_arrays(num_nodes, num_edges, directed=False, weight_range=(1, 100), seed=None):
+    """
+    Tire num_edges arêtes distinctes sans rejet : des indices uniques sont tirés dans
+    [0, max_edges) puis décodés en couples de sommets, en O(num_edges).
+    weight_range est un intervalle inclusif d'entiers, ou de réels si l'une des bornes est réelle.
+    Retourne les tableaux (origines, destinations, poids).
+    """
+    limit = max_edges(num_nodes, directed)
+    if num_nodes < 1 or num_edges < 0 or num_edges > limit:
+        raise ValueError(
+            f"Impossible de générer {num_edges} arêtes distinctes sur {num_nodes} sommets (maximum {limit})."
+        )
+
+    rng = np.random.default_rng(seed)
+    sources, targets = _decode_pairs(_sample_pair_indices(limit, num_edges, rng), num_nodes, directed)
+
+    low, high = weight_range
+    if isinstance(low, float) or isinstance(high, float):
+        weights = rng.uniform(low, high, size=num_edges)
+    else:
+        weights = rng.integers(low, high, size=num_edges, endpoint=True)
+
+    return sources, targets, weights
+
+
+def random_graph(num_nodes, num_edges, directed=False, weight_range=(1, 100), weight="weight",
+                 seed=None, as_arrays=False):
+    """
+    Génère un graphe aléatoire pondéré, sous forme networkx (par défaut) ou de tableaux d'arêtes.
+    """
+    sources, targets, weights = random_edge_arrays(
+        num_nodes, num_edges, directed=directed, weight_range=weight_range, seed=seed
+    )
+    if as_arrays:
+        return sources, targets, weights
+
+    graph = nx.DiGraph() if directed else nx.Graph()
+    graph.add_nodes_from(range(num_nodes))
+    graph.add_weighted_edges_from(zip(sources.tolist(), targets.tolist(), weights.tolist()), weight=weight)
+    return graph
+
+
+def dense_edge_arrays(num_nodes, density=0.5, seed=None):
+    """
+    Arêtes d'un graphe non orienté contenant int(density * n(n-1)/2) paires distinctes, tirées par
+    arithmétique d'indices : aucune liste de toutes les paires n'est construite et la mémoire
+    reste proportionnelle aux arêtes retenues. Retourne les tableaux (origines, destinations).
+    """
+    if not 0 <= density <= 1:
+        raise ValueError("La densité doit être comprise entre 0 et 1.")
+    limit = max_edges(num_nodes)
+    rng = np.random.default_rng(seed)
+    return _decode_pairs(_sample_pair_indices(limit, int(limit * density), rng), num_nodes, directed=False)
+
+
+def dense_bitset(num_nodes, density=0.5, seed=None, chunk_size=1 << 20):
+    """
+    Même tirage que dense_edge_arrays, écrit directement dans une matrice d'adjacence en bitsets
+    (n × ceil(n / 8) octets, symétrique), bloc par bloc, sans conserver les tableaux d'arêtes.
+    """
+    if not 0 <= density <= 1:
+        raise ValueError("La densité doit être comprise entre 0 et 1.")
+    limit = max_edges(num_nodes)
+    rng = np.random.default_rng(seed)
+    indices = _sample_pair_indices(limit, int(limit * density), rng)
+
+    rows = np.zeros((num_nodes, (num_nodes + 7) // 8), dtype=np.uint8)
+    for start in range(0, len(indices), chunk_size):
+        set_adjacency_bits(rows, *_decode_undirected(indices[start:start + chunk_size], num_nodes))
+    return rows
+
+
+def gnp_edge_arrays(num_nodes, probability, directed=False, seed=None):
+    """
+    Graphe G(n, p) : chaque paire est présente indépendamment avec probabilité p (sauts géométriques).
+    """
+    if not 0 <= probability <= 1:
+        raise ValueError("La probabilité doit être comprise entre 0 et 1.")
+    limit = max_edges(num_nodes, directed)
+    rng = np.random.default_rng(seed)
+    indices = _skip_sample(limit, probability, rng) if probability > 0 and limit else np.zeros(0, dtype=np.int64)
+    return _decode_pairs(indices, num_nodes, directed)
+
+
+# --- Familles d'instances (graines fixes : une instance ne dépend que de la graine et de ses paramètres) ---
+
+def _seed(seed, *params):
+    """
+    Graine d'une instance, dérivée de la graine globale et de ses paramètres numériques.
+    """
+    return [seed, *(int(p * 1000) if isinstance(p, float) else int(p) for p in params)]
+
+
+def sparse_graph_instance(n, m, seed, directed=False, weight="weight"):
+    """
+    Graphe aléatoire à n sommets et m arêtes distinctes, poids entiers dans [1, 100].
+    """
+    return {"graph": random_graph(n, m, directed=directed, weight=weight, seed=_seed(seed, n, m)), "source": 0}
+
+
+def negative_graph_instance(n, m, seed):
+    """
+    Graphe orienté avec des poids négatifs mais sans cycle négatif : w(u, v) = c + p[u] - p[v],
+    avec c dans [1, 100] et des potentiels p dans [0, 150].
+    """
+    sources, targets, costs = random_edge_arrays(n, m, directed=True, seed=_seed(seed, n, m))
+    potential = np.random.default_rng(_seed(seed, n, m, 1)).integers(0, 150, size=n)
+    weights = costs + potential[sources] - potential[targets]
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(n))
+    graph.add_weighted_edges_from(zip(sources.tolist(), targets.tolist(), weights.tolist()))
+    return {"graph": graph, "source": 0}
+
+
+def flow_network_instance(n, m, seed):
+    """
+    Réseau orienté à capacités entières dans [1, 100], de la source 0 au puits n - 1.
+    """
+    graph = random_graph(n, m, directed=True, weight="capacity", seed=_seed(seed, n, m))
+    return {"graph": graph, "source": 0, "sink": n - 1}
+
+
+def dense_graph_instance(n, density, seed):
+    """
+    Graphe non orienté contenant une fraction `density` de toutes les paires de sommets.
+    """
+    sources, targets = dense_edge_arrays(n, density, seed=_seed(seed, n, density))
+    graph = nx.Graph()
+    graph.add_nodes_from(range(n))
+    graph.add_edges_from(zip(sources.tolist(), targets.tolist()))
+    return {"graph": graph}
+
+
+def gnp_graph_instance(n, probability, seed):
+    """
+    Graphe non orienté G(n, p) : chaque paire de sommets est présente avec probabilité `probability`.
+    """
+    sources, targets = gnp_edge_arrays(n, probability, seed=_seed(seed, n, probability))
+    graph = nx.Graph()
+    graph.add_nodes_from(range(n))
+    graph.add_edges_from(zip(sources.tolist(), targets.tolist()))
+    return {"graph": graph}
+
+
+def project_instance(n, seed):
+    """
+    Projet de n tâches (numérotées à partir de 1) : chaque tâche a 1 à 3 prédécesseurs parmi les
+    tâches précédentes, comme potentiel_metra.generate_random_graph, avec des durées dans [1, 10].
+    """
+    rng = np.random.default_rng(_seed(seed, n))
+    task = np.arange(1, n)
+    count = np.minimum(rng.integers(1, 4, size=n - 1), task)
+    picks = (rng.random((n - 1, 3)) * task[:, None]).astype(np.int64)
+    keep = np.arange(3) < count[:, None]
+    pairs = np.unique(np.stack([picks[keep], np.broadcast_to(task[:, None], picks.shape)[keep]], axis=1), axis=0)
+    weights = rng.integers(1, 11, size=len(pairs))
+    nodes = list(range(1, n + 1))
+    edges = [(u + 1, v + 1, w) for (u, v), w in zip(pairs.tolist(), weights.tolist())]
+    return {"nodes": nodes, "edges": edges}
+
+
+def transport_instance(rows, cols, seed):
+    """
+    Problème de transport équilibré rows × cols : offres dans [10, 100], demandes positives de même
+    total tirées au hasard, coûts entiers dans [1, 100].
+    """
+    rng = np.random.default_rng(_seed(seed, rows, cols))
+    supply = rng.integers(10, 101, size=rows)
+    demand = 1 + rng.multinomial(supply.sum() - cols, np.full(cols, 1 / cols))
+    costs = rng.integers(1, 101, size=(rows, cols))
+    return {"supply": supply, "demand": demand, "costs": costs}
@@ -0,0 +1,245 @@
+import contextlib
+import json
+import logging
+import time
+import tracemalloc
+
+# Mesures par exécution : durées des phases, compteurs d'opérations et, sur demande, pic mémoire.
+# Le suivi tracemalloc ralentit fortement les allocations (x3 à x5) : les durées d'une exécution
+# suivie ne sont pas significatives et ne sont ni affichées ni journalisées.
+# Hors d'une exécution instrumentée, phase() retourne un contexte vide partagé et increment()
+# s'arrête au test `_active is None` : le coût est négligeable dans les moteurs.
+
+logger = logging.getLogger(__name__)
+
+# Exécution en cours de mesure (None : aucune)
+_active = None
+# Dernière exécution terminée
+_last = None
+_settings = {"enabled": True, "trace_memory": False}
+_NO_PHASE = contextlib.nullcontext()
+
+PHASE_LABELS = {
+    "build": "Construction du graphe",
+    "solve": "Résolution",
+    "layout": "Disposition",
+    "render": "Rendu",
+}
+
+COUNTER_LABELS = {
+    "edge_relaxations": "Relâchements d'arcs",
+    "relaxation_rounds": "Tours de relâchement",
+    "settled_nodes": "Sommets fixés",
+    "augmenting_paths": "Chemins augmentants",
+    "blocking_flow_phases": "Phases de flot bloquant",
+    "relabels": "Ré-étiquetages",
+    "pivots": "Pivots",
+    "color_passes": "Passes de coloriage",
+    "levels": "Niveaux",
+}
+
+
+def configure(enabled=None, trace_memory=None):
+    """
+    Active ou désactive les mesures, et le suivi du pic mémoire par tracemalloc (désactivé par défaut :
+    il ralentit les allocations, et les durées ne sont alors plus mesurées).
+    """
+    if enabled is not None:
+        _settings["enabled"] = bool(enabled)
+    if trace_memory is not None:
+        _settings["trace_memory"] = bool(trace_memory)
+
+
+def enabled():
+    """
+    Vrai si une exécution est en cours de mesure (pour ne calculer un compteur coûteux qu'à ce moment).
+    """
+    return _active is not None
+
+
+class RunRecord:
+    """
+    Mesures d'une exécution : durée totale, durée cumulée de chaque phase, compteurs et pic mémoire
+    (octets alloués, NumPy compris ; None sans suivi mémoire). Sous tracemalloc, les durées valent None.
+    """
+
+    def __init__(self, name, trace_memory=False):
+        self.name = name
+        self.phases = {}
+        self.counters = {}
+        self.total_time = None
+        self.peak_memory = None
+        # Un suivi tracemalloc déjà actif (banc d'essai) n'est ni démarré ni arrêté ici
+        self._trace_memory = trace_memory and not tracemalloc.is_tracing()
+        self._previous = None
+        self._started = None
+        self._paused = 0.0
+        self._stopped = False
+
+    def start(self):
+        """
+        Démarre la mesure : l'exécution devient l'exécution en cours.
+        """
+        global _active
+        self._previous, _active = _active, self
+        if self._trace_memory:
+            tracemalloc.start()
+        self._started = time.perf_counter()
+        return self
+
+    def stop(self):
+        """
+        Arrête la mesure (sans effet si elle est déjà arrêtée) et journalise l'enregistrement.
+        """
+        global _active, _last
+        if self._stopped:
+            return self
+        self._stopped = True
+        if tracemalloc.is_tracing():
+            # Durées faussées par le suivi mémoire (le nôtre ou celui de l'appelant) : non rapportées
+            self.phases = {}
+        else:
+            self.total_time = time.perf_counter() - self._started - self._paused
+        if self._trace_memory:
+            _, self.peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        if _active is self:
+            _active = self._previous
+        _last = self
+        logger.info("%s", json.dumps(self.as_dict(), ensure_ascii=False))
+        return self
+
+    def as_dict(self):
+        """
+        Enregistrement structuré (sérialisable en JSON), pour la journalisation.
+        """
+        return {
+            "algorithm": self.name,
+            "total_time": self.total_time,
+            "phases": dict(self.phases),
+            "counters": dict(self.counters),
+            "peak_memory": self.peak_memory,
+        }
+
+    def summary(self):
+        """
+        Résumé lisible des mesures, affiché dans les fenêtres de résultats.
+        """
+        if self.total_time is None:
+            lines = [f"Mesures ({self.name}) : durées non mesurées (suivi mémoire actif)"]
+        else:
+            lines = [f"Mesures ({self.name}) : {_format_time(self.total_time)} au total"]
+        lines += [f"  {PHASE_LABELS.get(name, name)} : {_format_time(elapsed)}" for name, elapsed in self.phases.items()]
+        lines += [f"  {COUNTER_LABELS.get(name, name)} : {value:,}".replace(",", " ") for name, value in self.counters.items()]
+        if self.peak_memory is not None:
+            lines.append(f"  Pic mémoire : {_format_size(self.peak_memory)}")
+        return "\n".join(lines)
+
+
+def _format_time(seconds):
+    if seconds is None:
+        return "-"
+    return f"{seconds * 1000:.1f} ms" if seconds < 1 else f"{seconds:.2f} s"
+
+
+def _format_size(size):
+    return f"{size / 2**10:.1f} Kio" if size < 2**20 else f"{size / 2**20:.1f} Mio"
+
+
+class _Phase:
+    """
+    Chronomètre d'une phase : la durée est ajoutée à celle de la phase du même nom
+    (écartée à l'arrêt si l'exécution était suivie par tracemalloc).
+    """
+
+    __slots__ = ("record", "name", "started")
+
+    def __init__(self, record, name):
+        self.record = record
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.started
+        self.record.phases[self.name] = self.record.phases.get(self.name, 0.0) + elapsed
+        return False
+
+
+def phase(name):
+    """
+    Contexte mesurant une phase ("build", "solve", "layout", "render"...) de l'exécution en cours.
+    """
+    record = _active
+    if record is None:
+        return _NO_PHASE
+    return _Phase(record, name)
+
+
+@contextlib.contextmanager
+def paused():
+    """
+    Exclut de la durée totale le temps passé dans le contexte (boîte de dialogue modale, par exemple).
+    """
+    record = _active
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if record is not None:
+            record._paused += time.perf_counter() - started
+
+
+def increment(name, amount=1):
+    """
+    Ajoute `amount` au compteur `name` de l'exécution en cours.
+    """
+    record = _active
+    if record is not None:
+        record.counters[name] = record.counters.get(name, 0) + int(amount)
+
+
+@contextlib.contextmanager
+def instrumented_run(name, trace_memory=None):
+    """
+    Mesure une exécution complète. Produit l'enregistrement (None si les mesures sont désactivées),
+    arrêté à la sortie du contexte s'il ne l'a pas été avant par finish_run().
+    """
+    if not _settings["enabled"]:
+        yield None
+        return
+    record = RunRecord(name, _settings["trace_memory"] if trace_memory is None else trace_memory).start()
+    try:
+        yield record
+    finally:
+        record.stop()
+
+
+def finish_run():
+    """
+    Arrête l'exécution en cours, avant un affichage bloquant (plt.show, boîte de dialogue),
+    et retourne son résumé ("" sans exécution mesurée).
+    """
+    record = _active
+    if record is None:
+        return ""
+    return record.stop().summary()
+
+
+def annotate_figure(figure):
+    """
+    Arrête l'exécution en cours et écrit son résumé en bas à gauche d'une figure Matplotlib.
+    """
+    text = finish_run()
+    if text:
+        figure.text(0.01, 0.01, text, fontsize=8, family="monospace", va="bottom", alpha=0.8)
+    return text
+
+
+def last_record():
+    """
+    Enregistrement de la dernière exécution terminée (None s'il n'y en a pas).
+    """
+    return _last
@@ -0,0 +1,57 @@
+import os
+import tempfile
+import numpy as np
+from algorithms.bellman_ford_engine import bellman_ford_arrays
+from algorithms.csr import edges_to_csr
+from algorithms.dijkstra_engine import dijkstra_batch_csr
+
+
+def johnson_potentials(num_nodes, sources, targets, weights):
+    """
+    Potentiels de Johnson : distances depuis une source virtuelle reliée à tous les sommets par un arc de poids 0.
+    Lève NegativeCycleError si le graphe contient un cycle négatif.
+    """
+    virtual = num_nodes
+    all_sources = np.concatenate([np.asarray(sources, dtype=np.int64), np.full(num_nodes, virtual)])
+    all_targets = np.concatenate([np.asarray(targets, dtype=np.int64), np.arange(num_nodes)])
+    all_weights = np.concatenate([np.asarray(weights, dtype=np.float64), np.zeros(num_nodes)])
+    dist, _ = bellman_ford_arrays(num_nodes + 1, all_sources, all_targets, all_weights, virtual)
+    return dist[:num_nodes]
+
+
+def johnson_arrays(num_nodes, sources, targets, weights, path=None, max_workers=None):
+    """
+    Plus courts chemins entre tous les couples (algorithme de Johnson) :
+    un seul Bellman-Ford pour les potentiels, puis n Dijkstra en parallèle sur les poids repondérés.
+    Le résultat est une matrice n × n projetée en mémoire (fichier .npy) remplie ligne par ligne :
+    elle n'a jamais besoin de tenir entièrement en RAM. inf indique un couple sans chemin.
+    Sans `path`, le fichier est créé dans le répertoire temporaire (matrix.filename) : il n'est pas
+    supprimé automatiquement, c'est à l'appelant de l'effacer.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    potentials = johnson_potentials(num_nodes, sources, targets, weights)
+
+    # w'(u, v) = w(u, v) + h(u) - h(v) >= 0 ; on écarte les résidus d'arrondi négatifs
+    reweighted = np.asarray(weights, dtype=np.float64) + potentials[sources] - potentials[targets]
+    np.maximum(reweighted, 0, out=reweighted)
+    csr = edges_to_csr(num_nodes, sources, targets, reweighted)
+
+    temporary = path is None
+    if temporary:
+        descriptor, path = tempfile.mkstemp(suffix=".npy")
+        os.close(descriptor)
+    try:
+        matrix = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(num_nodes, num_nodes))
+
+        # d(s, v) = d'(s, v) - h(s) + h(v)
+        for source, row in dijkstra_batch_csr(csr, range(num_nodes), max_workers=max_workers):
+            matrix[source] = row - potentials[source] + potentials
+    except BaseException:
+        # Fichier temporaire inachevé : personne d'autre ne pourrait le supprimer
+        if temporary:
+            os.remove(path)
+        raise
+
+    matrix.flush()
+    return matrix
@@ -1,12 +1,55 @@
 import networkx as nx
-import random
 from tkinter import simpledialog, messagebox
 import matplotlib.pyplot as plt
+import numpy as np
+from algorithms.generators import random_graph
+from algorithms.instrumentation import annotate_figure, instrumented_run, paused, phase
+from algorithms.boruvka_engine import boruvka_arrays
+from algorithms.csr import graph_to_csr
+from algorithms.kruskal_engine import kruskal_arrays
 
 
-def kruskal_algorithm(graph):
+def kruskal_algorithm(graph, method="arrays", max_workers=None):
     """
     Implémente l'algorithme de Kruskal pour trouver l'arbre couvrant minimal (MST).
+    method="arrays" utilise le moteur NumPy / Union-Find, method="boruvka" la variante
+    parallèle de Borůvka (même résultat), method="python" la version d'origine.
+    Retourne (mst, arêtes du MST, poids total, arêtes du graphe). Avec les moteurs sur tableaux, les arêtes
+    du graphe sont la vue graph.edges(data=True), parcourue seulement si l'appelant en a besoin.
+    """
+    if method == "python":
+        return _kruskal_python(graph)
+    if method not in ("arrays", "boruvka"):
+        raise ValueError(f"Méthode inconnue : {method}")
+
+    # Tableaux lus directement dans la liste d'adjacence (sans liste de tuples d'arêtes). Dans un graphe
+    # non orienté, chaque arête y figure deux fois : on garde le sens u <= v, celui de graph.edges.
+    csr = graph_to_csr(graph)
+    nodes = csr.nodes
+    sources = np.repeat(np.arange(len(nodes)), np.diff(csr.offsets))
+    targets, weights = csr.targets, csr.weights
+    if not graph.is_directed():
+        keep = sources <= targets
+        sources, targets, weights = sources[keep], targets[keep], weights[keep]
+
+    if method == "boruvka":
+        accepted, total_weight = boruvka_arrays(len(nodes), sources, targets, weights, max_workers=max_workers)
+    else:
+        accepted, total_weight = kruskal_arrays(len(nodes), sources, targets, weights)
+
+    mst = nx.Graph()
+    mst.add_nodes_from(graph.nodes)
+    mst_edges = [
+        (nodes[u], nodes[v], w)
+        for u, v, w in zip(sources[accepted].tolist(), targets[accepted].tolist(), weights[accepted].tolist())
+    ]
+    mst.add_weighted_edges_from(mst_edges)
+    return mst, mst_edges, total_weight, graph.edges(data=True)
+
+
+def _kruskal_python(graph):
+    """
+    Version d'origine de Kruskal (tri Python et Union-Find récursif), conservée pour comparaison.
     """
     # Trier les arêtes par poids croissant
     edges = sorted(graph.edges(data=True), key=lambda x: x[2]["weight"])
@@ -57,35 +100,36 @@ def execute_kruskal():
         messagebox.showerror("Erreur", "Entrées invalides. Veuillez entrer des entiers valides.")
         return
 
-    # Génération aléatoire du graphe
-    graph = nx.Graph()
-    graph.add_nodes_from(range(num_nodes))
-    edges = set()
-    while len(edges) < num_edges:
-        u, v = random.sample(range(num_nodes), 2)
-        weight = random.randint(1, 20)
-        if u != v and (u, v) not in edges and (v, u) not in edges:
-            edges.add((u, v))
-            graph.add_edge(u, v, weight=weight)
+    with instrumented_run("Kruskal"):
+        # Génération aléatoire du graphe
+        try:
+            with phase("build"):
+                graph = random_graph(num_nodes, num_edges, weight_range=(1, 20))
+        except ValueError as e:
+            messagebox.showerror("Erreur", str(e))
+            return
 
-    # Exécution de l'algorithme de Kruskal
-    mst, mst_edges, total_weight, all_edges = kruskal_algorithm(graph)
+        # Exécution de l'algorithme de Kruskal
+        with phase("solve"):
+            mst, mst_edges, total_weight, all_edges = kruskal_algorithm(graph)
 
-    # Affichage des résultats
-    result = f"Arbre couvrant minimal (Poids total : {total_weight}):\n"
-    for u, v, weight in mst_edges:
-        result += f"Arête ({u}, {v}) avec poids {weight}\n"
-    messagebox.showinfo("Résultats Kruskal", result)
+        # Affichage des résultats
+        result = f"Arbre couvrant minimal (Poids total : {total_weight}):\n"
+        for u, v, weight in mst_edges:
+            result += f"Arête ({u}, {v}) avec poids {weight}\n"
+        with paused():
+            messagebox.showinfo("Résultats Kruskal", result)
 
-    # Visualisation du graphe
-    afficher_graphe(graph, mst, all_edges, total_weight)
+        # Visualisation du graphe
+        afficher_graphe(graph, mst, all_edges, total_weight)
 
 
 def afficher_graphe(graph, mst, all_edges, total_weight):
     """
     Affiche le graphe original et l'arbre couvrant minimal (MST) obtenu.
     """
-    pos = nx.spring_layout(graph)
+    with phase("layout"):
+        pos = nx.spring_layout(graph)
 
     # Coloration des arêtes
     edge_colors = [
@@ -93,31 +137,33 @@ def afficher_graphe(graph, mst, all_edges, total_weight):
         for u, v, _ in all_edges
     ]
 
-    plt.figure(figsize=(10, 8))
-    # Graphe complet
-    nx.draw(
-        graph,
-        pos,
-        with_labels=True,
-        node_color="lightblue",
-        node_size=700,
-        font_weight="bold",
-    )
-    edge_labels = nx.get_edge_attributes(graph, "weight")
-    nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels)
-    # Dessiner les arêtes avec les couleurs appropriées
-    nx.draw_networkx_edges(graph, pos, edgelist=all_edges, edge_color=edge_colors, width=2)
-
-    # Arbre couvrant minimal
-    nx.draw(
-        mst,
-        pos,
-        with_labels=True,
-        node_color="lightgreen",
-        node_size=700,
-        font_weight="bold",
-    )
-    nx.draw_networkx_edge_labels(mst, pos, edge_labels=nx.get_edge_attributes(mst, "weight"))
-
-    plt.title(f"Arbre couvrant minimal (Poids total : {total_weight})")
+    with phase("render"):
+        plt.figure(figsize=(10, 8))
+        # Graphe complet
+        nx.draw(
+            graph,
+            pos,
+            with_labels=True,
+            node_color="lightblue",
+            node_size=700,
+            font_weight="bold",
+        )
+        edge_labels = nx.get_edge_attributes(graph, "weight")
+        nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels)
+        # Dessiner les arêtes avec les couleurs appropriées
+        nx.draw_networkx_edges(graph, pos, edgelist=all_edges, edge_color=edge_colors, width=2)
+
+        # Arbre couvrant minimal
+        nx.draw(
+            mst,
+            pos,
+            with_labels=True,
+            node_color="lightgreen",
+            node_size=700,
+            font_weight="bold",
+        )
+        nx.draw_networkx_edge_labels(mst, pos, edge_labels=nx.get_edge_attributes(mst, "weight"))
+
+        plt.title(f"Arbre couvrant minimal (Poids total : {total_weight})")
+    annotate_figure(plt.gcf())
     plt.show()
@@ -0,0 +1,94 @@
+import numpy as np
+
+
+class UnionFind:
+    """
+    Union-Find sur tableaux int32 : union par rang et compression par division de chemin (itérative).
+    """
+
+    def __init__(self, num_nodes):
+        self.parent = np.arange(num_nodes, dtype=np.int32)
+        self.rank = np.zeros(num_nodes, dtype=np.int8)
+
+    def find(self, node):
+        """
+        Représentant de l'ensemble de node (sans récursion).
+        """
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(self, node1, node2):
+        """
+        Réunit les ensembles de node1 et node2 ; retourne False s'ils étaient déjà réunis.
+        """
+        root1, root2 = self.find(node1), self.find(node2)
+        if root1 == root2:
+            return False
+        if self.rank[root1] < self.rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if self.rank[root1] == self.rank[root2]:
+            self.rank[root1] += 1
+        return True
+
+    def find_many(self, nodes):
+        """
+        Représentants d'un tableau de sommets, par sauts de pointeurs vectorisés.
+        Les sommets visités sont rattachés directement à leur racine.
+        """
+        roots = self.parent[nodes]
+        while True:
+            grand_parents = self.parent[roots]
+            if np.array_equal(grand_parents, roots):
+                break
+            roots = grand_parents
+        self.parent[nodes] = roots
+        return roots
+
+
+def accept_sorted_edges(union_find, sources, targets, limit):
+    """
+    Étape de Kruskal sur un bloc d'arêtes déjà trié par poids : les arêtes internes à une composante
+    sont écartées de façon vectorisée, les autres sont unies une à une.
+    Retourne les positions (dans le bloc) d'au plus `limit` arêtes acceptées.
+    """
+    candidates = np.flatnonzero(union_find.find_many(sources) != union_find.find_many(targets))
+    accepted = []
+    for position, u, v in zip(candidates.tolist(), sources[candidates].tolist(), targets[candidates].tolist()):
+        if len(accepted) >= limit:
+            break
+        if union_find.union(u, v):
+            accepted.append(position)
+    return np.array(accepted, dtype=np.int64)
+
+
+def kruskal_arrays(num_nodes, sources, targets, weights, chunk_size=1 << 16):
+    """
+    Arbre (ou forêt) couvrant minimal à partir de tableaux d'arêtes.
+    Les arêtes sont triées par np.argsort (stable : à poids égal, l'ordre d'entrée est conservé),
+    puis traitées par blocs avec accept_sorted_edges.
+    Le parcours s'arrête dès que num_nodes - 1 arêtes sont acceptées.
+    Retourne (indices des arêtes retenues, poids total).
+    """
+    sources = np.asarray(sources)
+    targets = np.asarray(targets)
+    weights = np.asarray(weights)
+
+    order = np.argsort(weights, kind="stable")
+    union_find = UnionFind(num_nodes)
+    accepted = []
+    remaining = num_nodes - 1
+
+    for start in range(0, len(order), chunk_size):
+        if remaining <= 0:
+            break
+        chunk = order[start:start + chunk_size]
+        positions = accept_sorted_edges(union_find, sources[chunk], targets[chunk], remaining)
+        accepted.append(chunk[positions])
+        remaining -= len(positions)
+
+    accepted = np.concatenate(accepted) if accepted else np.zeros(0, dtype=np.int64)
+    return accepted, weights[accepted].sum().item()
@@ -0,0 +1,181 @@
+import heapq
+import numpy as np
+from algorithms.csr import graph_to_csr, reverse_csr
+from algorithms.dijkstra_engine import _dijkstra_arrays
+
+
+class LandmarkIndex:
+    """
+    Index ALT (A*, Landmarks, inégalité triangulaire) pour des requêtes point à point répétées.
+    Les distances depuis et vers chaque repère sont calculées une seule fois par graphe.
+    """
+
+    def __init__(self, csr, num_landmarks=8, directed=True, seed=None):
+        if len(csr.weights) and csr.weights.min() < 0:
+            raise ValueError("L'index ALT n'accepte pas les poids négatifs.")
+
+        self.csr = csr
+        self.num_nodes = len(csr.nodes)
+        self._forward = (csr.offsets.tolist(), csr.targets.tolist(), csr.weights.tolist())
+        if directed:
+            reverse = reverse_csr(csr)
+            self._backward = (reverse.offsets.tolist(), reverse.targets.tolist(), reverse.weights.tolist())
+        else:
+            reverse = csr
+            self._backward = self._forward
+        forward_arrays = (csr.offsets, csr.targets, csr.weights)
+        backward_arrays = (reverse.offsets, reverse.targets, reverse.weights)
+
+        self.landmarks = []
+        from_rows, to_rows = [], []
+        if self.num_nodes:
+            # Sélection « le plus éloigné d'abord » : chaque repère maximise la distance aux précédents
+            rng = np.random.default_rng(seed)
+            closest = np.full(self.num_nodes, np.inf)
+            candidate = int(rng.integers(self.num_nodes))
+            for _ in range(min(num_landmarks, self.num_nodes)):
+                if candidate in self.landmarks:
+                    break
+                self.landmarks.append(candidate)
+                from_row = np.array(_dijkstra_arrays(*forward_arrays, candidate)[0])
+                to_row = (
+                    np.array(_dijkstra_arrays(*backward_arrays, candidate)[0])
+                    if directed else from_row
+                )
+                from_rows.append(from_row)
+                to_rows.append(to_row)
+                closest = np.minimum(closest, from_row)
+                candidate = int(np.argmax(closest))
+
+        # Matrices (sommets × repères) : d(repère, v) et d(v, repère)
+        self.from_landmarks = np.array(from_rows, dtype=np.float64).T.copy()
+        self.to_landmarks = np.array(to_rows, dtype=np.float64).T.copy()
+
+    def _heuristic(self, target):
+        """
+        Borne inférieure ALT de d(v, target), mémorisée par sommet pour la requête en cours.
+        Retourne inf si le repère prouve que target est inaccessible depuis v.
+        """
+        from_target = self.from_landmarks[target]
+        to_target = self.to_landmarks[target]
+        memo = {}
+
+        def bound(v):
+            value = memo.get(v)
+            if value is None:
+                value = np.fmax.reduce(
+                    np.fmax(from_target - self.from_landmarks[v], self.to_landmarks[v] - to_target)
+                ) if len(self.landmarks) else 0.0
+                value = 0.0 if not value > 0 else float(value)  # nan (aucune information) -> 0
+                memo[v] = value
+            return value
+
+        return bound
+
+    def query(self, source, target, method="alt"):
+        """
+        Plus court chemin entre deux indices de sommets.
+        method="alt" : A* guidé par les repères ; method="bidirectional" : Dijkstra bidirectionnel.
+        Retourne (distance, chemin en indices, nombre de sommets fixés).
+        """
+        with np.errstate(invalid="ignore"):
+            if method == "alt":
+                return self._astar(source, target)
+        if method == "bidirectional":
+            return self._bidirectional(source, target)
+        raise ValueError(f"Méthode inconnue : {method}")
+
+    def _astar(self, source, target):
+        """
+        A* avec heuristique ALT (cohérente) : arrêt dès que la cible est fixée.
+        """
+        offsets, targets, weights = self._forward
+        bound = self._heuristic(target)
+        inf = float("inf")
+        dist = {source: 0}
+        pred = {source: -1}
+        settled = set()
+        heap = [(bound(source), source)]
+
+        while heap:
+            _, u = heapq.heappop(heap)
+            if u in settled:
+                continue
+            settled.add(u)
+            if u == target:
+                return dist[u], _walk(pred, target), len(settled)
+            d = dist[u]
+            start, end = offsets[u], offsets[u + 1]
+            for v, w in zip(targets[start:end], weights[start:end]):
+                nd = d + w
+                if nd < dist.get(v, inf):
+                    h = bound(v)
+                    if h == inf:
+                        continue  # La cible est inaccessible depuis v
+                    dist[v] = nd
+                    pred[v] = u
+                    heapq.heappush(heap, (nd + h, v))
+
+        return inf, [], len(settled)
+
+    def _bidirectional(self, source, target):
+        """
+        Dijkstra bidirectionnel : arrêt lorsque les deux fronts ne peuvent plus améliorer le meilleur chemin.
+        """
+        inf = float("inf")
+        if source == target:
+            return 0, [source], 1
+
+        sides = [
+            (self._forward, {source: 0}, {source: -1}, set(), [(0, source)]),
+            (self._backward, {target: 0}, {target: -1}, set(), [(0, target)]),
+        ]
+        best, meeting = inf, None
+
+        while sides[0][4] and sides[1][4]:
+            if sides[0][4][0][0] + sides[1][4][0][0] >= best:
+                break
+            # Étendre le front dont le tas est le plus petit
+            side = 0 if len(sides[0][4]) <= len(sides[1][4]) else 1
+            (offsets, targets, weights), dist, pred, settled, heap = sides[side]
+            other_dist = sides[1 - side][1]
+
+            d, u = heapq.heappop(heap)
+            if u in settled:
+                continue
+            settled.add(u)
+            start, end = offsets[u], offsets[u + 1]
+            for v, w in zip(targets[start:end], weights[start:end]):
+                nd = d + w
+                if nd < dist.get(v, inf):
+                    dist[v] = nd
+                    pred[v] = u
+                    heapq.heappush(heap, (nd, v))
+                if v in other_dist and nd + other_dist[v] < best:
+                    best, meeting = nd + other_dist[v], v
+
+        num_settled = len(sides[0][3]) + len(sides[1][3])
+        if meeting is None:
+            return inf, [], num_settled
+
+        path = _walk(sides[0][2], meeting) + _walk(sides[1][2], meeting)[::-1][1:]
+        return best, path, num_settled
+
+
+def _walk(pred, node):
+    """
+    Chemin depuis la racine d'un dictionnaire de prédécesseurs jusqu'à node.
+    """
+    path = []
+    while node != -1:
+        path.append(node)
+        node = pred[node]
+    return path[::-1]
+
+
+def build_landmark_index(graph, num_landmarks=8, weight="weight", seed=None):
+    """
+    Construit un LandmarkIndex réutilisable à partir d'un graphe networkx.
+    """
+    csr = graph_to_csr(graph, weight=weight)
+    return LandmarkIndex(csr, num_landmarks=num_landmarks, directed=graph.is_directed(), seed=seed)
@@ -0,0 +1,379 @@
+from collections import deque
+import numpy as np
+from algorithms.instrumentation import increment
+
+
+class ResidualNetwork:
+    """
+    Graphe résiduel sur tableaux : l'arc d'entrée k donne l'arc direct 2k et l'arc inverse 2k + 1
+    (l'inverse d'un arc e est donc e ^ 1). Les arcs sortants de u sont arcs[start[u]:start[u + 1]].
+    """
+
+    def __init__(self, num_nodes, sources, targets, capacities):
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        capacities = np.asarray(capacities)
+        num_arcs = 2 * len(sources)
+
+        tails = np.empty(num_arcs, dtype=np.int64)
+        heads = np.empty(num_arcs, dtype=np.int64)
+        tails[0::2], tails[1::2] = sources, targets
+        heads[0::2], heads[1::2] = targets, sources
+        capacity = np.zeros(num_arcs, dtype=capacities.dtype if len(capacities) else np.int64)
+        capacity[0::2] = capacities
+
+        order = np.argsort(tails, kind="stable")
+        start = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(tails, minlength=num_nodes), out=start[1:])
+
+        self.num_nodes = num_nodes
+        self.capacity = capacity
+        # Listes Python : accès élément par élément rapides dans les boucles des algorithmes
+        self.tail = tails.tolist()
+        self.head = heads.tolist()
+        self.residual = capacity.tolist()
+        self.start = start.tolist()
+        self.arcs = order.tolist()
+
+    def flows(self):
+        """
+        Flux sur chaque arc d'entrée (capacité moins capacité résiduelle de l'arc direct).
+        """
+        return self.capacity[0::2] - np.array(self.residual[0::2], dtype=self.capacity.dtype)
+
+    def reachable_from(self, source):
+        """
+        Sommets accessibles depuis source dans le graphe résiduel (masque booléen).
+        """
+        seen = [False] * self.num_nodes
+        seen[source] = True
+        queue = deque([source])
+        head, residual, start, arcs = self.head, self.residual, self.start, self.arcs
+        while queue:
+            u = queue.popleft()
+            for e in arcs[start[u]:start[u + 1]]:
+                v = head[e]
+                if residual[e] > 0 and not seen[v]:
+                    seen[v] = True
+                    queue.append(v)
+        return np.array(seen, dtype=bool)
+
+
+def _bfs_levels(network, source, sink):
+    """
+    Niveaux (distance en arcs résiduels depuis source) ; -1 pour les sommets non atteints.
+    """
+    level = [-1] * network.num_nodes
+    level[source] = 0
+    queue = deque([source])
+    head, residual, start, arcs = network.head, network.residual, network.start, network.arcs
+    while queue:
+        u = queue.popleft()
+        for e in arcs[start[u]:start[u + 1]]:
+            v = head[e]
+            if residual[e] > 0 and level[v] < 0:
+                level[v] = level[u] + 1
+                queue.append(v)
+    return level
+
+
+def dinic(network, source, sink, record_paths=False, limit=None):
+    """
+    Algorithme de Dinic : graphe de niveaux par BFS, puis flot bloquant par DFS itératif
+    avec pointeurs d'arc courant. Retourne (valeur ajoutée, chemins) ; les chemins
+    [(arcs (u, v), flux)] ne sont conservés que si record_paths est vrai.
+    Avec `limit`, on s'arrête dès que cette quantité a été acheminée.
+    """
+    if source == sink:
+        return 0, [] if record_paths else None
+
+    head, tail, residual, start, arcs = network.head, network.tail, network.residual, network.start, network.arcs
+    total = 0
+    paths = [] if record_paths else None
+    phases = augmentations = 0
+
+    while limit is None or total < limit:
+        level = _bfs_levels(network, source, sink)
+        if level[sink] < 0:
+            break
+        phases += 1
+        current = start[:-1]
+        path = []  # Arcs du chemin en cours depuis source
+        u = source
+
+        while True:
+            if u == sink:
+                bottleneck = min(residual[e] for e in path)
+                if limit is not None:
+                    bottleneck = min(bottleneck, limit - total)
+                for e in path:
+                    residual[e] -= bottleneck
+                    residual[e ^ 1] += bottleneck
+                total += bottleneck
+                augmentations += 1
+                if record_paths:
+                    paths.append(([(tail[e], head[e]) for e in path], bottleneck))
+                if limit is not None and total >= limit:
+                    break
+                # Revenir juste avant le premier arc saturé
+                cut = next(i for i, e in enumerate(path) if residual[e] == 0)
+                del path[cut:]
+                u = head[path[-1]] if path else source
+                continue
+
+            # Avancer le long d'un arc admissible
+            end = start[u + 1]
+            i = current[u]
+            next_level = level[u] + 1
+            while i < end:
+                e = arcs[i]
+                if residual[e] > 0 and level[head[e]] == next_level:
+                    break
+                i += 1
+            current[u] = i
+
+            if i < end:
+                path.append(arcs[i])
+                u = head[arcs[i]]
+            else:
+                # Impasse : retirer u du graphe de niveaux et reculer
+                level[u] = -1
+                if u == source:
+                    break
+                e = path.pop()
+                u = tail[e]
+                current[u] += 1
+
+    increment("blocking_flow_phases", phases)
+    increment("augmenting_paths", augmentations)
+    return total, paths
+
+
+def push_relabel(network, source, sink):
+    """
+    Push-relabel à étiquette la plus haute, avec heuristique de trou (gap) et
+    ré-étiquetage global initial. Retourne la valeur ajoutée au flot.
+    """
+    n = network.num_nodes
+    if source == sink:
+        return 0
+
+    head, residual, start, arcs = network.head, network.residual, network.start, network.arcs
+
+    # Hauteurs initiales : distance résiduelle vers sink (n si sink est inaccessible)
+    height = [n] * n
+    height[sink] = 0
+    queue = deque([sink])
+    while queue:
+        v = queue.popleft()
+        for e in arcs[start[v]:start[v + 1]]:
+            u = head[e]
+            if residual[e ^ 1] > 0 and height[u] == n and u != sink:
+                height[u] = height[v] + 1
+                queue.append(u)
+    height[source] = n
+
+    excess = [0] * n
+    count = [0] * (2 * n + 2)
+    for h in height:
+        count[h] += 1
+    buckets = [[] for _ in range(2 * n + 2)]
+
+    # Saturer les arcs sortant de la source
+    for e in arcs[start[source]:start[source + 1]]:
+        delta = residual[e]
+        if delta > 0:
+            v = head[e]
+            residual[e] = 0
+            residual[e ^ 1] += delta
+            if excess[v] == 0 and v != sink:
+                buckets[height[v]].append(v)
+            excess[v] += delta
+            excess[source] -= delta
+
+    current = start[:-1]
+    highest = 2 * n + 1
+    relabels = 0
+
+    while highest >= 0:
+        if not buckets[highest]:
+            highest -= 1
+            continue
+        u = buckets[highest].pop()
+        if height[u] != highest or excess[u] == 0 or u == source:
+            continue  # Entrée périmée
+
+        # Décharger u
+        while excess[u] > 0:
+            i = current[u]
+            if i == start[u + 1]:
+                # Ré-étiquetage
+                old = height[u]
+                new = min((height[head[e]] for e in arcs[start[u]:start[u + 1]] if residual[e] > 0), default=2 * n)
+                new = min(new + 1, 2 * n)
+                count[old] -= 1
+                if count[old] == 0 and old < n:
+                    # Trou : les sommets au-dessus de old (sous n) ne peuvent plus atteindre sink
+                    for v in range(n):
+                        if old < height[v] < n:
+                            count[height[v]] -= 1
+                            height[v] = n + 1
+                            count[n + 1] += 1
+                            if excess[v] > 0 and v != source and v != sink:
+                                buckets[n + 1].append(v)
+                    new = max(new, n + 1)
+                    highest = max(highest, n + 1)
+                height[u] = new
+                count[new] += 1
+                relabels += 1
+                current[u] = start[u]
+                continue
+
+            e = arcs[i]
+            v = head[e]
+            if residual[e] > 0 and height[u] == height[v] + 1:
+                delta = min(excess[u], residual[e])
+                residual[e] -= delta
+                residual[e ^ 1] += delta
+                if excess[v] == 0 and v != source and v != sink:
+                    buckets[height[v]].append(v)
+                excess[u] -= delta
+                excess[v] += delta
+            else:
+                current[u] = i + 1
+
+        # Après ré-étiquetage, u a pu activer des sommets au-dessus de l'ancienne étiquette maximale
+        highest = max(highest, height[u])
+
+    increment("relabels", relabels)
+    return excess[sink]
+
+
+def max_flow_arrays(num_nodes, sources, targets, capacities, source, sink, method="dinic", record_paths=False):
+    """
+    Flot maximal sur tableaux d'arcs. method="dinic" ou "push_relabel".
+    Retourne (valeur du flot, flux par arc d'entrée, chemins augmentants ou None).
+    Les chemins ne sont enregistrés qu'avec Dinic et record_paths=True.
+    """
+    network = ResidualNetwork(num_nodes, sources, targets, capacities)
+    if method == "dinic":
+        value, paths = dinic(network, source, sink, record_paths=record_paths)
+    elif method == "push_relabel":
+        value, paths = push_relabel(network, source, sink), None
+    else:
+        raise ValueError(f"Méthode inconnue : {method}")
+    return value, network.flows(), paths
+
+
+class IncrementalMaxFlow:
+    """
+    Flot maximal avec état : le graphe résiduel est conservé entre deux modifications de capacités.
+    Une hausse ne fait qu'ajouter de la capacité résiduelle ; une baisse sous le flux courant est
+    réparée localement (réacheminement, puis annulation de l'excédent vers source et sink),
+    avant de compléter le flot par Dinic depuis l'état courant.
+    """
+
+    def __init__(self, num_nodes, sources, targets, capacities, source, sink, nodes=None):
+        self.nodes = list(range(num_nodes)) if nodes is None else list(nodes)
+        self.index = {node: i for i, node in enumerate(self.nodes)}
+        self.sources = np.asarray(sources, dtype=np.int64)
+        self.targets = np.asarray(targets, dtype=np.int64)
+        self.arc_of = {
+            (self.nodes[u], self.nodes[v]): k
+            for k, (u, v) in enumerate(zip(self.sources.tolist(), self.targets.tolist()))
+        }
+        self.source = source
+        self.sink = sink
+        self.network = ResidualNetwork(num_nodes, self.sources, self.targets, capacities)
+        self.value = dinic(self.network, self.index[source], self.index[sink])[0]
+
+    @classmethod
+    def from_graph(cls, graph, source, sink, capacity="capacity"):
+        """
+        Construit l'objet à partir d'un graphe orienté networkx.
+        """
+        nodes = list(graph.nodes)
+        index = {node: i for i, node in enumerate(nodes)}
+        edges = list(graph.edges(data=capacity))
+        return cls(
+            len(nodes),
+            [index[u] for u, _, _ in edges],
+            [index[v] for _, v, _ in edges],
+            [c for _, _, c in edges],
+            source,
+            sink,
+            nodes=nodes,
+        )
+
+    def _change_capacity(self, u, v, capacity):
+        """
+        Applique une nouvelle capacité à l'arc (u, v) en gardant un flot valide.
+        Retourne la quantité de flot s-t perdue.
+        """
+        network = self.network
+        e = 2 * self.arc_of[(u, v)]
+        if np.asarray(capacity).dtype.kind == "f" and network.capacity.dtype.kind != "f":
+            # Capacité réelle sur un réseau entier : passer les capacités en réels plutôt que tronquer
+            network.capacity = network.capacity.astype(np.float64)
+        old = network.capacity[e].item()
+        flow = old - network.residual[e]
+        network.capacity[e] = capacity
+
+        if capacity >= flow:
+            network.residual[e] = capacity - flow
+            return 0
+
+        # Le flux dépasse la nouvelle capacité : ramener l'arc à capacity
+        overflow = flow - capacity
+        network.residual[e] = 0
+        network.residual[e ^ 1] -= overflow
+        tail, head = self.index[u], self.index[v]
+        s, t = self.index[self.source], self.index[self.sink]
+
+        # 1. Réacheminer l'excédent de u vers v par d'autres chemins
+        rerouted = dinic(network, tail, head, limit=overflow)[0]
+        remaining = overflow - rerouted
+        if remaining:
+            # 2. Rendre le reste à la source et le retirer du puits
+            if tail != s:
+                dinic(network, tail, s, limit=remaining)
+            if head != t:
+                dinic(network, t, head, limit=remaining)
+        return remaining
+
+    def update_capacities(self, changes):
+        """
+        Applique plusieurs changements {(u, v): capacité} puis complète le flot une seule fois.
+        Retourne la nouvelle valeur du flot maximal.
+        """
+        for (u, v), capacity in changes.items():
+            self.value -= self._change_capacity(u, v, capacity)
+        s, t = self.index[self.source], self.index[self.sink]
+        self.value += dinic(self.network, s, t)[0]
+        return self.value
+
+    def set_capacity(self, u, v, capacity):
+        """
+        Modifie la capacité d'un arc et retourne la nouvelle valeur du flot maximal.
+        """
+        return self.update_capacities({(u, v): capacity})
+
+    def flows(self):
+        """
+        Flux courant sur chaque arc, dans l'ordre d'entrée.
+        """
+        return self.network.flows()
+
+    def min_cut(self):
+        """
+        Coupe minimale s-t en O(m) à partir du graphe résiduel final :
+        retourne (sommets du côté source, arcs coupés).
+        """
+        reachable = self.network.reachable_from(self.index[self.source])
+        crossing = np.flatnonzero(reachable[self.sources] & ~reachable[self.targets])
+        source_side = {self.nodes[i] for i in np.flatnonzero(reachable).tolist()}
+        cut_edges = [
+            (self.nodes[u], self.nodes[v])
+            for u, v in zip(self.sources[crossing].tolist(), self.targets[crossing].tolist())
+        ]
+        return source_side, cut_edges
@@ -0,0 +1,112 @@
+import heapq
+import numpy as np
+from algorithms.maxflow_engine import ResidualNetwork
+
+
+def _reduced_dijkstra(network, cost, potential, source, sink):
+    """
+    Dijkstra sur les coûts réduits cost[e] + potential[u] - potential[v] (positifs ou nuls) des arcs
+    résiduels, arrêté dès que sink est atteint. Retourne les distances (inf si non atteint).
+    """
+    head, residual, start, arcs = network.head, network.residual, network.start, network.arcs
+    dist = [float("inf")] * network.num_nodes
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if u == sink:
+            break
+        base = d + potential[u]
+        for e in arcs[start[u]:start[u + 1]]:
+            if residual[e] > 0:
+                v = head[e]
+                nd = base + cost[e] - potential[v]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    heapq.heappush(heap, (nd, v))
+    return dist
+
+
+def _admissible_augment(network, cost, potential, source, sink, tolerance):
+    """
+    Augmente le long des arcs admissibles (capacité résiduelle positive, coût réduit nul) par un DFS
+    avec pointeurs d'arc courant : un sommet sans issue est écarté pour toute la phase, si bien que
+    la phase coûte O(arcs + chemins × longueur). Tous les chemins trouvés sont des plus courts chemins.
+    Retourne la quantité acheminée.
+    """
+    head, tail, residual, start, arcs = network.head, network.tail, network.residual, network.start, network.arcs
+    current = start[:-1]
+    blocked = [False] * network.num_nodes  # Sommet sans issue ou déjà sur le chemin en cours
+    blocked[source] = True
+    path = []
+    u = source
+    total = 0
+
+    while True:
+        if u == sink:
+            bottleneck = min(residual[e] for e in path)
+            for e in path:
+                residual[e] -= bottleneck
+                residual[e ^ 1] += bottleneck
+            total += bottleneck
+            # Revenir juste avant le premier arc saturé
+            cut = next(i for i, e in enumerate(path) if residual[e] == 0)
+            for e in path[cut:]:
+                blocked[head[e]] = False
+            del path[cut:]
+            u = head[path[-1]] if path else source
+            continue
+
+        end = start[u + 1]
+        i = current[u]
+        pu = potential[u]
+        while i < end:
+            e = arcs[i]
+            v = head[e]
+            if residual[e] > 0 and not blocked[v] and cost[e] + pu - potential[v] <= tolerance:
+                break
+            i += 1
+        current[u] = i
+
+        if i < end:
+            e = arcs[i]
+            path.append(e)
+            u = head[e]
+            blocked[u] = True
+        else:
+            # Impasse : u reste bloqué pour la phase
+            if u == source:
+                return total
+            u = tail[path.pop()]
+
+
+def min_cost_flow_arrays(num_nodes, sources, targets, capacities, costs, source, sink, potential=None):
+    """
+    Flot maximal de coût minimal de source à sink (méthode primal-dual) : un Dijkstra sur les coûts
+    réduits met à jour les potentiels, puis les plus courts chemins (coût réduit nul) sont saturés
+    par DFS avant le Dijkstra suivant. `potential` doit rendre tous les coûts réduits positifs
+    ou nuls (par défaut des zéros, valable si les coûts sont positifs).
+    Retourne (valeur du flot, coût total, flux de chaque arc d'entrée).
+    """
+    network = ResidualNetwork(num_nodes, sources, targets, capacities)
+    costs = np.asarray(costs)
+    arc_cost = np.empty(2 * len(costs), dtype=costs.dtype)
+    arc_cost[0::2], arc_cost[1::2] = costs, -costs
+    cost = arc_cost.tolist()
+    potential = [0] * num_nodes if potential is None else list(potential)
+    tolerance = 0 if np.issubdtype(costs.dtype, np.integer) else 1e-9 * max(1.0, float(np.abs(costs).max(initial=0)))
+
+    value = 0
+    while True:
+        dist = _reduced_dijkstra(network, cost, potential, source, sink)
+        reach = dist[sink]
+        if reach == float("inf"):
+            break
+        # Sommets non atteints avant sink : leur distance est au moins celle de sink
+        potential = [p + min(d, reach) for p, d in zip(potential, dist)]
+        value += _admissible_augment(network, cost, potential, source, sink, tolerance)
+
+    flows = network.flows()
+    return value, (flows * costs).sum(), flows
@@ -1,11 +1,29 @@
 import numpy as np
 from tkinter import simpledialog, messagebox
 import matplotlib.pyplot as plt
+from algorithms.instrumentation import annotate_figure, instrumented_run, phase
+from algorithms.transport_engine import least_cost_method, vogel_method
 
 
-def moindre_cout_method(supply, demand, cost_matrix):
+def moindre_cout_method(supply, demand, cost_matrix, method="argsort"):
     """
     Applique la méthode du Moindre Coût pour générer une solution initiale optimale.
+    method="argsort" utilise le moteur NumPy (même allocation que la version d'origine),
+    method="vogel" l'approximation de Vogel (solution initiale en général moins coûteuse),
+    method="python" la version d'origine. Retourne (allocation, coût total).
+    """
+    if method == "argsort":
+        return least_cost_method(supply, demand, np.asarray(cost_matrix))
+    if method == "vogel":
+        return vogel_method(supply, demand, np.asarray(cost_matrix))
+    if method != "python":
+        raise ValueError(f"Méthode inconnue : {method}")
+    return _moindre_cout_python(supply, demand, np.asarray(cost_matrix))
+
+
+def _moindre_cout_python(supply, demand, cost_matrix):
+    """
+    Version d'origine (tri Python de toutes les cases), conservée pour comparaison.
     """
     rows, cols = len(supply), len(demand)
     allocation = np.zeros((rows, cols), dtype=int)
@@ -51,11 +69,13 @@ def execute_moindre_cout():
             messagebox.showerror("Erreur", "La somme des capacités doit être égale à la somme des demandes.")
             return
 
-        # Exécution de la méthode du Moindre Coût
-        allocation, total_cost = moindre_cout_method(supply.copy(), demand.copy(), cost_matrix)
+        with instrumented_run("Moindre Coût"):
+            # Exécution de la méthode du Moindre Coût
+            with phase("solve"):
+                allocation, total_cost = moindre_cout_method(supply.copy(), demand.copy(), cost_matrix)
 
-        # Affichage des résultats
-        afficher_resultats(allocation, cost_matrix, total_cost)
+            # Affichage des résultats
+            afficher_resultats(allocation, cost_matrix, total_cost)
 
     except Exception as e:
         messagebox.showerror("Erreur", f"Une erreur est survenue : {str(e)}")
@@ -65,26 +85,28 @@ def afficher_resultats(allocation, cost_matrix, total_cost):
     """
     Affiche les résultats sous forme de tableau graphique.
     """
-    fig, ax = plt.subplots(figsize=(10, 6))
+    with phase("render"):
+        fig, ax = plt.subplots(figsize=(10, 6))
 
-    rows, cols = allocation.shape
-    table_data = [["" for _ in range(cols + 1)] for _ in range(rows + 2)]
-    table_data[0][0] = "Coût"
+        rows, cols = allocation.shape
+        table_data = [["" for _ in range(cols + 1)] for _ in range(rows + 2)]
+        table_data[0][0] = "Coût"
 
-    for j in range(cols):
-        table_data[0][j + 1] = f"D{j + 1}"
-
-    for i in range(rows):
-        table_data[i + 1][0] = f"U{i + 1}"
         for j in range(cols):
-            table_data[i + 1][j + 1] = f"{allocation[i, j]} ({cost_matrix[i, j]})"
-
-    table_data[-1][0] = "Total"
-    table_data[-1][1] = f"Coût Total = {total_cost}"
-
-    # Affichage graphique
-    ax.axis("tight")
-    ax.axis("off")
-    ax.table(cellText=table_data, loc="center", cellLoc="center")
-    plt.title("Résultats de la méthode du Moindre Coût")
+            table_data[0][j + 1] = f"D{j + 1}"
+
+        for i in range(rows):
+            table_data[i + 1][0] = f"U{i + 1}"
+            for j in range(cols):
+                table_data[i + 1][j + 1] = f"{allocation[i, j]} ({cost_matrix[i, j]})"
+
+        table_data[-1][0] = "Total"
+        table_data[-1][1] = f"Coût Total = {total_cost}"
+
+        # Affichage graphique
+        ax.axis("tight")
+        ax.axis("off")
+        ax.table(cellText=table_data, loc="center", cellLoc="center")
+        plt.title("Résultats de la méthode du Moindre Coût")
+    annotate_figure(plt.gcf())
     plt.show()
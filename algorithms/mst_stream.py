@@ -0,0 +1,192 @@
+import os
+import tempfile
+from itertools import islice
+import numpy as np
+from algorithms.kruskal_engine import UnionFind, accept_sorted_edges
+
+# Format binaire des fichiers d'arêtes : (origine, destination, poids)
+EDGE_DTYPE = np.dtype([("u", "<i8"), ("v", "<i8"), ("w", "<f8")])
+
+# Format des séquences triées écrites sur disque ; seq départage les poids égaux (ordre du fichier)
+RUN_DTYPE = np.dtype([("w", "<f8"), ("seq", "<i8"), ("u", "<i8"), ("v", "<i8")])
+
+# Nombre maximal de séquences fusionnées à la fois (fichiers ouverts simultanément) ; au-delà,
+# les séquences sont d'abord fusionnées par groupes en plusieurs passes
+MAX_FAN_IN = 64
+
+
+def read_edge_chunks(path, chunk_size=1 << 20, fmt=None):
+    """
+    Lit un fichier d'arêtes par blocs de chunk_size arêtes et génère des tableaux (u, v, w).
+    fmt="text" : une arête « u v poids » par ligne (# pour les commentaires) ;
+    fmt="binary" : enregistrements EDGE_DTYPE. Par défaut, .bin et .dat sont lus en binaire.
+    """
+    if fmt is None:
+        fmt = "binary" if os.path.splitext(path)[1] in (".bin", ".dat") else "text"
+
+    if fmt == "binary":
+        with open(path, "rb") as file:
+            while True:
+                records = np.fromfile(file, dtype=EDGE_DTYPE, count=chunk_size)
+                if not len(records):
+                    break
+                yield records["u"], records["v"], records["w"]
+    elif fmt == "text":
+        with open(path) as file:
+            while True:
+                lines = list(islice(file, chunk_size))
+                if not lines:
+                    break
+                lines = [line for line in lines if line.strip() and not line.lstrip().startswith("#")]
+                if lines:
+                    data = np.loadtxt(lines, ndmin=2)
+                    yield data[:, 0].astype(np.int64), data[:, 1].astype(np.int64), data[:, 2]
+    else:
+        raise ValueError(f"Format de fichier inconnu : {fmt}")
+
+
+class _RunReader:
+    """
+    Lecture bufferisée d'une séquence triée écrite sur disque.
+    """
+
+    def __init__(self, path, block_size):
+        self.file = open(path, "rb")
+        self.block_size = block_size
+        self.buffer = np.zeros(0, dtype=RUN_DTYPE)
+        self.exhausted = False
+        self.refill()
+
+    def refill(self):
+        if not len(self.buffer) and not self.exhausted:
+            self.buffer = np.fromfile(self.file, dtype=RUN_DTYPE, count=self.block_size)
+            if len(self.buffer) < self.block_size:
+                self.exhausted = True
+                self.file.close()
+
+    def take_until(self, bound):
+        """
+        Retire du tampon les enregistrements de clé (w, seq) <= bound.
+        """
+        weights = self.buffer["w"]
+        low = np.searchsorted(weights, bound[0], side="left")
+        high = np.searchsorted(weights, bound[0], side="right")
+        cut = low + np.searchsorted(self.buffer["seq"][low:high], bound[1], side="right")
+        taken, self.buffer = self.buffer[:cut], self.buffer[cut:]
+        return taken
+
+
+def _merge_runs(paths, block_size):
+    """
+    Fusion k-voies des séquences triées, par blocs : à chaque étape, on émet tout ce qui est
+    inférieur ou égal à la plus petite « dernière clé » des tampons encore alimentés par le disque.
+    """
+    all_readers = [_RunReader(path, block_size) for path in paths]
+    readers = all_readers
+    try:
+        while True:
+            readers = [reader for reader in readers if len(reader.buffer)]
+            if not readers:
+                return
+            pending = [reader for reader in readers if not reader.exhausted]
+            if pending:
+                bound = min((reader.buffer["w"][-1], reader.buffer["seq"][-1]) for reader in pending)
+            else:
+                bound = (np.inf, np.iinfo(np.int64).max)
+
+            merged = np.concatenate([reader.take_until(bound) for reader in readers])
+            yield merged[np.lexsort((merged["seq"], merged["w"]))]
+            for reader in readers:
+                reader.refill()
+    finally:
+        # Arrêt anticipé possible (MST complet) : fermer les séquences non lues
+        for reader in all_readers:
+            reader.file.close()
+
+
+def _merge_passes(run_paths, work_dir, chunk_size, fan_in, progress=None):
+    """
+    Fusionne les séquences par groupes de fan_in, en autant de passes que nécessaire, jusqu'à
+    n'en garder que fan_in au plus. Chaque fusion n'ouvre que fan_in fichiers et lit des blocs
+    d'au moins chunk_size // fan_in enregistrements. Retourne les chemins des séquences restantes.
+    """
+    merge_pass = 0
+    while len(run_paths) > fan_in:
+        next_paths = []
+        for group_index in range(0, len(run_paths), fan_in):
+            group = run_paths[group_index:group_index + fan_in]
+            if len(group) == 1:
+                next_paths.extend(group)
+                continue
+            out_path = os.path.join(work_dir, f"pass_{merge_pass:02d}_{group_index // fan_in:06d}.bin")
+            with open(out_path, "wb") as out:
+                for block in _merge_runs(group, max(1, chunk_size // len(group))):
+                    block.tofile(out)
+            for path in group:
+                os.remove(path)
+            next_paths.append(out_path)
+        run_paths = next_paths
+        if progress is not None:
+            progress({"phase": "pass", "chunk": merge_pass, "runs": len(run_paths)})
+        merge_pass += 1
+    return run_paths
+
+
+def streaming_mst(path, num_nodes=None, chunk_size=1 << 20, fmt=None, tmp_dir=None, progress=None,
+                  fan_in=MAX_FAN_IN):
+    """
+    Arbre couvrant minimal d'un fichier d'arêtes plus grand que la mémoire.
+    1. Le fichier est lu par blocs ; chaque bloc est trié par poids et écrit sur disque.
+    2. S'il y a plus de fan_in séquences, elles sont fusionnées par groupes (passes intermédiaires).
+    3. Les séquences restantes sont fusionnées par blocs et transmises à un Union-Find (état par sommet seulement).
+    La mémoire est en O(sommets + chunk_size), indépendante du nombre total d'arêtes.
+    `progress`, si fourni, est appelé à chaque bloc avec un dictionnaire (phase, bloc, arêtes traitées).
+    Retourne les tableaux (u, v, w) des arêtes retenues et le poids total.
+    """
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as work_dir:
+        # Phase 1 : tri externe en séquences
+        run_paths = []
+        seen = 0
+        max_node = -1
+        for chunk_index, (u, v, w) in enumerate(read_edge_chunks(path, chunk_size=chunk_size, fmt=fmt)):
+            run = np.empty(len(u), dtype=RUN_DTYPE)
+            run["w"], run["u"], run["v"] = w, u, v
+            run["seq"] = np.arange(seen, seen + len(u))
+            run = run[np.argsort(run["w"], kind="stable")]
+
+            run_path = os.path.join(work_dir, f"run_{chunk_index:06d}.bin")
+            run.tofile(run_path)
+            run_paths.append(run_path)
+
+            seen += len(u)
+            if len(u):
+                max_node = max(max_node, int(u.max()), int(v.max()))
+            if progress is not None:
+                progress({"phase": "sort", "chunk": chunk_index, "edges": seen})
+
+        if num_nodes is None:
+            num_nodes = max_node + 1
+
+        # Phase 2 : passes de fusion intermédiaires (nombre de fichiers ouverts borné)
+        run_paths = _merge_passes(run_paths, work_dir, chunk_size, max(2, fan_in), progress)
+
+        # Phase 3 : fusion et Kruskal
+        union_find = UnionFind(num_nodes)
+        remaining = num_nodes - 1
+        kept = []
+        merged_edges = 0
+        block_size = max(1, chunk_size // max(1, len(run_paths)))
+        merged_blocks = _merge_runs(run_paths, block_size)
+        for chunk_index, block in enumerate(merged_blocks):
+            if remaining <= 0:
+                break
+            positions = accept_sorted_edges(union_find, block["u"], block["v"], remaining)
+            kept.append(block[positions])
+            remaining -= len(positions)
+            merged_edges += len(block)
+            if progress is not None:
+                progress({"phase": "merge", "chunk": chunk_index, "edges": merged_edges})
+        merged_blocks.close()
+
+    kept = np.concatenate(kept) if kept else np.zeros(0, dtype=RUN_DTYPE)
+    return kept["u"], kept["v"], kept["w"], float(kept["w"].sum())
@@ -1,6 +1,7 @@
 import numpy as np
 from tkinter import simpledialog, messagebox
 import matplotlib.pyplot as plt
+from algorithms.instrumentation import annotate_figure, instrumented_run, phase
 
 
 def nord_ouest_method(supply, demand, cost_matrix):
@@ -48,11 +49,13 @@ def execute_nord_ouest():
             messagebox.showerror("Erreur", "La somme des capacités doit être égale à la somme des demandes.")
             return
 
-        # Exécution de la méthode du Nord-Ouest
-        allocation, total_cost = nord_ouest_method(supply.copy(), demand.copy(), cost_matrix)
+        with instrumented_run("Nord-Ouest"):
+            # Exécution de la méthode du Nord-Ouest
+            with phase("solve"):
+                allocation, total_cost = nord_ouest_method(supply.copy(), demand.copy(), cost_matrix)
 
-        # Affichage des résultats
-        afficher_resultats(allocation, cost_matrix, total_cost)
+            # Affichage des résultats
+            afficher_resultats(allocation, cost_matrix, total_cost)
 
     except Exception as e:
         messagebox.showerror("Erreur", f"Une erreur est survenue : {str(e)}")
@@ -62,26 +65,28 @@ def afficher_resultats(allocation, cost_matrix, total_cost):
     """
     Affiche les résultats sous forme de tableau graphique.
     """
-    fig, ax = plt.subplots(figsize=(10, 6))
+    with phase("render"):
+        fig, ax = plt.subplots(figsize=(10, 6))
 
-    rows, cols = allocation.shape
-    table_data = [["" for _ in range(cols + 1)] for _ in range(rows + 2)]
-    table_data[0][0] = "Coût"
+        rows, cols = allocation.shape
+        table_data = [["" for _ in range(cols + 1)] for _ in range(rows + 2)]
+        table_data[0][0] = "Coût"
 
-    for j in range(cols):
-        table_data[0][j + 1] = f"D{j + 1}"
-
-    for i in range(rows):
-        table_data[i + 1][0] = f"U{i + 1}"
         for j in range(cols):
-            table_data[i + 1][j + 1] = f"{allocation[i, j]} ({cost_matrix[i, j]})"
-
-    table_data[-1][0] = "Total"
-    table_data[-1][1] = f"Coût Total = {total_cost}"
-
-    # Dessiner le tableau
-    ax.axis("tight")
-    ax.axis("off")
-    ax.table(cellText=table_data, loc="center", cellLoc="center")
-    plt.title("Résultats de la méthode du Nord-Ouest")
+            table_data[0][j + 1] = f"D{j + 1}"
+
+        for i in range(rows):
+            table_data[i + 1][0] = f"U{i + 1}"
+            for j in range(cols):
+                table_data[i + 1][j + 1] = f"{allocation[i, j]} ({cost_matrix[i, j]})"
+
+        table_data[-1][0] = "Total"
+        table_data[-1][1] = f"Coût Total = {total_cost}"
+
+        # Dessiner le tableau
+        ax.axis("tight")
+        ax.axis("off")
+        ax.table(cellText=table_data, loc="center", cellLoc="center")
+        plt.title("Résultats de la méthode du Nord-Ouest")
+    annotate_figure(plt.gcf())
     plt.show()
@@ -0,0 +1,104 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from algorithms.cpm_engine import critical_path_arrays, latest_dates
+
+# Projet propre à chaque processus de calcul (transmis une seule fois par l'initialiseur)
+_worker_project = None
+
+
+def sample_durations(optimistic, most_likely, pessimistic, num_scenarios, distribution="beta", rng=None):
+    """
+    Tire une matrice de durées (scénarios × arcs) à partir des estimations (a, m, b) de chaque arc.
+    distribution="triangular" : loi triangulaire ; distribution="beta" : loi Bêta-PERT,
+    a + (b - a) · Bêta(1 + 4 (m - a) / (b - a), 1 + 4 (b - m) / (b - a)). Un arc avec a = b est fixe.
+    """
+    a = np.asarray(optimistic, dtype=np.float64)
+    m = np.asarray(most_likely, dtype=np.float64)
+    b = np.asarray(pessimistic, dtype=np.float64)
+    if ((a > m) | (m > b)).any():
+        raise ValueError("Chaque arc doit vérifier optimiste <= plus probable <= pessimiste.")
+    rng = np.random.default_rng(rng)
+    size = (num_scenarios, len(a))
+    spread = b - a
+    fixed = spread == 0
+    width = np.where(fixed, 1.0, spread)
+
+    if distribution == "triangular":
+        unit = rng.triangular(0.0, (m - a) / width, 1.0, size=size)
+    elif distribution == "beta":
+        unit = rng.beta(1 + 4 * (m - a) / width, 1 + 4 * (b - m) / width, size=size)
+    else:
+        raise ValueError(f"Distribution inconnue : {distribution}")
+    return np.where(fixed, a, a + spread * unit)
+
+
+def _init_worker(num_nodes, sources, targets, estimates, distribution):
+    """
+    Initialise un processus de calcul : le projet est reçu une seule fois puis réutilisé par tous ses blocs.
+    """
+    global _worker_project
+    _worker_project = (num_nodes, sources, targets, estimates, distribution)
+
+
+def _simulate_block(seed, num_scenarios, project=None):
+    """
+    Simule un bloc de scénarios : tirage des durées puis passes avant et arrière vectorisées
+    sur tout le bloc. Retourne (durées totales, nombre de scénarios où chaque tâche est critique).
+    Le projet est par défaut celui reçu par le processus de calcul.
+    """
+    num_nodes, sources, targets, estimates, distribution = _worker_project if project is None else project
+    durations = sample_durations(*estimates, num_scenarios, distribution=distribution, rng=seed)
+    result = critical_path_arrays(num_nodes, sources, targets, durations)
+    total = result["total_duration"]
+    finish = result["finish_times"]
+
+    # Tâche critique : tout retard sur sa fin retarde le projet, c.-à-d. fin au plus tôt = fin au plus
+    # tard du modèle avant, LF[u] = min(durée totale, min sur les successeurs de LF[v] - durée de v)
+    task_duration = finish - result["start_times"]
+    latest_finish = latest_dates(num_nodes, sources, targets, result["levels"], task_duration[:, targets], total)
+    tolerance = 1e-9 * np.maximum(1.0, np.abs(total))[:, None]
+    critical = latest_finish - finish <= tolerance
+    return total, critical.sum(axis=0)
+
+
+def monte_carlo_pert(num_nodes, sources, targets, optimistic, most_likely, pessimistic, num_scenarios=10000,
+                     distribution="beta", quantiles=(0.5, 0.9), seed=None, max_workers=None, block_size=None):
+    """
+    Simulation de Monte-Carlo du Potentiel Métra : chaque scénario tire une durée par arc, puis les
+    scénarios sont traités par blocs (scénarios × arcs) répartis sur un ProcessPoolExecutor.
+    Chaque bloc a sa propre graine (SeedSequence.spawn) : le résultat ne dépend pas du nombre de processus.
+    Retourne un dictionnaire : quantiles de la durée totale, durée moyenne, indice de criticité
+    de chaque tâche (fréquence des scénarios où un retard de la tâche retarde le projet)
+    et durées totales simulées.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    estimates = tuple(np.asarray(x, dtype=np.float64) for x in (optimistic, most_likely, pessimistic))
+
+    # Blocs d'environ 2**22 durées pour borner la mémoire de chaque processus
+    if block_size is None:
+        block_size = max(1, min(num_scenarios, (1 << 22) // max(1, len(sources), num_nodes)))
+    sizes = [min(block_size, num_scenarios - first) for first in range(0, num_scenarios, block_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(sizes)))
+    initargs = (num_nodes, sources, targets, estimates, distribution)
+
+    # Exécution séquentielle : inutile de démarrer des processus (ni de garder le projet dans _worker_project)
+    if max_workers == 1:
+        blocks = [_simulate_block(block_seed, size, initargs) for block_seed, size in zip(seeds, sizes)]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=initargs) as executor:
+            blocks = list(executor.map(_simulate_block, seeds, sizes))
+
+    totals = np.concatenate([total for total, _ in blocks])
+    critical_counts = np.sum([counts for _, counts in blocks], axis=0)
+    return {
+        "quantiles": dict(zip(quantiles, np.quantile(totals, quantiles).tolist())),
+        "mean_duration": float(totals.mean()),
+        "criticality": critical_counts / num_scenarios,
+        "total_durations": totals,
+    }
@@ -1,19 +1,52 @@
 import networkx as nx
+import numpy as np
 import random
 from tkinter import simpledialog, messagebox
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
 from tkinter.scrolledtext import ScrolledText
+from algorithms.cpm_engine import critical_path_arrays, edges_to_arrays
+from algorithms.instrumentation import finish_run, instrumented_run, phase
 
-# Forcer Matplotlib à utiliser TkAgg comme backend
-plt.switch_backend("TkAgg")
 
-
-def potentiel_metra_algorithm_with_details(nodes, edges):
+def potentiel_metra_algorithm_with_details(nodes, edges, method="arrays", with_graph=True):
     """
     Applique l'algorithme de Potentiel Métra pour ordonnancer des tâches,
     calculer marges, chemin critique et durée totale.
+    method="arrays" utilise le moteur vectorisé par niveaux (mêmes résultats),
+    method="python" la version d'origine. with_graph=False évite de construire le nx.DiGraph
+    (result["graph"] vaut alors None), utile pour les très grands projets.
+    """
+    if method == "python":
+        return _potentiel_metra_python(nodes, edges)
+    if method != "arrays":
+        raise ValueError(f"Méthode inconnue : {method}")
+
+    nodes = list(nodes)
+    sources, targets, weights = edges_to_arrays(nodes, edges)
+    arrays = critical_path_arrays(len(nodes), sources, targets, weights)
+
+    result = {
+        key: dict(zip(nodes, arrays[key].tolist()))
+        for key in ("start_times", "finish_times", "late_start", "late_finish", "free_margin", "total_margin")
+    }
+    result["critical_path"] = [nodes[i] for i in np.flatnonzero(arrays["total_margin"] == 0).tolist()]
+    result["total_duration"] = arrays["total_duration"].item()
+    result["levels"] = dict(zip(nodes, arrays["levels"].tolist()))
+
+    graph = None
+    if with_graph:
+        graph = nx.DiGraph()
+        graph.add_nodes_from(nodes)
+        graph.add_weighted_edges_from(edges)
+        nx.set_node_attributes(graph, result["levels"], name="level")
+    result["graph"] = graph
+    return result
+
+
+def _potentiel_metra_python(nodes, edges):
+    """
+    Version d'origine (parcours de nx.topological_sort), conservée pour comparaison.
     """
     graph = nx.DiGraph()
     graph.add_nodes_from(nodes)
@@ -110,6 +143,10 @@ def show_graph(graph, levels, critical_path):
         if "level" not in graph.nodes[node]:
             raise ValueError(f"Le nœud {node} n'a pas d'attribut 'level'.")
 
+    # Forcer Matplotlib à utiliser TkAgg, au moment de l'affichage et non à l'import du module
+    if plt.get_backend().lower() != "tkagg":
+        plt.switch_backend("TkAgg")
+
     pos = nx.multipartite_layout(graph, subset_key="level")  # Utiliser 'level' comme clé pour les niveaux
     plt.figure(figsize=(12, 8))
     color_map = ["red" if node in critical_path else "lightblue" for node in graph.nodes]
@@ -136,21 +173,27 @@ def execute_potentiel_metra():
         messagebox.showerror("Erreur", "Entrée invalide. Veuillez entrer un entier valide.")
         return
 
-    nodes, edges = generate_random_graph(num_nodes)
+    with instrumented_run("Potentiel Métra"):
+        with phase("build"):
+            nodes, edges = generate_random_graph(num_nodes)
 
-    try:
-        result = potentiel_metra_algorithm_with_details(nodes, edges)
-    except ValueError as e:
-        messagebox.showerror("Erreur", str(e))
-        return
+        try:
+            with phase("solve"):
+                result = potentiel_metra_algorithm_with_details(nodes, edges)
+        except ValueError as e:
+            finish_run()
+            messagebox.showerror("Erreur", str(e))
+            return
 
-    # Afficher les résultats dans une nouvelle fenêtre
-    display_results_in_window(result)
+        # Afficher les résultats dans une nouvelle fenêtre
+        with phase("render"):
+            text_widget = display_results_in_window(result)
+        text_widget.insert(tk.END, "\n" + finish_run())
 
 
 def display_results_in_window(result):
     """
-    Affiche les résultats de l'algorithme dans une fenêtre Tkinter.
+    Affiche les résultats de l'algorithme dans une fenêtre Tkinter et retourne sa zone de texte.
     """
     result_window = tk.Toplevel()
     result_window.title("Résultats Potentiel Métra")
@@ -212,3 +255,4 @@ def display_results_in_window(result):
         width=25,
         height=2,
     ).pack(pady=10)
+    return text_widget
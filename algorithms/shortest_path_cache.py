@@ -0,0 +1,110 @@
+import hashlib
+import sys
+from collections import OrderedDict
+from types import MappingProxyType
+
+
+def graph_fingerprint(graph, weight="weight"):
+    """
+    Empreinte du contenu d'un graphe (orientation, sommets, arêtes et poids).
+    Deux graphes construits dans le même ordre avec les mêmes données ont la même empreinte.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(b"D" if graph.is_directed() else b"U")
+    digest.update(repr(list(graph.nodes)).encode())
+    digest.update(repr([(u, v, data.get(weight, 1)) for u, v, data in graph.edges(data=True)]).encode())
+    return digest.hexdigest()
+
+
+def _freeze_result(result):
+    """
+    Version en lecture seule d'un résultat (distances, chemins), partagée sans copie entre les requêtes :
+    dictionnaires non modifiables (MappingProxyType) et chemins en tuples.
+    """
+    distances, paths = result
+    return MappingProxyType(dict(distances)), MappingProxyType({target: tuple(path) for target, path in paths.items()})
+
+
+def _estimate_size(result):
+    """
+    Estimation de la mémoire occupée par un résultat (distances, chemins).
+    """
+    distances, paths = result
+    size = sys.getsizeof(distances) + sys.getsizeof(paths)
+    size += sum(sys.getsizeof(path) for path in paths.values())
+    return size
+
+
+class ShortestPathCache:
+    """
+    Cache LRU des arbres de plus courts chemins, indexé par (algorithme, empreinte du graphe, source).
+    Le nombre d'entrées et la mémoire estimée sont bornés ; les entrées les plus anciennes sont évincées.
+    """
+
+    def __init__(self, max_entries=128, max_bytes=64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, algorithm, graph, source, compute, fingerprint=None):
+        """
+        Retourne le résultat en cache, ou appelle compute() et le mémorise.
+        Le résultat mémorisé est en lecture seule (voir _freeze_result) : une requête répétée ne coûte
+        qu'une recherche dans le dictionnaire. Passer `fingerprint` (voir graph_fingerprint) évite
+        de rehacher le graphe à chaque requête.
+        """
+        if fingerprint is None:
+            fingerprint = graph_fingerprint(graph)
+        key = (algorithm, fingerprint, source)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        return self._store(key, compute())
+
+    def _store(self, key, result):
+        """
+        Mémorise un résultat puis évince les entrées les moins récemment utilisées si nécessaire.
+        Retourne le résultat en lecture seule, qu'il soit gardé en cache ou non.
+        """
+        size = _estimate_size(result)
+        result = _freeze_result(result)
+        if size > self.max_bytes:
+            return result  # Trop volumineux pour être gardé en cache
+
+        self._entries[key] = (result, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+        return result
+
+    def clear(self):
+        """
+        Vide le cache sans remettre les statistiques à zéro.
+        """
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self):
+        """
+        Statistiques d'utilisation pour dimensionner le cache.
+        """
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
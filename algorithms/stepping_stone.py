@@ -1,11 +1,26 @@
 import numpy as np
 from tkinter import simpledialog, messagebox
 import matplotlib.pyplot as plt
+from algorithms.instrumentation import annotate_figure, instrumented_run, phase
+from algorithms.transport_engine import least_cost_method, transport_simplex
 
 
-def stepping_stone_method(supply, demand, cost_matrix, initial_allocation):
+def stepping_stone_method(supply, demand, cost_matrix, initial_allocation, method="modi"):
     """
     Applique l'algorithme Stepping Stone pour optimiser le coût total d'une solution initiale.
+    method="modi" utilise le simplexe de transport (base en arbre couvrant, potentiels u-v),
+    method="python" la version d'origine par recherche exhaustive de cycles.
+    """
+    if method == "modi":
+        return transport_simplex(supply, demand, np.asarray(cost_matrix), initial_allocation)
+    if method != "python":
+        raise ValueError(f"Méthode inconnue : {method}")
+    return _stepping_stone_python(supply, demand, np.asarray(cost_matrix), initial_allocation)
+
+
+def _stepping_stone_python(supply, demand, cost_matrix, initial_allocation):
+    """
+    Version d'origine, conservée pour comparaison. Boucle indéfiniment sur une base dégénérée.
     """
     rows, cols = len(supply), len(demand)
     allocation = initial_allocation.copy()
@@ -124,66 +139,46 @@ def execute_stepping_stone():
             messagebox.showerror("Erreur", "La somme des capacités doit être égale à la somme des demandes.")
             return
 
-        # Solution initiale via Moindre Coût
-        initial_allocation, _, _ = moindre_cout_method(supply.copy(), demand.copy(), cost_matrix)
+        with instrumented_run("Stepping Stone"):
+            with phase("solve"):
+                # Solution initiale via Moindre Coût
+                initial_allocation, _ = least_cost_method(supply, demand, cost_matrix)
 
-        # Appliquer l'algorithme Stepping Stone
-        allocation, total_cost = stepping_stone_method(supply, demand, cost_matrix, initial_allocation)
+                # Appliquer l'algorithme Stepping Stone
+                allocation, total_cost = stepping_stone_method(supply, demand, cost_matrix, initial_allocation)
 
-        # Afficher les résultats
-        afficher_resultats(allocation, cost_matrix, allocation * cost_matrix, total_cost)
+            # Afficher les résultats
+            afficher_resultats(allocation, cost_matrix, allocation * cost_matrix, total_cost)
 
     except Exception as e:
         messagebox.showerror("Erreur", f"Une erreur est survenue : {str(e)}")
 
 
-def moindre_cout_method(supply, demand, cost_matrix):
-    """
-    Génère une solution initiale en utilisant la méthode du moindre coût.
-    """
-    rows, cols = len(supply), len(demand)
-    allocation = np.zeros((rows, cols), dtype=int)
-    total_cost = 0
-
-    cost_indices = sorted(
-        [(i, j) for i in range(rows) for j in range(cols)],
-        key=lambda x: cost_matrix[x[0]][x[1]],
-    )
-
-    for i, j in cost_indices:
-        if supply[i] > 0 and demand[j] > 0:
-            qty = min(supply[i], demand[j])
-            allocation[i, j] = qty
-            supply[i] -= qty
-            demand[j] -= qty
-            total_cost += qty * cost_matrix[i, j]
-
-    return allocation, cost_matrix * allocation, total_cost
-
-
 def afficher_resultats(allocation, cost_matrix, cost_details, total_cost):
     """
     Affiche les résultats dans un tableau graphique.
     """
-    fig, ax = plt.subplots(figsize=(10, 6))
-
-    rows, cols = allocation.shape
-    table_data = [["" for _ in range(cols + 1)] for _ in range(rows + 2)]
-    table_data[0][0] = "Coût"
+    with phase("render"):
+        fig, ax = plt.subplots(figsize=(10, 6))
 
-    for j in range(cols):
-        table_data[0][j + 1] = f"D{j + 1}"
+        rows, cols = allocation.shape
+        table_data = [["" for _ in range(cols + 1)] for _ in range(rows + 2)]
+        table_data[0][0] = "Coût"
 
-    for i in range(rows):
-        table_data[i + 1][0] = f"U{i + 1}"
         for j in range(cols):
-            table_data[i + 1][j + 1] = f"{allocation[i, j]} ({cost_matrix[i, j]})"
+            table_data[0][j + 1] = f"D{j + 1}"
+
+        for i in range(rows):
+            table_data[i + 1][0] = f"U{i + 1}"
+            for j in range(cols):
+                table_data[i + 1][j + 1] = f"{allocation[i, j]} ({cost_matrix[i, j]})"
 
-    table_data[-1][0] = "Total"
-    table_data[-1][1] = f"Coût Total = {total_cost}"
+        table_data[-1][0] = "Total"
+        table_data[-1][1] = f"Coût Total = {total_cost}"
 
-    ax.axis("tight")
-    ax.axis("off")
-    ax.table(cellText=table_data, loc="center", cellLoc="center")
-    plt.title("Résultats de l'algorithme Stepping Stone")
+        ax.axis("tight")
+        ax.axis("off")
+        ax.table(cellText=table_data, loc="center", cellLoc="center")
+        plt.title("Résultats de l'algorithme Stepping Stone")
+    annotate_figure(plt.gcf())
     plt.show()
@@ -0,0 +1,522 @@
+import numpy as np
+from algorithms.instrumentation import increment
+from algorithms.mincost_flow_engine import min_cost_flow_arrays
+
+
+def _check_balanced(supply, demand):
+    """
+    Vérifie que l'offre totale égale la demande totale pour chaque instance.
+    """
+    unbalanced = np.flatnonzero(supply.sum(axis=-1) != demand.sum(axis=-1))
+    if len(unbalanced):
+        raise ValueError(
+            "La somme des capacités doit être égale à la somme des demandes "
+            f"(instances : {unbalanced.tolist()})."
+        )
+
+
+def nord_ouest_batch(supply, demand, cost_matrix):
+    """
+    Méthode du Nord-Ouest appliquée simultanément à un lot d'instances.
+    supply : (lot, lignes), demand : (lot, colonnes), cost_matrix : (lignes, colonnes) partagée
+    ou (lot, lignes, colonnes). Toutes les instances avancent au même pas : chaque étape
+    alloue une case par instance, en au plus lignes + colonnes - 1 étapes.
+    Les entrées ne sont pas modifiées. Retourne (allocations (lot, lignes, colonnes), coûts (lot,)).
+    """
+    supply = np.array(supply)
+    demand = np.array(demand)
+    cost_matrix = np.asarray(cost_matrix)
+    _check_balanced(supply, demand)
+
+    batch, rows = supply.shape
+    cols = demand.shape[1]
+    dtype = np.result_type(supply, demand)
+    allocation = np.zeros((batch, rows, cols), dtype=dtype)
+    supply = supply.astype(dtype)
+    demand = demand.astype(dtype)
+    i = np.zeros(batch, dtype=np.int64)
+    j = np.zeros(batch, dtype=np.int64)
+    active = np.arange(batch)
+
+    while len(active):
+        ii, jj = i[active], j[active]
+        qty = np.minimum(supply[active, ii], demand[active, jj])
+        allocation[active, ii, jj] = qty
+        supply[active, ii] -= qty
+        demand[active, jj] -= qty
+
+        # Même règle que nord_ouest_method : ligne suivante si l'offre est épuisée, sinon colonne suivante
+        row_done = supply[active, ii] == 0
+        col_done = ~row_done & (demand[active, jj] == 0)
+        i[active[row_done]] += 1
+        j[active[col_done]] += 1
+        active = active[(i[active] < rows) & (j[active] < cols)]
+
+    total_cost = (allocation * cost_matrix).sum(axis=(1, 2))
+    return allocation, total_cost
+
+
+def least_cost_method(supply, demand, cost_matrix):
+    """
+    Méthode du Moindre Coût : les cases sont ordonnées une seule fois par np.argsort (stable,
+    donc même ordre que le tri Python ligne par ligne) et le parcours s'arrête dès que toute
+    l'offre est allouée. Les entrées ne sont pas modifiées. Retourne (allocation, coût total).
+    """
+    cost_matrix = np.asarray(cost_matrix)
+    supply_left = list(supply)
+    demand_left = list(demand)
+    rows, cols = len(supply_left), len(demand_left)
+    allocation = np.zeros((rows, cols), dtype=np.result_type(np.asarray(supply), np.asarray(demand)))
+    total_cost = 0
+    remaining = sum(supply_left)
+
+    for flat in np.argsort(cost_matrix.ravel(), kind="stable").tolist():
+        if remaining <= 0:
+            break
+        i, j = divmod(flat, cols)
+        if supply_left[i] > 0 and demand_left[j] > 0:
+            qty = min(supply_left[i], demand_left[j])
+            allocation[i, j] = qty
+            supply_left[i] -= qty
+            demand_left[j] -= qty
+            remaining -= qty
+            total_cost += qty * cost_matrix[i, j]
+
+    return allocation, total_cost
+
+
+class _PenaltyLines:
+    """
+    Pénalités de Vogel d'un ensemble de lignes (ou de colonnes) : écart entre les deux plus petits
+    coûts encore disponibles. Chaque ligne garde ses colonnes triées par coût et deux pointeurs,
+    avancés seulement quand une colonne disparaît : coût amorti O(lignes × colonnes) au total.
+    """
+
+    def __init__(self, costs):
+        self.costs = costs
+        self.order = np.argsort(costs, axis=1, kind="stable").tolist()
+        self.first = [0] * len(costs)
+        self.second = [1] * len(costs)
+        self.penalty = np.zeros(len(costs))
+        for line in range(len(costs)):
+            self._refresh(line, None)
+
+    def _refresh(self, line, alive):
+        """
+        Recalcule les deux meilleures positions disponibles de la ligne et sa pénalité.
+        """
+        order = self.order[line]
+        position = self.first[line]
+        if alive is not None:
+            while position < len(order) and not alive[order[position]]:
+                position += 1
+        second = max(position + 1, self.second[line])
+        if alive is not None:
+            while second < len(order) and not alive[order[second]]:
+                second += 1
+        self.first[line], self.second[line] = position, second
+        if position >= len(order):
+            self.penalty[line] = -1
+        elif second >= len(order):
+            self.penalty[line] = self.costs[line, order[position]]
+        else:
+            self.penalty[line] = self.costs[line, order[second]] - self.costs[line, order[position]]
+
+    def best(self, line):
+        """
+        Position (colonne) de coût minimal encore disponible sur la ligne.
+        """
+        return self.order[line][self.first[line]]
+
+    def remove(self, removed, active_lines, alive):
+        """
+        Met à jour les lignes actives dont l'une des deux meilleures positions vient de disparaître.
+        """
+        for line in active_lines:
+            order, second = self.order[line], self.second[line]
+            if order[self.first[line]] == removed or (second < len(order) and order[second] == removed):
+                self._refresh(line, alive)
+
+
+def vogel_method(supply, demand, cost_matrix):
+    """
+    Méthode d'approximation de Vogel : à chaque étape, on choisit la ligne ou la colonne de plus forte
+    pénalité, puis sa case de coût minimal. Les pénalités sont maintenues incrémentalement.
+    Une seule ligne ou colonne est barrée par étape (sauf la dernière), ce qui garde
+    lignes + colonnes - 1 cases de base. Retourne (allocation, coût total).
+    """
+    cost_matrix = np.asarray(cost_matrix)
+    supply_left = list(supply)
+    demand_left = list(demand)
+    rows, cols = len(supply_left), len(demand_left)
+    allocation = np.zeros((rows, cols), dtype=np.result_type(np.asarray(supply), np.asarray(demand)))
+    total_cost = 0
+
+    row_alive = [True] * rows
+    col_alive = [True] * cols
+    row_lines = _PenaltyLines(cost_matrix)
+    col_lines = _PenaltyLines(cost_matrix.T)
+    active_rows, active_cols = set(range(rows)), set(range(cols))
+
+    while active_rows and active_cols:
+        # Ligne ou colonne de plus forte pénalité (à égalité : les lignes d'abord, puis le plus petit indice)
+        row_penalties = np.where(row_alive, row_lines.penalty, -np.inf)
+        col_penalties = np.where(col_alive, col_lines.penalty, -np.inf)
+        best_row, best_col = int(np.argmax(row_penalties)), int(np.argmax(col_penalties))
+        if row_penalties[best_row] >= col_penalties[best_col]:
+            i = best_row
+            j = row_lines.best(i)
+        else:
+            j = best_col
+            i = col_lines.best(j)
+
+        qty = min(supply_left[i], demand_left[j])
+        allocation[i, j] = qty
+        supply_left[i] -= qty
+        demand_left[j] -= qty
+        total_cost += qty * cost_matrix[i, j]
+
+        # Barrer la ligne épuisée (ou la colonne), une seule à la fois
+        if supply_left[i] == 0 and (demand_left[j] != 0 or len(active_rows) > 1):
+            row_alive[i] = False
+            active_rows.discard(i)
+            col_lines.remove(i, active_cols, row_alive)
+        else:
+            col_alive[j] = False
+            active_cols.discard(j)
+            row_lines.remove(j, active_rows, col_alive)
+
+    return allocation, total_cost
+
+
+class _BasisTree:
+    """
+    Base du simplexe de transport sous forme d'arbre couvrant : les sommets 0..lignes-1 sont les
+    origines, lignes..lignes+colonnes-1 les destinations, chaque case de base (i, j) est une arête.
+    L'arbre est enraciné sur l'origine 0 (parent, case vers le parent, profondeur).
+    """
+
+    def __init__(self, rows, cols, cells):
+        self.rows = rows
+        self.adjacent = [set() for _ in range(rows + cols)]
+        for i, j in cells:
+            self.adjacent[i].add(rows + j)
+            self.adjacent[rows + j].add(i)
+        self.parent = [-1] * (rows + cols)
+        self.depth = [0] * (rows + cols)
+        self.order = self._hang(0, -1, 0)
+
+    def _hang(self, root, parent, depth):
+        """
+        Parcours en largeur du sous-arbre de `root` (accroché sous `parent`) : met à jour parents
+        et profondeurs, retourne les sommets visités.
+        """
+        self.parent[root] = parent
+        self.depth[root] = depth
+        visited = [root]
+        for node in visited:
+            for neighbor in self.adjacent[node]:
+                if neighbor != self.parent[node]:
+                    self.parent[neighbor] = node
+                    self.depth[neighbor] = self.depth[node] + 1
+                    visited.append(neighbor)
+        return visited
+
+    def cell(self, a, b):
+        """
+        Case (ligne, colonne) correspondant à l'arête entre les sommets a et b.
+        """
+        return (a, b - self.rows) if a < self.rows else (b, a - self.rows)
+
+    def path(self, a, b):
+        """
+        Chemin de a vers b dans l'arbre, par remontée vers l'ancêtre commun.
+        """
+        left, right = [a], [b]
+        while left[-1] != right[-1]:
+            if self.depth[left[-1]] >= self.depth[right[-1]]:
+                left.append(self.parent[left[-1]])
+            else:
+                right.append(self.parent[right[-1]])
+        return left + right[-2::-1]
+
+    def is_below(self, node, ancestor):
+        """
+        Indique si `node` appartient au sous-arbre de `ancestor`.
+        """
+        while self.depth[node] > self.depth[ancestor]:
+            node = self.parent[node]
+        return node == ancestor
+
+    def exchange(self, leaving, entering):
+        """
+        Remplace l'arête sortante par l'arête entrante. Le sous-arbre détaché est ré-enraciné sur
+        l'extrémité entrante qu'il contient ; retourne cette extrémité et les sommets du sous-arbre.
+        """
+        a, b = leaving
+        child = a if self.parent[a] == b else b
+        self.adjacent[a].discard(b)
+        self.adjacent[b].discard(a)
+        x, y = entering
+        inside, outside = (x, y) if self.is_below(x, child) else (y, x)
+        self.adjacent[x].add(y)
+        self.adjacent[y].add(x)
+        return inside, self._hang(inside, outside, self.depth[outside] + 1)
+
+
+def _initial_basis(allocation, cost_matrix):
+    """
+    Cases de base d'une solution initiale : les cases allouées, complétées par des cases de flux nul
+    (bases « epsilon ») reliant les composantes, jusqu'à lignes + colonnes - 1 cases.
+    """
+    rows, cols = allocation.shape
+    parent = list(range(rows + cols))
+
+    def find(node):
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def join(i, j):
+        a, b = find(i), find(rows + j)
+        if a == b:
+            return False
+        parent[a] = b
+        return True
+
+    cells = []
+    for i, j in zip(*np.nonzero(allocation)):
+        if not join(int(i), int(j)):
+            raise ValueError("La solution initiale n'est pas une solution de base (cycle entre cases allouées).")
+        cells.append((int(i), int(j)))
+
+    if len(cells) < rows + cols - 1:
+        for flat in np.argsort(cost_matrix.ravel(), kind="stable").tolist():
+            i, j = divmod(flat, cols)
+            if allocation[i, j] == 0 and join(i, j):
+                cells.append((i, j))
+                if len(cells) == rows + cols - 1:
+                    break
+    return cells
+
+
+def _cost_tolerance(costs):
+    """
+    Seuil d'optimalité des coûts réduits : nul pour des coûts entiers, relatif pour des réels.
+    """
+    if np.issubdtype(costs.dtype, np.integer):
+        return 0
+    return 1e-9 * max(1.0, float(np.abs(costs).max(initial=0)))
+
+
+def _tree_potentials(tree, basis, costs):
+    """
+    Potentiels u (origines) puis v (destinations) tels que u_i + v_j = c_ij sur chaque case de base,
+    avec u_0 = 0. `basis` associe chaque case de base à son indice dans `costs`.
+    """
+    dtype = costs.dtype if np.issubdtype(costs.dtype, np.integer) else np.float64
+    potentials = np.zeros(len(tree.parent), dtype=dtype)
+    for node in tree.order[1:]:
+        parent = tree.parent[node]
+        potentials[node] = costs[basis[tree.cell(node, parent)]] - potentials[parent]
+    return potentials
+
+
+def _simplex_pivots(tree, basis, potentials, flow, price, endpoints, max_iterations=None):
+    """
+    Pivots du simplexe de transport sur une base en arbre couvrant. price(potentials) retourne
+    la route entrante et son coût réduit (None si la solution est optimale), endpoints(route) sa
+    ligne et sa colonne. Le cycle de la route entrante est le chemin de l'arbre entre sa ligne et
+    sa colonne ; seuls les potentiels du sous-arbre déplacé changent. `flow`, `basis`, `potentials`
+    et `tree` sont mis à jour sur place. Retourne la variation du coût total.
+    """
+    rows = tree.rows
+    delta = 0
+    iterations = 0
+    while max_iterations is None or iterations < max_iterations:
+        route, reduced = price(potentials)
+        if route is None:
+            break
+        iterations += 1
+        i, j = endpoints(route)
+
+        # Cycle : route entrante (+), puis le chemin colonne j -> ligne i, signes alternés (-, +, ...)
+        path = tree.path(rows + j, i)
+        minus = [basis[tree.cell(path[k], path[k + 1])] for k in range(0, len(path) - 1, 2)]
+        plus = [basis[tree.cell(path[k], path[k + 1])] for k in range(1, len(path) - 1, 2)]
+        leaving = min(range(len(minus)), key=lambda k: flow[minus[k]])
+        theta = flow[minus[leaving]]
+
+        flow[minus] -= theta
+        flow[plus] += theta
+        flow[route] += theta
+        delta += theta * reduced
+
+        # Pivot : seuls les potentiels du sous-arbre ré-enraciné changent
+        edge = (path[2 * leaving], path[2 * leaving + 1])
+        del basis[tree.cell(*edge)]
+        basis[(i, j)] = route
+        inside, moved = tree.exchange(edge, (i, rows + j))
+        moved = np.array(moved)
+        shift = reduced if inside == rows + j else -reduced
+        potentials[moved[moved >= rows]] += shift
+        potentials[moved[moved < rows]] -= shift
+
+    increment("pivots", iterations)
+    return delta
+
+
+def transport_simplex(supply, demand, cost_matrix, initial_allocation=None, max_iterations=None):
+    """
+    Simplexe de transport (méthode MODI / u-v) : la base est un arbre couvrant, les potentiels u, v
+    sont recalculés seulement sur le sous-arbre déplacé, toutes les cases sont évaluées d'un coup par
+    cost - u[:, None] - v[None, :] et le cycle de la case entrante est le chemin de l'arbre entre
+    sa ligne et sa colonne. Les bases dégénérées sont des cases de flux nul ; le coût total est mis
+    à jour à chaque pivot (thêta × coût réduit). Par défaut, la solution initiale est celle de Vogel.
+    Retourne (allocation optimale, coût total).
+    """
+    supply = np.asarray(supply)
+    demand = np.asarray(demand)
+    cost_matrix = np.asarray(cost_matrix)
+    _check_balanced(supply, demand)
+    rows, cols = len(supply), len(demand)
+
+    if initial_allocation is None:
+        initial_allocation, _ = vogel_method(supply, demand, cost_matrix)
+    initial_allocation = np.asarray(initial_allocation)
+    allocation = np.array(initial_allocation, dtype=np.result_type(initial_allocation, supply, demand))
+    same = np.allclose if allocation.dtype.kind == "f" else np.array_equal
+    if not (same(allocation.sum(axis=1), supply) and same(allocation.sum(axis=0), demand)):
+        raise ValueError("La solution initiale ne respecte pas les capacités et les demandes.")
+    total_cost = (allocation * cost_matrix).sum()
+
+    # Route k = case (k // colonnes, k % colonnes) : le flux est une vue à plat de l'allocation
+    basis = {(i, j): i * cols + j for i, j in _initial_basis(allocation, cost_matrix)}
+    tree = _BasisTree(rows, cols, basis)
+    flat_costs = cost_matrix.ravel()
+    potentials = _tree_potentials(tree, basis, flat_costs)
+    tolerance = _cost_tolerance(cost_matrix)
+
+    buffer = np.empty((rows, cols), dtype=np.result_type(cost_matrix, potentials))
+
+    def price(potentials):
+        reduced = np.subtract(cost_matrix, potentials[:rows, None], out=buffer)
+        reduced -= potentials[None, rows:]
+        flat = int(np.argmin(reduced))
+        return (flat, reduced.flat[flat]) if reduced.flat[flat] < -tolerance else (None, 0)
+
+    total_cost += _simplex_pivots(
+        tree, basis, potentials, allocation.reshape(-1), price, lambda k: divmod(k, cols), max_iterations
+    )
+    return allocation, total_cost
+
+
+def sparse_transport(supply, demand, route_rows, route_cols, route_costs, method="simplex"):
+    """
+    Problème de transport creux : seules les routes (route_rows[k], route_cols[k]) de coût
+    route_costs[k] sont autorisées (liste COO) ; la mémoire est proportionnelle au nombre de routes.
+    method="simplex" : simplexe de transport sur les routes (base de départ artificielle de coût M),
+    method="ssp" : flot de coût minimal par plus courts chemins successifs avec potentiels.
+    Retourne (quantité transportée sur chaque route, coût total).
+    """
+    supply = np.asarray(supply)
+    demand = np.asarray(demand)
+    route_rows = np.asarray(route_rows, dtype=np.int64)
+    route_cols = np.asarray(route_cols, dtype=np.int64)
+    route_costs = np.asarray(route_costs)
+    _check_balanced(supply, demand)
+
+    if method == "simplex":
+        route_flows = _sparse_simplex(supply, demand, route_rows, route_cols, route_costs)
+    elif method == "ssp":
+        route_flows = _sparse_ssp(supply, demand, route_rows, route_cols, route_costs)
+    else:
+        raise ValueError(f"Méthode inconnue : {method}")
+    return route_flows, (route_flows * route_costs).sum()
+
+
+def _infeasible(shipped, total):
+    """
+    Erreur levée quand les routes autorisées ne permettent pas de satisfaire toute la demande.
+    """
+    return ValueError(f"Aucune solution réalisable avec les routes autorisées ({shipped} unités acheminées sur {total}).")
+
+
+def _sparse_simplex(supply, demand, route_rows, route_cols, route_costs):
+    """
+    Simplexe de transport creux. Une origine artificielle (offre totale) et une destination
+    artificielle (demande totale) donnent une base de départ en étoile : chaque usine expédie vers
+    la destination artificielle, l'origine artificielle livre chaque destination, au coût M supérieur
+    à tout chemin réel. Un flux artificiel restant à l'optimum signale un problème infaisable.
+    """
+    rows, cols = len(supply), len(demand)
+    num_routes = len(route_rows)
+    total = supply.sum()
+    big = 2 * (rows + cols + 2) * np.abs(route_costs).max(initial=1) + 1
+
+    # Routes artificielles : usine i -> colonne `cols`, ligne `rows` -> destination j, ligne `rows` -> colonne `cols`
+    all_rows = np.concatenate([route_rows, np.arange(rows), np.full(cols, rows), [rows]])
+    all_cols = np.concatenate([route_cols, np.full(rows, cols), np.arange(cols), [cols]])
+    costs = np.concatenate([route_costs, np.full(rows + cols, big, dtype=route_costs.dtype), [0]])
+    flow = np.zeros(len(all_rows), dtype=np.result_type(supply, demand))
+    flow[num_routes:num_routes + rows] = supply
+    flow[num_routes + rows:num_routes + rows + cols] = demand
+
+    artificial = range(num_routes, len(all_rows))
+    basis = {(int(all_rows[k]), int(all_cols[k])): k for k in artificial}
+    tree = _BasisTree(rows + 1, cols + 1, basis)
+    potentials = _tree_potentials(tree, basis, costs)
+    tolerance = _cost_tolerance(costs)
+    column_nodes = all_cols + rows + 1
+    endpoints = list(zip(all_rows.tolist(), all_cols.tolist()))
+
+    def price(potentials):
+        reduced = costs - potentials[all_rows] - potentials[column_nodes]
+        route = int(np.argmin(reduced))
+        return (route, reduced[route]) if reduced[route] < -tolerance else (None, 0)
+
+    _simplex_pivots(tree, basis, potentials, flow, price, endpoints.__getitem__)
+
+    stranded = flow[num_routes:num_routes + rows].sum()
+    if stranded > 0:
+        raise _infeasible(total - stranded, total)
+    return flow[:num_routes]
+
+
+def _sparse_ssp(supply, demand, route_rows, route_cols, route_costs):
+    """
+    Transport creux comme flot de coût minimal : origine virtuelle -> usines -> destinations -> puits
+    virtuel, résolu par plus courts chemins successifs (moteur mincost_flow_engine).
+    """
+    rows, cols = len(supply), len(demand)
+    source, sink = rows + cols, rows + cols + 1
+
+    sources = np.concatenate([np.full(rows, source), route_rows, rows + np.arange(cols)])
+    targets = np.concatenate([np.arange(rows), rows + route_cols, np.full(cols, sink)])
+    capacities = np.concatenate([supply, np.minimum(supply[route_rows], demand[route_cols]), demand])
+    zeros = np.zeros(max(rows, cols), dtype=route_costs.dtype)
+    costs = np.concatenate([zeros[:rows], route_costs, zeros[:cols]])
+
+    # Potentiels initiaux : plus court chemin dans le graphe sans flux (coûts négatifs admis)
+    cheapest = zeros[:cols].copy()
+    np.minimum.at(cheapest, route_cols, route_costs)
+    potential = np.concatenate([zeros[:rows], cheapest, [0, cheapest.min(initial=0)]])
+
+    value, _, flows = min_cost_flow_arrays(
+        rows + cols + 2, sources, targets, capacities, costs, source, sink, potential=potential.tolist()
+    )
+    if value != supply.sum():
+        raise _infeasible(value, supply.sum())
+    return flows[rows:rows + len(route_rows)]
+
+
+def routes_to_matrix(num_rows, num_cols, route_rows, route_cols, values, fill=0):
+    """
+    Matrice dense (lignes × colonnes) à partir de valeurs par route, pour l'affichage
+    (allocation ou coûts) ; les routes interdites valent `fill`.
+    """
+    values = np.asarray(values)
+    matrix = np.full((num_rows, num_cols), fill, dtype=np.result_type(values, np.min_scalar_type(fill)))
+    matrix[route_rows, route_cols] = values
+    return matrix
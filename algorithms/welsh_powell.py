@@ -1,14 +1,46 @@
+import itertools
 import networkx as nx
-import random
 from tkinter import simpledialog, messagebox
 import matplotlib.pyplot as plt
 from matplotlib import cm
-from itertools import combinations
+import numpy as np
+from algorithms.generators import dense_edge_arrays
+from algorithms.instrumentation import annotate_figure, enabled, finish_run, instrumented_run, paused, phase
+from algorithms.welsh_powell_engine import welsh_powell_bitset
 
 
-def welsh_powell_coloring(graph):
+# Au-delà de ce nombre de sommets, le graphe colorié n'est plus dessiné
+MAX_DRAWN_NODES = 500
+# Au-delà de ce nombre de sommets, la boîte de résultats ne liste que les premiers sommets
+MAX_LISTED_NODES = 100
+
+
+def welsh_powell_coloring(graph, method="bitset"):
     """
     Implémente l'algorithme Welsh-Powell pour colorier un graphe.
+    method="bitset" utilise le moteur sur bitsets NumPy, method="python" la version d'origine ;
+    les deux produisent exactement le même coloriage.
+    """
+    if method == "python":
+        return _welsh_powell_python(graph)
+    if method != "bitset":
+        raise ValueError(f"Méthode inconnue : {method}")
+
+    nodes = list(graph.nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = list(graph.edges)
+    sources = np.fromiter((index[u] for u, _ in edges), dtype=np.int64, count=len(edges))
+    targets = np.fromiter((index[v] for _, v in edges), dtype=np.int64, count=len(edges))
+
+    node_colors, coloring_order, chromatic_number = welsh_powell_bitset(len(nodes), sources, targets)
+    node_colors = node_colors.tolist()
+    colors = {nodes[i]: node_colors[i] for i in coloring_order.tolist()}
+    return colors, chromatic_number
+
+
+def _welsh_powell_python(graph):
+    """
+    Version d'origine de Welsh-Powell, conservée pour comparaison.
     """
     sorted_nodes = sorted(graph.nodes, key=lambda x: graph.degree[x], reverse=True)
     colors = {}
@@ -31,15 +63,13 @@ def generate_dense_graph(num_nodes, density=0.5):
     """
     Génère un graphe dense en fonction du nombre de sommets et de la densité.
     La densité est une valeur entre 0 et 1 indiquant la proportion d'arêtes présentes.
+    Les arêtes sont tirées par arithmétique d'indices (voir dense_edge_arrays).
     """
     graph = nx.Graph()
     graph.add_nodes_from(range(num_nodes))
 
-    all_possible_edges = list(combinations(range(num_nodes), 2))
-    num_edges = int(len(all_possible_edges) * density)
-    sampled_edges = random.sample(all_possible_edges, num_edges)
-
-    graph.add_edges_from(sampled_edges)
+    sources, targets = dense_edge_arrays(num_nodes, density)
+    graph.add_edges_from(zip(sources.tolist(), targets.tolist()))
     return graph
 
 
@@ -48,9 +78,9 @@ def execute_welshpowell():
     Exécute l'algorithme Welsh-Powell et affiche le graphe colorié.
     """
     try:
-        num_nodes = int(simpledialog.askstring("Entrée", "Entrez le nombre de sommets du graphe (max 500) :"))
-        if num_nodes < 1 or num_nodes > 500:
-            raise ValueError("Le nombre de sommets doit être compris entre 1 et 500.")
+        num_nodes = int(simpledialog.askstring("Entrée", "Entrez le nombre de sommets du graphe :"))
+        if num_nodes < 1:
+            raise ValueError("Le nombre de sommets doit être au moins 1.")
 
         density = float(simpledialog.askstring("Entrée", "Entrez la densité des arêtes (0.1 à 1) :"))
         if density <= 0 or density > 1:
@@ -59,29 +89,49 @@ def execute_welshpowell():
         messagebox.showerror("Erreur", "Entrées invalides. Veuillez entrer des valeurs correctes.")
         return
 
-    # Génération d'un graphe dense
-    graph = generate_dense_graph(num_nodes, density)
-
-    # Application de l'algorithme Welsh-Powell
-    colors, chromatic_number = welsh_powell_coloring(graph)
-
-    # Résultats
-    result = f"Nombre chromatique (Chromatic Number) : {chromatic_number}\n\n"
-    result += "\n".join([f"Sommets {node} -> Couleur {color}" for node, color in colors.items()])
-    messagebox.showinfo("Résultats Welsh-Powell", result)
-
-    # Affichage du graphe colorié
-    pos = nx.spring_layout(graph)
-    color_map = [colors[node] for node in graph.nodes]
-    plt.figure(figsize=(12, 10))
-    nx.draw(
-        graph,
-        pos,
-        with_labels=True,
-        node_color=color_map,
-        node_size=500,
-        cmap=cm.get_cmap("rainbow", chromatic_number),
-        font_color="white",
-    )
-    plt.title(f"Coloriage du graphe (Nombre chromatique : {chromatic_number})")
-    plt.show()
+    with instrumented_run("Welsh-Powell"):
+        # Génération d'un graphe dense sous forme de tableaux d'arêtes
+        with phase("build"):
+            sources, targets = dense_edge_arrays(num_nodes, density)
+
+        # Application de l'algorithme Welsh-Powell (directement sur les tableaux d'arêtes)
+        with phase("solve"):
+            node_colors, coloring_order, chromatic_number = welsh_powell_bitset(num_nodes, sources, targets)
+        node_colors = node_colors.tolist()
+        colors = {node: node_colors[node] for node in coloring_order.tolist()}
+
+        # Résultats (avec les mesures si le graphe n'est pas dessiné)
+        result = f"Nombre chromatique (Chromatic Number) : {chromatic_number}\n\n"
+        listed = itertools.islice(colors.items(), MAX_LISTED_NODES)
+        result += "\n".join([f"Sommets {node} -> Couleur {color}" for node, color in listed])
+        if num_nodes > MAX_LISTED_NODES:
+            result += f"\n... ({num_nodes - MAX_LISTED_NODES} autres sommets non listés)"
+        if num_nodes > MAX_DRAWN_NODES and enabled():
+            result = finish_run() + "\n\n" + result
+        with paused():
+            messagebox.showinfo("Résultats Welsh-Powell", result)
+
+        # Affichage du graphe colorié (uniquement pour les graphes de taille raisonnable)
+        if num_nodes > MAX_DRAWN_NODES:
+            return
+
+        graph = nx.Graph()
+        graph.add_nodes_from(range(num_nodes))
+        graph.add_edges_from(zip(sources.tolist(), targets.tolist()))
+        with phase("layout"):
+            pos = nx.spring_layout(graph)
+        color_map = [colors[node] for node in graph.nodes]
+        with phase("render"):
+            plt.figure(figsize=(12, 10))
+            nx.draw(
+                graph,
+                pos,
+                with_labels=True,
+                node_color=color_map,
+                node_size=500,
+                cmap=cm.get_cmap("rainbow", chromatic_number),
+                font_color="white",
+            )
+            plt.title(f"Coloriage du graphe (Nombre chromatique : {chromatic_number})")
+        annotate_figure(plt.gcf())
+        plt.show()
@@ -0,0 +1,73 @@
+import numpy as np
+from algorithms.instrumentation import increment
+
+# Position du premier bit à 1 (bit de poids fort en premier, comme np.packbits) pour chaque octet
+_FIRST_BIT = np.array([8] + [7 - int(np.log2(b)) for b in range(1, 256)], dtype=np.int64)
+
+
+def set_adjacency_bits(rows, sources, targets):
+    """
+    Ajoute les arêtes non orientées (sources[k], targets[k]) à une matrice de bitsets
+    (bit de poids fort en premier, comme np.packbits), dans les deux sens.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    for u, v in ((sources, targets), (targets, sources)):
+        np.bitwise_or.at(rows, (u, v >> 3), (0x80 >> (v & 7)).astype(np.uint8))
+
+
+def packed_adjacency(num_nodes, sources, targets):
+    """
+    Matrice d'adjacence en bitsets : une ligne de ceil(n / 8) octets par sommet.
+    """
+    rows = np.zeros((num_nodes, (num_nodes + 7) // 8), dtype=np.uint8)
+    set_adjacency_bits(rows, sources, targets)
+    return rows
+
+
+def welsh_powell_bitset(num_nodes, sources, targets):
+    """
+    Welsh-Powell sur bitsets. Les sommets sont renumérotés par degré décroissant (tri stable),
+    si bien que « le premier sommet non colorié dans l'ordre » est le premier bit disponible.
+    Chaque classe de couleur est construite avec un masque « interdit » mis à jour par OU vectorisé
+    avec la ligne d'adjacence de chaque sommet colorié.
+    Retourne (couleur de chaque sommet à partir de 1, ordre de coloriage, nombre de couleurs).
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+
+    degree = np.bincount(sources, minlength=num_nodes) + np.bincount(targets, minlength=num_nodes)
+    order = np.argsort(-degree, kind="stable")
+    position = np.empty(num_nodes, dtype=np.int64)
+    position[order] = np.arange(num_nodes)
+
+    rows = packed_adjacency(num_nodes, position[sources], position[targets])
+    uncolored = np.packbits(np.ones(num_nodes, dtype=bool))
+    colors = np.zeros(num_nodes, dtype=np.int64)  # Indexé par position dans l'ordre
+    current_color = 0
+
+    while True:
+        remaining = np.flatnonzero(uncolored)
+        if not len(remaining):
+            break
+        current_color += 1
+        forbidden = np.zeros_like(uncolored)
+        byte = remaining[0]
+
+        while True:
+            # Premier sommet non colorié et non interdit, à partir de l'octet courant
+            candidates = uncolored[byte:] & ~forbidden[byte:]
+            nonzero = np.flatnonzero(candidates)
+            if not len(nonzero):
+                break
+            byte += nonzero[0]
+            node = byte * 8 + _FIRST_BIT[uncolored[byte] & ~forbidden[byte]]
+            colors[node] = current_color
+            uncolored[byte] &= ~np.uint8(0x80 >> (node & 7))
+            forbidden |= rows[node]
+
+    increment("color_passes", current_color)
+    node_colors = colors[position]
+    # Ordre de coloriage : par couleur, puis dans l'ordre de degré décroissant
+    coloring_order = order[np.lexsort((np.arange(num_nodes), colors))]
+    return node_colors, coloring_order, current_color
@@ -5,15 +5,116 @@ import os
 import sys
 from PIL import Image, ImageTk, ImageDraw, ImageFont  # Assurez-vous d'avoir Pillow installé : pip install pillow
 from tkinter import messagebox
-from algorithms.welsh_powell import execute_welshpowell
-from algorithms.dijkstra import execute_dijkstra
-from algorithms.kruskal import execute_kruskal
-from algorithms.bellman_ford import execute_bellman_ford
-from algorithms.potentiel_metra import execute_potentiel_metra
-from algorithms.moindre_cout import execute_moindre_cout
-from algorithms.nord_ouest import execute_nord_ouest
-from algorithms.stepping_stone import execute_stepping_stone
-from algorithms.ford_fulkerson import execute_ford_fulkerson
+import importlib
+import subprocess
+import threading
+import time
+
+# Backend Matplotlib de l'application, lu seulement quand Matplotlib est importé
+os.environ.setdefault("MPLBACKEND", "TkAgg")
+
+# Algorithmes du menu : (nom affiché, module, fonction d'exécution).
+# Un module (et networkx, matplotlib...) n'est importé qu'au premier clic sur son bouton,
+# ou en arrière-plan une fois la fenêtre principale affichée.
+ALGORITHMS = [
+    ("Welsh-Powell", "algorithms.welsh_powell", "execute_welshpowell"),
+    ("Dijkstra", "algorithms.dijkstra", "execute_dijkstra"),
+    ("Kruskal", "algorithms.kruskal", "execute_kruskal"),
+    ("Bellman-Ford", "algorithms.bellman_ford", "execute_bellman_ford"),
+    ("Potentiel Métra", "algorithms.potentiel_metra", "execute_potentiel_metra"),
+    ("Moindre Coût", "algorithms.moindre_cout", "execute_moindre_cout"),
+    ("Nord-Ouest", "algorithms.nord_ouest", "execute_nord_ouest"),
+    ("Stepping Stone", "algorithms.stepping_stone", "execute_stepping_stone"),
+    ("Ford-Fulkerson", "algorithms.ford_fulkerson", "execute_ford_fulkerson"),
+]
+
+# Délai avant le préchargement en arrière-plan, une fois la fenêtre affichée
+PREWARM_DELAY_MS = 500
+
+# Durée d'import (secondes) de chaque module déjà chargé
+import_times = {}
+_import_lock = threading.Lock()
+
+
+def import_module_timed(module_name):
+    """
+    Importe un module une seule fois, en mesurant la durée de son premier import.
+    """
+    with _import_lock:
+        if module_name not in import_times:
+            started = time.perf_counter()
+            importlib.import_module(module_name)
+            import_times[module_name] = time.perf_counter() - started
+    return sys.modules[module_name]
+
+
+def load_algorithm(module_name, function_name):
+    """
+    Retourne la fonction d'exécution d'un algorithme, en important son module au premier appel.
+    """
+    return getattr(import_module_timed(module_name), function_name)
+
+
+def prewarm_algorithms():
+    """
+    Importe dans un thread démon les modules pas encore chargés, pour que le premier clic soit immédiat.
+    Une erreur d'import est ignorée ici : elle sera signalée au clic sur le bouton.
+    """
+    def prewarm():
+        for _, module_name, _ in ALGORITHMS:
+            try:
+                import_module_timed(module_name)
+            except Exception:
+                pass
+
+    threading.Thread(target=prewarm, name="prewarm", daemon=True).start()
+
+
+# Dépendances coûteuses surveillées par le rapport d'import
+HEAVY_MODULES = ("networkx", "numpy", "matplotlib", "pandas")
+
+# Mesure de l'import d'un module dans un interpréteur neuf (sys.argv[1])
+_IMPORT_PROBE = (
+    "import importlib, sys, time\n"
+    "started = time.perf_counter()\n"
+    "importlib.import_module(sys.argv[1])\n"
+    "print(time.perf_counter() - started, *[m for m in sys.argv[2:] if m in sys.modules])\n"
+)
+
+
+def import_report():
+    """
+    Mesure le coût d'import au démarrage (main.py seul) puis celui de chaque algorithme,
+    chacun dans un interpréteur neuf pour ne pas dépendre de l'ordre des imports.
+    Dans l'exécutable PyInstaller, les algorithmes sont importés dans ce processus : la durée
+    d'un module exclut alors les dépendances déjà chargées par les précédents.
+    Retourne une liste de (module, secondes, dépendances coûteuses chargées).
+    """
+    report = []
+    if getattr(sys, "frozen", False):
+        for _, module_name, _ in ALGORITHMS:
+            import_module_timed(module_name)
+            loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+            report.append((module_name, import_times[module_name], loaded))
+        return report
+
+    for module_name in ["main"] + [module_name for _, module_name, _ in ALGORITHMS]:
+        output = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE, module_name, *HEAVY_MODULES],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.split()
+        report.append((module_name, float(output[0]), output[1:]))
+    return report
+
+
+def print_import_report():
+    """
+    Affiche le rapport des durées d'import dans la console.
+    """
+    print(f"{'Module':<30}{'Import (ms)':>12}  Modules lourds chargés")
+    for module_name, elapsed, loaded in import_report():
+        print(f"{module_name:<30}{elapsed * 1000:>12.1f}  {', '.join(loaded) or '-'}")
 
 
 def execute_algorithm(command, name):
@@ -48,17 +149,10 @@ def open_algo_menu():
     )
     menu_label.pack(pady=20)
 
-    # Liste des algorithmes avec leur commande
+    # Liste des algorithmes avec leur commande (module importé au premier clic)
     algo_list = [
-        ("Welsh-Powell", execute_welshpowell),
-        ("Dijkstra", execute_dijkstra),
-        ("Kruskal", execute_kruskal),
-        ("Bellman-Ford", execute_bellman_ford),
-        ("Potentiel Métra", execute_potentiel_metra),
-        ("Moindre Coût", execute_moindre_cout),
-        ("Nord-Ouest", execute_nord_ouest),
-        ("Stepping Stone", execute_stepping_stone),
-        ("Ford-Fulkerson", execute_ford_fulkerson),
+        (name, lambda m=module_name, f=function_name: load_algorithm(m, f)())
+        for name, module_name, function_name in ALGORITHMS
     ]
 
     # Création des boutons pour chaque algorithme
@@ -99,9 +193,10 @@ def open_algo_menu():
     exit_button.pack(side="bottom", pady=20)
 
 
-def open_main_window():
+def open_main_window(prewarm=True):
     """
     Ouvre la fenêtre principale avec un logo et une interface modernisée.
+    prewarm=True précharge les algorithmes en arrière-plan une fois la fenêtre affichée.
     """
     global gui
     gui = tk.Tk()
@@ -188,9 +283,19 @@ def open_main_window():
     )
     exit_button.pack(pady=20)
 
+    if prewarm:
+        gui.after(PREWARM_DELAY_MS, prewarm_algorithms)
+
     # Lancer l'application
     gui.mainloop()
 
 
 if __name__ == "__main__":
-    open_main_window()
\ No newline at end of file
+    if "--no-instrumentation" in sys.argv or "--trace-memory" in sys.argv:
+        # Import léger (bibliothèque standard) : n'affecte pas le démarrage
+        from algorithms.instrumentation import configure
+        configure(enabled="--no-instrumentation" not in sys.argv, trace_memory="--trace-memory" in sys.argv)
+    if "--import-report" in sys.argv:
+        print_import_report()
+    else:
+        open_main_window(prewarm="--no-prewarm" not in sys.argv)
\ No newline at end of file
@@ -6,7 +6,12 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('logo-1.png', '.'), ('algorithms', 'algorithms')],
-    hiddenimports=[],
+    # Algorithmes importés à la demande par main.py (importlib) : à déclarer pour l'analyse
+    hiddenimports=[
+        'algorithms.welsh_powell', 'algorithms.dijkstra', 'algorithms.kruskal',
+        'algorithms.bellman_ford', 'algorithms.potentiel_metra', 'algorithms.moindre_cout',
+        'algorithms.nord_ouest', 'algorithms.stepping_stone', 'algorithms.ford_fulkerson',
+    ],
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
@@ -0,0 +1,123 @@
+import json
+import os
+import subprocess
+import sys
+import networkx as nx
+import numpy as np
+import pytest
+from algorithms.__main__ import main
+from algorithms.batch import load_instances, run_batch, solve
+from algorithms.generators import transport_instance
+from algorithms.transport_engine import transport_simplex
+
+EDGES = [["a", "b", 4], ["a", "c", 1], ["c", "b", 2], ["b", "d", 5], ["c", "d", 8]]
+
+
+def _graph(directed):
+    graph = nx.DiGraph() if directed else nx.Graph()
+    graph.add_weighted_edges_from(EDGES)
+    return graph
+
+
+def test_solve_shortest_paths():
+    result = solve({"algorithm": "dijkstra", "edges": EDGES, "source": "a"})
+    expected = nx.single_source_dijkstra_path_length(_graph(False), "a")
+    assert dict(zip(result["nodes"], result["distances"])) == expected
+
+    result = solve({"algorithm": "Bellman-Ford", "edges": EDGES + [["d", "c", -3]], "source": "a"})
+    graph = _graph(True)
+    graph.add_edge("d", "c", weight=-3)
+    assert dict(zip(result["nodes"], result["distances"])) == nx.single_source_bellman_ford_path_length(graph, "a")
+
+    with pytest.raises(ValueError):
+        solve({"algorithm": "bellman_ford", "edges": EDGES + [["d", "c", -20]], "source": "a"})
+
+
+def test_solve_graph_algorithms():
+    result = solve({"algorithm": "kruskal", "edges": EDGES})
+    assert result["total_weight"] == nx.minimum_spanning_tree(_graph(False)).size(weight="weight")
+
+    result = solve({"algorithm": "ford_fulkerson", "edges": EDGES, "source": "a", "sink": "d"})
+    assert result["max_flow"] == nx.maximum_flow_value(_graph(True), "a", "d", capacity="weight")
+
+    result = solve({"algorithm": "welsh_powell", "edges": EDGES})
+    colors = dict(zip(result["nodes"], result["colors"]))
+    assert all(colors[u] != colors[v] for u, v, _ in EDGES)
+
+    result = solve({"algorithm": "potentiel_metra", "edges": EDGES})
+    # Durée d'une tâche = poids maximal de ses arcs entrants
+    tasks = nx.DiGraph()
+    tasks.add_weighted_edges_from((u, v, max(w for _, x, w in EDGES if x == v)) for u, v, _ in EDGES)
+    assert result["total_duration"] == nx.dag_longest_path_length(tasks)
+    assert result["levels"] == [0, 2, 1, 3]
+
+
+@pytest.mark.parametrize("algorithm", ["nord_ouest", "moindre_cout", "stepping_stone"])
+def test_solve_transport(algorithm):
+    instance = transport_instance(5, 6, 0)
+    result = solve({key: value.tolist() for key, value in instance.items()}, algorithm)
+    allocation = np.array(result["allocation"])
+    assert np.array_equal(allocation.sum(axis=1), instance["supply"])
+    assert np.array_equal(allocation.sum(axis=0), instance["demand"])
+    assert result["total_cost"] == (allocation * instance["costs"]).sum()
+    if algorithm == "stepping_stone":
+        assert result["total_cost"] == transport_simplex(instance["supply"], instance["demand"], instance["costs"])[1]
+
+
+@pytest.mark.parametrize("instance, key", [
+    ({"algorithm": "dijkstra", "edges": [[0, 1]]}, '"source"'),
+    ({"algorithm": "ford_fulkerson", "sources": [0], "targets": [1], "source": 0}, '"sink"'),
+    ({"algorithm": "kruskal", "sources": [0]}, '"edges" ou "sources" / "targets"'),
+    ({"algorithm": "nord_ouest", "supply": [1], "demand": [1]}, '"costs"'),
+    ({"algorithm": "stepping_stone", "supply": [1], "demand": [1]}, '"costs" ou "routes"'),
+])
+def test_solve_names_missing_key(instance, key):
+    with pytest.raises(ValueError, match=f"clé {key} manquante"):
+        solve(instance)
+
+
+def test_solve_requires_a_known_algorithm():
+    with pytest.raises(ValueError):
+        solve({"edges": EDGES})
+    with pytest.raises(ValueError):
+        solve({"edges": EDGES}, "inconnu")
+
+
+def test_load_instances_keeps_going_after_bad_line(tmp_path):
+    path = tmp_path / "instances.jsonl"
+    path.write_text('{"edges": [[0, 1, 2]], "source": 0}\n{invalide\n\n[1, 2]\n{"edges": [[0, 1, 3]], "source": 1}\n')
+    records = list(run_batch(load_instances(str(path)), algorithm="dijkstra"))
+    assert [record["id"] for record in records] == [0, 1, 2, 3]
+    assert records[1]["error"].startswith("Ligne 2 :") and records[2]["error"].startswith("Ligne 4 :")
+    assert records[0]["result"]["distances"] == [0, 2] and records[3]["result"]["distances"] == [3, 0]
+
+
+def test_load_instances_multiline_document(tmp_path):
+    path = tmp_path / "instances.json"
+    path.write_text(json.dumps([{"edges": [[0, 1, 2]], "source": 0}] * 3, indent=2))
+    assert len(list(load_instances(str(path)))) == 3
+
+
+def test_run_batch_keeps_input_order():
+    instances = [{"edges": [[0, 1, k], [1, 2, 1]], "source": 0} for k in range(1, 40)]
+    records = list(run_batch(iter(instances), algorithm="dijkstra", max_workers=2, chunk_size=3))
+    assert [record["id"] for record in records] == list(range(39))
+    assert [record["result"]["distances"][1] for record in records] == list(range(1, 40))
+
+
+def test_main_exit_code(tmp_path):
+    path = tmp_path / "instances.jsonl"
+    output = tmp_path / "results.jsonl"
+    path.write_text('{"algorithm": "kruskal", "edges": [[0, 1, 2]]}\n')
+    assert main([str(path), "-o", str(output)]) == 0
+    path.write_text('{"algorithm": "dijkstra", "edges": [[0, 1, 2]], "source": 5}\n')
+    assert main([str(path), "-o", str(output)]) == 1
+    assert "error" in json.loads(output.read_text())
+
+
+def test_batch_is_headless():
+    # Exécution sans interface : ni tkinter ni matplotlib ne sont importés
+    code = "import sys, algorithms.batch; print(sorted({'tkinter', 'matplotlib'} & set(sys.modules)))"
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=root).stdout
+    assert output.strip() == "[]"
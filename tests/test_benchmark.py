@@ -0,0 +1,84 @@
+import json
+import pytest
+from algorithms.benchmark import SUITES, compare_runs, format_comparison, main, run_case
+
+MIB = 2**20
+
+
+def _record(case, wall_time, peak_memory=MIB, counts=None, **extra):
+    return {"case": case, "wall_time": wall_time, "peak_memory": peak_memory, "counts": counts or {}, **extra}
+
+
+BASELINE = {"results": [
+    _record("lent", 1.0),
+    _record("rapide", 1.0),
+    _record("stable", 1.0, counts={"pivots": 3}),
+    _record("faux", 1.0),
+    _record("bruit temps", 0.0001),
+    _record("bruit mémoire", 1.0, peak_memory=1000),
+    _record("mémoire", 1.0),
+    _record("retiré", 1.0),
+]}
+CURRENT = {"results": [
+    _record("lent", 1.2),
+    _record("rapide", 0.5),
+    _record("stable", 1.05, counts={"pivots": 4}),
+    _record("faux", 1.0, matches_reference=False),
+    # 5 fois plus lent, mais de moins de min_delta (1 ms) : bruit de mesure
+    _record("bruit temps", 0.0005),
+    # 50 fois plus de mémoire, mais moins de 64 Kio de plus
+    _record("bruit mémoire", 1.0, peak_memory=50000),
+    _record("mémoire", 1.0, peak_memory=2 * MIB),
+    _record("ajouté", 1.0),
+]}
+
+
+def test_compare_runs_statuses():
+    rows = {row["case"]: row for row in compare_runs(BASELINE, CURRENT)}
+    assert {case: row["status"] for case, row in rows.items()} == {
+        "lent": "RÉGRESSION",
+        "rapide": "amélioration",
+        "stable": "stable",
+        "faux": "ERREUR",
+        "bruit temps": "stable",
+        "bruit mémoire": "stable",
+        "mémoire": "RÉGRESSION",
+        "ajouté": "nouveau",
+        "retiré": "absent",
+    }
+    assert rows["lent"]["time_ratio"] == pytest.approx(1.2) and rows["mémoire"]["memory_ratio"] == 2
+    assert rows["stable"]["counts_changed"] and not rows["lent"]["counts_changed"]
+
+
+def test_compare_runs_thresholds():
+    rows = compare_runs(BASELINE, CURRENT, threshold=0.25, min_delta=1e-5)
+    statuses = {row["case"]: row["status"] for row in rows}
+    assert statuses["lent"] == "stable" and statuses["bruit temps"] == "RÉGRESSION"
+
+
+def test_format_comparison():
+    text = format_comparison(compare_runs(BASELINE, CURRENT))
+    lines = text.splitlines()
+    assert len(lines) == 1 + len(CURRENT["results"]) + 1
+    assert "stable (compteurs modifiés)" in text
+    for status in ("RÉGRESSION", "amélioration", "ERREUR", "nouveau", "absent"):
+        assert status in text
+
+
+def test_compare_command_exit_code(tmp_path, capsys):
+    baseline, current = tmp_path / "avant.json", tmp_path / "après.json"
+    baseline.write_text(json.dumps(BASELINE))
+    current.write_text(json.dumps(CURRENT))
+    assert main(["compare", str(baseline), str(current)]) == 1
+    assert "RÉGRESSION" in capsys.readouterr().out
+    assert main(["compare", str(baseline), str(baseline), "--json"]) == 0
+    rows = json.loads(capsys.readouterr().out)
+    assert {row["status"] for row in rows} == {"stable"}
+
+
+@pytest.mark.parametrize("suite", sorted(SUITES))
+def test_run_case_matches_reference(suite):
+    params, _ = SUITES[suite]["cases"][0]
+    record = run_case(suite, params, repeat=1)
+    assert record["wall_time"] > 0 and record["peak_memory"] > 0
+    assert record.get("matches_reference", True)
@@ -0,0 +1,33 @@
+import networkx as nx
+import numpy as np
+import pytest
+from algorithms.welsh_powell import welsh_powell_coloring
+from algorithms.welsh_powell_engine import packed_adjacency, welsh_powell_bitset
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+@pytest.mark.parametrize("density", [0.1, 0.5, 0.9])
+def test_welsh_powell_bitset_matches_python(seed, density):
+    graph = nx.gnp_random_graph(80, density, seed=seed)
+    colors, count = welsh_powell_coloring(graph)
+    assert (colors, count) == welsh_powell_coloring(graph, method="python")
+    assert all(colors[u] != colors[v] for u, v in graph.edges)
+    # Glouton par degré décroissant de networkx : même nombre de couleurs
+    reference = nx.greedy_color(graph, strategy="largest_first")
+    assert count == max(reference.values()) + 1
+
+
+def test_welsh_powell_labelled_nodes():
+    graph = nx.relabel_nodes(nx.petersen_graph(), {i: f"s{i}" for i in range(10)})
+    assert welsh_powell_coloring(graph) == welsh_powell_coloring(graph, method="python")
+
+
+def test_welsh_powell_bitset_on_arrays():
+    graph = nx.gnm_random_graph(70, 700, seed=3)
+    sources, targets = np.array(graph.edges).T
+    rows = packed_adjacency(70, sources, targets)
+    assert np.array_equal(np.unpackbits(rows, axis=1, count=70), nx.to_numpy_array(graph, dtype=np.uint8))
+
+    colors, order, count = welsh_powell_bitset(70, sources, targets)
+    assert sorted(order.tolist()) == list(range(70)) and colors.max() == count
+    assert np.all(colors[sources] != colors[targets])
@@ -0,0 +1,77 @@
+import networkx as nx
+import numpy as np
+import pytest
+from algorithms.generators import (
+    dense_bitset, dense_edge_arrays, gnp_edge_arrays, gnp_graph_instance, max_edges, random_edge_arrays, random_graph,
+)
+from algorithms.welsh_powell_engine import packed_adjacency
+
+
+def _pairs(sources, targets, directed):
+    pairs = list(zip(sources.tolist(), targets.tolist()))
+    return pairs if directed else [tuple(sorted(pair)) for pair in pairs]
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("num_edges", [0, 300, "max"])
+def test_random_edge_arrays(directed, num_edges):
+    n = 40
+    if num_edges == "max":
+        num_edges = max_edges(n, directed)
+    sources, targets, weights = random_edge_arrays(n, num_edges, directed=directed, weight_range=(1, 5), seed=4)
+    pairs = _pairs(sources, targets, directed)
+    assert len(set(pairs)) == len(pairs) == num_edges
+    assert np.all(sources != targets) and np.all((0 <= sources) & (sources < n)) and np.all(targets < n)
+    assert np.all((1 <= weights) & (weights <= 5))
+
+
+def test_random_edge_arrays_seed_and_weight_types():
+    first = random_edge_arrays(100, 500, seed=1, weight_range=(0.5, 2.0))
+    second = random_edge_arrays(100, 500, seed=1, weight_range=(0.5, 2.0))
+    assert all(np.array_equal(a, b) for a, b in zip(first, second))
+    assert first[2].dtype.kind == "f" and first[2].min() >= 0.5 and first[2].max() <= 2.0
+
+
+def test_random_edge_arrays_rejects_too_many_edges():
+    with pytest.raises(ValueError):
+        random_edge_arrays(10, max_edges(10) + 1)
+    with pytest.raises(ValueError):
+        random_edge_arrays(10, max_edges(10, directed=True) + 1, directed=True)
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_random_graph(directed):
+    graph = random_graph(50, 200, directed=directed, weight="capacity", seed=2)
+    assert isinstance(graph, nx.DiGraph) == directed
+    assert graph.number_of_nodes() == 50 and graph.number_of_edges() == 200
+    assert all(1 <= data["capacity"] <= 100 for _, _, data in graph.edges(data=True))
+
+
+@pytest.mark.parametrize("density", [0.0, 0.3, 1.0])
+def test_dense_edge_arrays(density):
+    n = 50
+    sources, targets = dense_edge_arrays(n, density, seed=3)
+    assert np.all(sources < targets) and targets.max(initial=0) < n
+    assert len(set(_pairs(sources, targets, False))) == len(sources) == int(density * max_edges(n))
+    assert np.array_equal(dense_bitset(n, density, seed=3, chunk_size=64), packed_adjacency(n, sources, targets))
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("probability", [0.0, 0.01, 0.2, 1.0])
+def test_gnp_edge_arrays(directed, probability):
+    n = 600
+    limit = max_edges(n, directed)
+    sources, targets = gnp_edge_arrays(n, probability, directed=directed, seed=5)
+    pairs = _pairs(sources, targets, directed)
+    assert len(set(pairs)) == len(pairs)
+    assert np.all(sources != targets) and np.all((0 <= sources) & (sources < n)) and np.all(targets < n)
+    # Nombre d'arêtes binomial(limit, p) : à moins de 5 écarts-types de la moyenne
+    assert abs(len(pairs) - limit * probability) <= 5 * np.sqrt(limit * probability * (1 - probability))
+
+
+def test_gnp_graph_instance():
+    graph = gnp_graph_instance(300, 0.05, 0)["graph"]
+    assert graph.number_of_nodes() == 300 and not graph.is_directed()
+    assert nx.utils.graphs_equal(graph, gnp_graph_instance(300, 0.05, 0)["graph"])
+    with pytest.raises(ValueError):
+        gnp_edge_arrays(10, 1.5)
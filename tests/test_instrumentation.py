@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from algorithms import instrumentation
+from algorithms.generators import flow_network_instance, random_edge_arrays, transport_instance
+from algorithms.instrumentation import configure, increment, instrumented_run, last_record, paused, phase
+from algorithms.maxflow_engine import max_flow_arrays
+from algorithms.transport_engine import least_cost_method, transport_simplex
+from algorithms.welsh_powell_engine import welsh_powell_bitset
+
+
+@pytest.fixture(autouse=True)
+def default_settings():
+    # Réglages globaux : chaque test repart des valeurs par défaut
+    yield
+    configure(enabled=True, trace_memory=False)
+
+
+def test_no_op_outside_a_run():
+    assert not instrumentation.enabled()
+    with phase("solve"):
+        increment("pivots", 5)
+    assert instrumentation._active is None and instrumentation.finish_run() == ""
+
+
+def test_disabled_runs_yield_none():
+    configure(enabled=False)
+    with instrumented_run("désactivé") as run:
+        assert run is None and not instrumentation.enabled()
+        increment("pivots")
+
+
+def test_phases_and_counters():
+    with instrumented_run("mesure") as run:
+        with phase("build"):
+            pass
+        with phase("solve"):
+            increment("pivots", 2)
+            increment("pivots")
+        with paused():
+            pass
+    assert last_record() is run and instrumentation._active is None
+    assert set(run.phases) == {"build", "solve"} and run.total_time >= sum(run.phases.values())
+    assert run.counters == {"pivots": 3} and run.peak_memory is None
+    assert "Pivots : 3" in run.summary()
+
+
+def test_engine_counters():
+    instance = flow_network_instance(60, 400, 0)
+    graph = instance["graph"]
+    edges = list(graph.edges(data="capacity"))
+    sources, targets, capacities = (np.array(column) for column in zip(*edges))
+    with instrumented_run("dinic") as run:
+        _, _, paths = max_flow_arrays(60, sources, targets, capacities, 0, 59, record_paths=True)
+    assert run.counters["augmenting_paths"] == len(paths) > 0 and run.counters["blocking_flow_phases"] > 0
+
+    transport = transport_instance(10, 12, 0)
+    initial, _ = least_cost_method(transport["supply"], transport["demand"], transport["costs"])
+    with instrumented_run("simplexe") as run:
+        transport_simplex(transport["supply"], transport["demand"], transport["costs"], initial)
+    assert run.counters["pivots"] > 0
+
+    sources, targets, _ = random_edge_arrays(50, 400, seed=0)
+    with instrumented_run("coloriage") as run:
+        _, _, num_colors = welsh_powell_bitset(50, sources, targets)
+    assert run.counters["color_passes"] == num_colors
+
+
+def test_nested_runs_restore_the_outer_run():
+    with instrumented_run("extérieur") as outer:
+        with instrumented_run("intérieur") as inner:
+            increment("pivots")
+        increment("levels")
+    assert inner.counters == {"pivots": 1} and outer.counters == {"levels": 1}
+
+
+@pytest.mark.parametrize("configured", [False, True])
+def test_trace_memory(configured):
+    if configured:
+        configure(trace_memory=True)
+    with instrumented_run("mémoire", trace_memory=None if configured else True) as run:
+        with phase("solve"):
+            data = np.ones(1 << 20)
+        del data
+    assert run.peak_memory >= 8 << 20
+    # Durées faussées par tracemalloc : non rapportées
+    assert run.total_time is None and run.phases == {}
+    assert run.as_dict()["total_time"] is None
+    assert "durées non mesurées" in run.summary()
+
+
+def test_trace_memory_is_off_by_default():
+    with instrumented_run("défaut") as run:
+        pass
+    assert run.peak_memory is None and run.total_time is not None
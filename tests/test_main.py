@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code):
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=ROOT).stdout
+
+
+def test_main_imports_no_algorithm_module():
+    code = (
+        "import sys, main\n"
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in ('networkx', 'numpy', 'matplotlib')"
+        " or m.startswith('algorithms.')))"
+    )
+    assert _run(code).strip() == "[]"
+
+
+def test_load_algorithm_imports_on_first_call():
+    code = (
+        "import sys, main\n"
+        "for label, module, function in main.ALGORITHMS:\n"
+        "    assert callable(main.load_algorithm(module, function)), label\n"
+        "print(sorted(main.import_times) == sorted(module for _, module, _ in main.ALGORITHMS))"
+    )
+    assert _run(code).strip() == "True"
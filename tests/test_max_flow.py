@@ -0,0 +1,72 @@
+import networkx as nx
+import numpy as np
+import pytest
+from algorithms.ford_fulkerson import ford_fulkerson_algorithm
+from algorithms.generators import flow_network_instance
+from algorithms.maxflow_engine import IncrementalMaxFlow, max_flow_arrays
+
+
+def _check_flow(graph, flow_graph, source, sink, value):
+    """
+    Capacités respectées et conservation du flot en chaque sommet intermédiaire.
+    """
+    balance = dict.fromkeys(graph.nodes, 0)
+    for u, v, data in flow_graph.edges(data=True):
+        assert 0 <= data["flow"] <= data["capacity"]
+        balance[u] -= data["flow"]
+        balance[v] += data["flow"]
+    assert balance[sink] == value and balance[source] == -value
+    assert all(balance[node] == 0 for node in graph.nodes if node not in (source, sink))
+
+
+@pytest.mark.parametrize("method", ["dinic", "push_relabel", "bfs"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_max_flow_matches_networkx(method, seed):
+    instance = flow_network_instance(60, 400, seed)
+    graph, source, sink = instance["graph"], instance["source"], instance["sink"]
+    value, flow_graph, _ = ford_fulkerson_algorithm(graph, source, sink, method=method)
+    assert value == nx.maximum_flow_value(graph, source, sink)
+    if method != "bfs":
+        _check_flow(graph, flow_graph, source, sink, value)
+
+
+def test_dinic_records_augmenting_paths():
+    instance = flow_network_instance(40, 200, 3)
+    value, _, paths = ford_fulkerson_algorithm(instance["graph"], instance["source"], instance["sink"])
+    assert sum(path_flow for _, path_flow in paths) == value
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_incremental_max_flow_matches_recompute(seed):
+    instance = flow_network_instance(50, 300, seed)
+    graph, source, sink = instance["graph"], instance["source"], instance["sink"]
+    flow = IncrementalMaxFlow.from_graph(graph, source, sink)
+    rng = np.random.default_rng(seed)
+    edges = list(graph.edges)
+    for step in range(20):
+        u, v = edges[rng.integers(len(edges))]
+        graph[u][v]["capacity"] = int(rng.integers(0, 120))
+        value = flow.set_capacity(u, v, graph[u][v]["capacity"])
+        assert value == nx.maximum_flow_value(graph, source, sink)
+
+    flows = flow.flows()
+    flow_graph = nx.DiGraph()
+    flow_graph.add_edges_from(
+        (u, v, {"capacity": c, "flow": f}) for (u, v, c), f in zip(graph.edges(data="capacity"), flows.tolist())
+    )
+    _check_flow(graph, flow_graph, source, sink, flow.value)
+
+    source_side, cut_edges = flow.min_cut()
+    assert source in source_side and sink not in source_side
+    assert sum(graph[u][v]["capacity"] for u, v in cut_edges) == flow.value
+
+
+def test_incremental_max_flow_float_capacity():
+    flow = IncrementalMaxFlow(3, [0, 1], [1, 2], [5, 5], 0, 2)
+    assert flow.set_capacity(1, 2, 2.5) == 2.5
+    np.testing.assert_array_equal(flow.flows(), [2.5, 2.5])
+
+
+def test_max_flow_arrays_unknown_method():
+    with pytest.raises(ValueError):
+        max_flow_arrays(2, [0], [1], [1], 0, 1, method="inconnue")
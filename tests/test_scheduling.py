@@ -0,0 +1,123 @@
+import random
+import networkx as nx
+import numpy as np
+import pytest
+from algorithms.cpm_engine import IncrementalSchedule, critical_path_arrays, edges_to_arrays
+from algorithms.generators import project_instance
+from algorithms.pert_engine import monte_carlo_pert, sample_durations
+from algorithms.potentiel_metra import potentiel_metra_algorithm_with_details
+
+KEYS = ("start_times", "finish_times", "late_start", "late_finish", "free_margin", "total_margin",
+        "critical_path", "total_duration", "levels")
+
+
+def _task_graph(instance):
+    """
+    Graphe des tâches où l'arc (u, v) vaut la durée de v (poids maximal de ses arcs entrants).
+    """
+    duration = {}
+    for u, v, w in instance["edges"]:
+        duration[v] = max(duration.get(v, 0), w)
+    graph = nx.DiGraph()
+    graph.add_nodes_from(instance["nodes"])
+    graph.add_weighted_edges_from((u, v, duration[v]) for u, v, _ in instance["edges"])
+    return graph
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_potentiel_metra_arrays_matches_python(seed):
+    instance = project_instance(200, seed)
+    result = potentiel_metra_algorithm_with_details(instance["nodes"], instance["edges"])
+    expected = potentiel_metra_algorithm_with_details(instance["nodes"], instance["edges"], method="python")
+    assert {key: result[key] for key in KEYS} == {key: expected[key] for key in KEYS}
+    assert result["total_duration"] == nx.dag_longest_path_length(_task_graph(instance))
+
+
+def test_potentiel_metra_rejects_cycle():
+    with pytest.raises(ValueError):
+        potentiel_metra_algorithm_with_details([1, 2, 3], [(1, 2, 1), (2, 3, 1), (3, 1, 1)])
+
+
+def test_critical_path_arrays_scenario_batch():
+    instance = project_instance(100, 3)
+    sources, targets, weights = edges_to_arrays(instance["nodes"], instance["edges"])
+    scenarios = np.random.default_rng(0).integers(1, 20, size=(4, len(weights)))
+    batch = critical_path_arrays(len(instance["nodes"]), sources, targets, scenarios)
+    for k, scenario in enumerate(scenarios):
+        single = critical_path_arrays(len(instance["nodes"]), sources, targets, scenario)
+        for key in ("start_times", "finish_times", "late_start", "free_margin", "total_margin", "total_duration"):
+            assert np.array_equal(batch[key][k], single[key]), key
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_incremental_schedule_matches_recomputation(seed):
+    instance = project_instance(150, seed)
+    nodes, edges = instance["nodes"], instance["edges"]
+    schedule = IncrementalSchedule.from_edges(nodes, edges)
+    sources, targets, _ = edges_to_arrays(nodes, edges)
+    weights = {(u, v): w for u, v, w in edges}
+
+    rng = random.Random(seed)
+    critical = set(np.flatnonzero(schedule.arrays()["total_margin"] == 0).tolist())
+    for _ in range(30):
+        u, v, _ = rng.choice(edges)
+        weights[u, v] = rng.randint(1, 20)
+        became, left = schedule.set_weight(u, v, weights[u, v])
+
+        current = schedule.arrays()
+        expected = critical_path_arrays(len(nodes), sources, targets, [weights[u, v] for u, v, _ in edges])
+        for key, values in expected.items():
+            assert np.array_equal(current[key], values), key
+
+        # Changements de statut critique rapportés : différence avec l'état précédent
+        now = set(np.flatnonzero(expected["total_margin"] == 0).tolist())
+        assert {schedule.index[node] for node in became} == now - critical
+        assert {schedule.index[node] for node in left} == critical - now
+        critical = now
+
+
+def test_incremental_schedule_float_weight():
+    schedule = IncrementalSchedule.from_edges([1, 2, 3], [(1, 2, 3), (2, 3, 4)])
+    schedule.set_weight(2, 3, 4.5)
+    assert schedule.arrays()["total_duration"] == 7.5
+
+
+def _pert_project(seed):
+    instance = project_instance(60, seed)
+    sources, targets, weights = edges_to_arrays(instance["nodes"], instance["edges"])
+    return instance, sources, targets, weights
+
+
+def test_monte_carlo_pert_is_independent_of_workers():
+    instance, sources, targets, weights = _pert_project(0)
+    estimates = (weights * 0.5, weights, weights * 2.0)
+    runs = [
+        monte_carlo_pert(len(instance["nodes"]), sources, targets, *estimates, num_scenarios=500, seed=7,
+                         max_workers=workers, block_size=100)
+        for workers in (1, 2)
+    ]
+    assert np.array_equal(runs[0]["total_durations"], runs[1]["total_durations"])
+    assert np.array_equal(runs[0]["criticality"], runs[1]["criticality"])
+    assert runs[0]["quantiles"] == runs[1]["quantiles"]
+
+
+@pytest.mark.parametrize("distribution", ["beta", "triangular"])
+def test_monte_carlo_pert_fixed_durations(distribution):
+    instance, sources, targets, weights = _pert_project(1)
+    result = monte_carlo_pert(len(instance["nodes"]), sources, targets, weights, weights, weights, num_scenarios=50,
+                              distribution=distribution, seed=0, max_workers=1)
+    graph = _task_graph(instance)
+    assert np.all(result["total_durations"] == nx.dag_longest_path_length(graph))
+    assert set(np.unique(result["criticality"]).tolist()) <= {0.0, 1.0}
+    # Les tâches d'un plus long chemin sont critiques dans tous les scénarios
+    assert all(result["criticality"][node - 1] == 1 for node in nx.dag_longest_path(graph))
+
+
+@pytest.mark.parametrize("distribution", ["beta", "triangular"])
+def test_sample_durations_stay_in_range(distribution):
+    a, m, b = np.array([1.0, 2.0, 5.0]), np.array([2.0, 2.0, 6.0]), np.array([4.0, 2.0, 10.0])
+    durations = sample_durations(a, m, b, 2000, distribution=distribution, rng=0)
+    assert durations.shape == (2000, 3)
+    assert np.all((durations >= a) & (durations <= b)) and np.all(durations[:, 1] == 2.0)
+    with pytest.raises(ValueError):
+        sample_durations([3.0], [2.0], [4.0], 10)
@@ -0,0 +1,175 @@
+import os
+import random
+from types import MappingProxyType
+import networkx as nx
+import numpy as np
+import pytest
+from algorithms.bellman_ford import bellman_ford_algorithm, johnson_all_pairs
+from algorithms.bellman_ford_engine import NegativeCycleError
+from algorithms.csr import graph_to_csr
+from algorithms.dijkstra import (
+    dijkstra_algorithm, dijkstra_batch, dijkstra_distance_matrix, dijkstra_point_to_point,
+)
+from algorithms.generators import negative_graph_instance
+from algorithms.landmarks import build_landmark_index
+from algorithms.shortest_path_cache import ShortestPathCache, graph_fingerprint
+
+
+def _weighted_graph(n, m, seed, directed=False, weights=(0, 20)):
+    """
+    Graphe aléatoire networkx (n sommets, m arêtes) à poids entiers tirés dans `weights`.
+    """
+    graph = nx.gnm_random_graph(n, m, seed=seed, directed=directed)
+    rng = random.Random(seed)
+    for u, v in graph.edges:
+        graph[u][v]["weight"] = rng.randint(*weights)
+    return graph
+
+
+def _path_weight(graph, path):
+    return sum(graph[u][v]["weight"] for u, v in zip(path, path[1:]))
+
+
+def _check_tree(graph, source, distances, paths, reference):
+    """
+    Distances identiques à la référence, chemins valides de même poids (les ex aequo peuvent différer).
+    """
+    assert distances == reference
+    for target, path in paths.items():
+        assert path[0] == source and path[-1] == target
+        assert _path_weight(graph, path) == distances[target]
+
+
+@pytest.mark.parametrize("directed", [False, True])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_dijkstra_matches_networkx(directed, seed):
+    graph = _weighted_graph(300, 1200, seed, directed=directed)
+    distances, paths = dijkstra_algorithm(graph, 0)
+    _check_tree(graph, 0, distances, paths, nx.single_source_dijkstra_path_length(graph, 0))
+    assert list(distances.values()) == sorted(distances.values())
+
+
+def test_dijkstra_reuses_prebuilt_csr_and_labels():
+    graph = nx.relabel_nodes(_weighted_graph(100, 300, 3), lambda i: f"v{i}")
+    csr = graph_to_csr(graph)
+    assert dijkstra_algorithm(graph, "v0", csr=csr) == dijkstra_algorithm(graph, "v0")
+    assert dijkstra_algorithm(graph, "v0")[0] == nx.single_source_dijkstra_path_length(graph, "v0")
+
+
+def test_dijkstra_rejects_negative_weights():
+    graph = nx.DiGraph()
+    graph.add_weighted_edges_from([(0, 1, 2), (1, 2, -1)])
+    with pytest.raises(ValueError):
+        dijkstra_algorithm(graph, 0)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_dijkstra_batch_matches_single_source(max_workers):
+    graph = _weighted_graph(150, 600, 4, directed=True, weights=(1, 100))
+    sources = [0, 5, 9, 5]
+    matrix = dijkstra_distance_matrix(graph, sources, max_workers=max_workers)
+    for row, source in zip(matrix, sources):
+        reference = nx.single_source_dijkstra_path_length(graph, source)
+        expected = [reference.get(node, np.inf) for node in graph.nodes]
+        np.testing.assert_array_equal(row, expected)
+    assert sorted(source for source, _ in dijkstra_batch(graph, [1, 2], max_workers=max_workers)) == [1, 2]
+
+
+def test_shortest_path_cache_hits_are_read_only():
+    graph = _weighted_graph(100, 300, 6)
+    cache = ShortestPathCache()
+    fingerprint = graph_fingerprint(graph)
+    first = dijkstra_algorithm(graph, 0, cache=cache, fingerprint=fingerprint)
+    second = dijkstra_algorithm(graph, 0, cache=cache)
+    assert second is first
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+    with pytest.raises(TypeError):
+        second[0][0] = 999
+    assert all(isinstance(path, tuple) for path in second[1].values())
+    assert dict(first[0]) == nx.single_source_dijkstra_path_length(graph, 0)
+
+    # Graphe modifié : nouvelle empreinte, donc nouveau calcul
+    graph.add_edge(0, 99, weight=0)
+    assert dijkstra_algorithm(graph, 0, cache=cache)[0][99] == 0
+    assert cache.stats()["misses"] == 2
+
+
+def test_shortest_path_cache_eviction_and_oversized_results():
+    graph = _weighted_graph(50, 150, 7)
+    cache = ShortestPathCache(max_entries=2)
+    for source in (0, 1, 2, 0):
+        dijkstra_algorithm(graph, source, cache=cache)
+    assert cache.stats()["evictions"] == 2 and cache.stats()["entries"] == 2 and cache.stats()["hits"] == 0
+
+    # Trop volumineux pour être gardé : même type de résultat en lecture seule qu'une entrée en cache
+    tiny = ShortestPathCache(max_bytes=1)
+    distances, paths = dijkstra_algorithm(graph, 0, cache=tiny)
+    assert isinstance(distances, MappingProxyType) and isinstance(paths, MappingProxyType)
+    assert all(isinstance(path, tuple) for path in paths.values())
+    assert tiny.stats()["entries"] == 0
+
+
+@pytest.mark.parametrize("method", ["alt", "bidirectional"])
+def test_point_to_point_matches_networkx(method):
+    graph = _weighted_graph(400, 1000, 5, directed=True, weights=(1, 100))
+    index = build_landmark_index(graph, num_landmarks=4, seed=0)
+    rng = np.random.default_rng(0)
+    for source, target in rng.integers(0, 400, size=(30, 2)).tolist():
+        distance, path, _ = dijkstra_point_to_point(graph, source, target, index=index, method=method)
+        try:
+            expected = nx.dijkstra_path_length(graph, source, target)
+        except nx.NetworkXNoPath:
+            assert distance == float("inf")
+            continue
+        assert distance == expected
+        assert path[0] == source and path[-1] == target and _path_weight(graph, path) == expected
+
+
+@pytest.mark.parametrize("seed", [0, 1])
+def test_bellman_ford_matches_networkx(seed):
+    graph = negative_graph_instance(300, 1200, seed)["graph"]
+    distances, paths = bellman_ford_algorithm(graph, 0)
+    _check_tree(graph, 0, distances, paths, nx.single_source_bellman_ford_path_length(graph, 0))
+
+
+def test_bellman_ford_negative_cycle_witness():
+    graph = _weighted_graph(60, 200, 7, directed=True, weights=(1, 10))
+    graph.add_weighted_edges_from([(0, 1, 1), (1, 2, 1), (2, 0, -5)])
+    with pytest.raises(NegativeCycleError) as error:
+        bellman_ford_algorithm(graph, 0)
+    cycle = error.value.cycle
+    arcs = list(zip(cycle, cycle[1:] + cycle[:1]))
+    assert all(graph.has_edge(u, v) for u, v in arcs)
+    assert sum(graph[u][v]["weight"] for u, v in arcs) < 0
+
+
+def test_bellman_ford_cache_is_separate_from_dijkstra():
+    graph = _weighted_graph(100, 300, 6)
+    cache = ShortestPathCache()
+    fingerprint = graph_fingerprint(graph)
+    dijkstra = dijkstra_algorithm(graph, 0, cache=cache, fingerprint=fingerprint)
+    bellman_ford = bellman_ford_algorithm(graph, 0, cache=cache, fingerprint=fingerprint)
+    assert dict(bellman_ford[0]) == dict(dijkstra[0])
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_johnson_matches_networkx(tmp_path, max_workers):
+    graph = negative_graph_instance(80, 300, 2)["graph"]
+    nodes, matrix = johnson_all_pairs(graph, path=str(tmp_path / "all_pairs.npy"), max_workers=max_workers)
+    reference = dict(nx.johnson(graph))
+    for i, source in enumerate(nodes):
+        for j, target in enumerate(nodes):
+            if target in reference[source]:
+                assert matrix[i, j] == pytest.approx(_path_weight(graph, reference[source][target]))
+            else:
+                assert matrix[i, j] == np.inf
+
+
+def test_johnson_temporary_file_is_left_to_the_caller():
+    graph = _weighted_graph(20, 40, 8, directed=True, weights=(1, 100))
+    _, matrix = johnson_all_pairs(graph, max_workers=1)
+    path = matrix.filename
+    assert os.path.exists(path)
+    del matrix
+    os.remove(path)
@@ -0,0 +1,77 @@
+import networkx as nx
+import numpy as np
+import pytest
+from algorithms.boruvka_engine import boruvka_arrays
+from algorithms.generators import random_graph
+from algorithms.kruskal import kruskal_algorithm
+from algorithms.kruskal_engine import kruskal_arrays
+from algorithms.mst_stream import EDGE_DTYPE, streaming_mst
+
+
+def _reference_weight(graph):
+    return nx.minimum_spanning_tree(graph).size(weight="weight")
+
+
+@pytest.mark.parametrize("method", ["arrays", "boruvka"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_kruskal_matches_networkx_and_python(method, seed):
+    # Graphe non connexe et étiquettes non entières : forêt couvrante minimale
+    graph = nx.relabel_nodes(random_graph(300, 600, weight_range=(1, 20), seed=seed), lambda i: f"v{i}")
+    mst, mst_edges, total_weight, edges = kruskal_algorithm(graph, method=method, max_workers=1)
+    python = kruskal_algorithm(graph, method="python")
+    assert total_weight == python[2] == _reference_weight(graph)
+    assert len(mst_edges) == len(python[1]) == graph.number_of_nodes() - nx.number_connected_components(graph)
+    assert nx.is_forest(mst) and set(mst.nodes) == set(graph.nodes)
+    assert all(graph[u][v]["weight"] == w for u, v, w in mst_edges)
+    assert len(list(edges)) == graph.number_of_edges()
+
+
+def test_kruskal_arrays_same_edges_as_python():
+    graph = random_graph(200, 800, weight_range=(1, 5), seed=3)
+    assert kruskal_algorithm(graph)[1] == kruskal_algorithm(graph, method="python")[1]
+
+
+def test_kruskal_arrays_matches_networkx():
+    sources, targets, weights = random_graph(300, 1500, weight_range=(1, 10), seed=4, as_arrays=True)
+    accepted, total_weight = kruskal_arrays(300, sources, targets, weights)
+    graph = nx.Graph()
+    graph.add_nodes_from(range(300))
+    graph.add_weighted_edges_from(zip(sources.tolist(), targets.tolist(), weights.tolist()))
+    assert total_weight == weights[accepted].sum() == _reference_weight(graph)
+    assert len(accepted) == 300 - nx.number_connected_components(graph)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_boruvka_matches_kruskal(max_workers):
+    # Poids peu variés : beaucoup d'ex aequo, départagés par (poids, position) comme dans Kruskal
+    sources, targets, weights = random_graph(500, 2000, weight_range=(1, 5), seed=4, as_arrays=True)
+    kruskal_accepted, kruskal_weight = kruskal_arrays(500, sources, targets, weights)
+    accepted, boruvka_weight = boruvka_arrays(500, sources, targets, weights, max_workers=max_workers, chunk_size=256)
+    assert boruvka_weight == kruskal_weight
+    assert np.array_equal(np.sort(accepted), np.sort(kruskal_accepted))
+
+
+@pytest.mark.parametrize("fan_in", [2, 4, 64])
+def test_streaming_mst_matches_kruskal(tmp_path, fan_in):
+    sources, targets, weights = random_graph(400, 3000, weight_range=(1, 30), seed=5, as_arrays=True)
+    records = np.empty(len(sources), dtype=EDGE_DTYPE)
+    records["u"], records["v"], records["w"] = sources, targets, weights
+    path = tmp_path / "edges.bin"
+    records.tofile(path)
+
+    # 30 séquences : plusieurs passes de fusion pour fan_in = 2 ou 4
+    progress = []
+    u, v, w, total = streaming_mst(str(path), num_nodes=400, chunk_size=100, fan_in=fan_in, tmp_dir=str(tmp_path),
+                                   progress=progress.append)
+    accepted, expected = kruskal_arrays(400, sources, targets, weights)
+    assert total == expected
+    assert np.array_equal(u, sources[accepted]) and np.array_equal(v, targets[accepted])
+    assert any(event["phase"] == "pass" for event in progress) == (fan_in < 30)
+    assert [entry.name for entry in tmp_path.iterdir()] == ["edges.bin"]
+
+
+def test_streaming_mst_text_format(tmp_path):
+    path = tmp_path / "edges.txt"
+    path.write_text("# u v poids\n0 1 4\n1 2 1\n0 2 2\n2 3 7\n")
+    u, v, w, total = streaming_mst(str(path), chunk_size=2)
+    assert total == 10.0 and len(u) == 3
@@ -0,0 +1,160 @@
+import networkx as nx
+import numpy as np
+import pytest
+from algorithms.generators import transport_instance
+from algorithms.moindre_cout import moindre_cout_method
+from algorithms.nord_ouest import nord_ouest_method
+from algorithms.stepping_stone import stepping_stone_method
+from algorithms.transport_engine import (
+    least_cost_method, nord_ouest_batch, sparse_transport, transport_simplex, vogel_method,
+)
+
+SHAPES = [(3, 4), (10, 12), (25, 20)]
+
+
+def _min_cost_flow_cost(supply, demand, rows, cols, costs):
+    """
+    Coût optimal de référence (simplexe réseau de networkx) avec les routes (rows[k], cols[k]).
+    """
+    graph = nx.DiGraph()
+    for i, quantity in enumerate(np.asarray(supply).tolist()):
+        graph.add_node(("offre", i), demand=-quantity)
+    for j, quantity in enumerate(np.asarray(demand).tolist()):
+        graph.add_node(("demande", j), demand=quantity)
+    graph.add_edges_from(
+        (("offre", i), ("demande", j), {"weight": c})
+        for i, j, c in zip(np.asarray(rows).tolist(), np.asarray(cols).tolist(), np.asarray(costs).tolist())
+    )
+    return nx.min_cost_flow_cost(graph)
+
+
+def _optimal_cost(instance):
+    rows, cols = np.indices(instance["costs"].shape)
+    return _min_cost_flow_cost(instance["supply"], instance["demand"], rows.ravel(), cols.ravel(),
+                               instance["costs"].ravel())
+
+
+def _check_feasible(instance, allocation):
+    assert np.all(allocation >= 0)
+    assert np.array_equal(allocation.sum(axis=1), instance["supply"])
+    assert np.array_equal(allocation.sum(axis=0), instance["demand"])
+
+
+@pytest.mark.parametrize("shared_costs", [False, True])
+def test_nord_ouest_batch_matches_method(shared_costs):
+    instances = [transport_instance(6, 8, seed) for seed in range(5)]
+    supply = np.stack([instance["supply"] for instance in instances])
+    demand = np.stack([instance["demand"] for instance in instances])
+    costs = instances[0]["costs"] if shared_costs else np.stack([instance["costs"] for instance in instances])
+    allocations, total_costs = nord_ouest_batch(supply, demand, costs)
+    for k, instance in enumerate(instances):
+        instance_costs = costs if shared_costs else instance["costs"]
+        allocation, total_cost = nord_ouest_method(instance["supply"].copy(), instance["demand"].copy(),
+                                                   instance_costs)
+        assert np.array_equal(allocations[k], allocation) and total_costs[k] == total_cost
+        _check_feasible(instance, allocations[k])
+    # Les entrées ne sont pas modifiées
+    assert np.array_equal(supply[0], instances[0]["supply"])
+
+
+def test_nord_ouest_batch_rejects_unbalanced():
+    with pytest.raises(ValueError):
+        nord_ouest_batch([[10, 5], [4, 4]], [[8, 7], [4, 5]], np.ones((2, 2)))
+
+
+@pytest.mark.parametrize("rows, cols", SHAPES)
+def test_least_cost_matches_python(rows, cols):
+    instance = transport_instance(rows, cols, 0)
+    allocation, total_cost = least_cost_method(instance["supply"], instance["demand"], instance["costs"])
+    expected, expected_cost = moindre_cout_method(instance["supply"].copy(), instance["demand"].copy(),
+                                                  instance["costs"], method="python")
+    assert np.array_equal(allocation, expected) and total_cost == expected_cost
+
+
+@pytest.mark.parametrize("rows, cols", SHAPES)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_vogel_is_feasible_basic_solution(rows, cols, seed):
+    instance = transport_instance(rows, cols, seed)
+    allocation, total_cost = vogel_method(instance["supply"], instance["demand"], instance["costs"])
+    _check_feasible(instance, allocation)
+    assert total_cost == (allocation * instance["costs"]).sum()
+    assert np.count_nonzero(allocation) <= rows + cols - 1
+
+
+@pytest.mark.parametrize("rows, cols", SHAPES)
+@pytest.mark.parametrize("seed", [0, 1])
+def test_transport_simplex_is_optimal(rows, cols, seed):
+    instance = transport_instance(rows, cols, seed)
+    supply, demand, costs = instance["supply"], instance["demand"], instance["costs"]
+    optimum = _optimal_cost(instance)
+
+    allocation, total_cost = transport_simplex(supply, demand, costs)
+    _check_feasible(instance, allocation)
+    assert total_cost == (allocation * costs).sum() == optimum
+
+    # Stepping Stone à partir du Moindre Coût, comme dans l'interface
+    initial, _ = least_cost_method(supply, demand, costs)
+    allocation, total_cost = stepping_stone_method(supply, demand, costs, initial)
+    _check_feasible(instance, allocation)
+    assert total_cost == optimum
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_stepping_stone_modi_improves_on_python(seed):
+    # La version d'origine peut s'arrêter avant l'optimum : son coût borne celui du simplexe
+    instance = transport_instance(4, 5, seed)
+    supply, demand, costs = instance["supply"], instance["demand"], instance["costs"]
+    initial, initial_cost = least_cost_method(supply, demand, costs)
+    _, total_cost = stepping_stone_method(supply, demand, costs, initial)
+    _, python_cost = stepping_stone_method(supply.copy(), demand.copy(), costs, initial.copy(), method="python")
+    assert total_cost == _optimal_cost(instance) <= python_cost <= initial_cost
+
+
+def test_transport_simplex_rejects_bad_inputs():
+    with pytest.raises(ValueError):
+        transport_simplex([10, 5], [4, 4], np.ones((2, 2)))
+    with pytest.raises(ValueError):
+        transport_simplex([4, 4], [4, 4], np.ones((2, 2)), initial_allocation=[[4, 0], [4, 0]])
+
+
+def test_transport_simplex_from_list_allocation():
+    allocation, total_cost = transport_simplex([4, 4], [4, 4], [[1, 2], [2, 1]], initial_allocation=[[0, 4], [4, 0]])
+    assert allocation.tolist() == [[4, 0], [0, 4]] and total_cost == 8
+
+
+def _sparse_routes(instance, seed):
+    """
+    Environ la moitié des routes, plus l'escalier du Nord-Ouest pour que le problème reste réalisable.
+    """
+    rng = np.random.default_rng(seed)
+    allocation, _ = nord_ouest_method(instance["supply"].copy(), instance["demand"].copy(), instance["costs"])
+    mask = (rng.random(instance["costs"].shape) < 0.5) | (allocation > 0)
+    rows, cols = np.nonzero(mask)
+    return rows, cols, instance["costs"][rows, cols]
+
+
+@pytest.mark.parametrize("method", ["simplex", "ssp"])
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_sparse_transport_matches_networkx(method, seed):
+    instance = transport_instance(15, 18, seed)
+    rows, cols, costs = _sparse_routes(instance, seed)
+    flows, total_cost = sparse_transport(instance["supply"], instance["demand"], rows, cols, costs, method=method)
+
+    allocation = np.zeros(instance["costs"].shape, dtype=flows.dtype)
+    allocation[rows, cols] = flows
+    _check_feasible(instance, allocation)
+    assert total_cost == _min_cost_flow_cost(instance["supply"], instance["demand"], rows, cols, costs)
+
+
+@pytest.mark.parametrize("method", ["simplex", "ssp"])
+def test_sparse_transport_rejects_unbalanced_and_infeasible(method):
+    with pytest.raises(ValueError):
+        sparse_transport([5, 4], [4, 4], [0, 1], [0, 1], [1, 1], method=method)
+    # La colonne 1 n'est desservie par aucune route
+    with pytest.raises(ValueError):
+        sparse_transport([5, 5], [5, 5], [0, 1], [0, 0], [1, 1], method=method)
+
+
+def test_sparse_transport_unknown_method():
+    with pytest.raises(ValueError):
+        sparse_transport([4, 4], [4, 4], [0, 1], [0, 1], [1, 1], method="inconnue")